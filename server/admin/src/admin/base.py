@@ -1,10 +1,13 @@
 from typing import Any
 import io
 
-from sqladmin import Admin
+from sqladmin import Admin, ModelView
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData, UploadFile
 from starlette.requests import Request
 
+from trailine_model.cache import bump_course_catalog_version
+
 
 class PatchedAdmin(Admin):
     """
@@ -41,3 +44,19 @@ class PatchedAdmin(Admin):
             else:
                 form_data.append((key, value))
         return FormData(form_data)
+
+
+class CourseCatalogModelView(ModelView):
+    """
+    API 코스 응답(코스 상세, 구간, 난이도/스타일 목록)에 노출되는 모델의 ModelView
+
+    저장/삭제가 커밋된 뒤 API 코스 응답 캐시를 무효화한다. (동기 Redis 호출이므로 스레드풀에서 실행한다)
+    after_model_change / after_model_delete 를 재정의할 경우 마지막에 super()를 호출해야 한다.
+    """
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        await run_in_threadpool(bump_course_catalog_version)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await run_in_threadpool(bump_course_catalog_version)
@@ -8,13 +8,15 @@ from geoalchemy2 import WKTElement
 from geoalchemy2.shape import to_shape
 from sqladmin import ModelView
 from sqladmin.fields import FileField
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import UploadFile
 from starlette.requests import Request
 from starlette.status import HTTP_400_BAD_REQUEST
 from wtforms import StringField, Form
 from wtforms.form import FormMeta
 
-from trailine_model.base import engine
+from trailine_model.base import engine, SessionLocal
+from trailine_model.hooks import on_courses_changed, on_intervals_changed, on_places_changed
 from trailine_model.models.course import (
     CourseIntervalDifficulty,
     CourseInterval,
@@ -28,7 +30,7 @@ from trailine_model.models.course import (
 from trailine_model.models.forecast import KmaMountainForecastArea
 from trailine_model.models.place import Place, PlaceImage
 from trailine_model.models.user import User
-from .base import PatchedAdmin
+from .base import CourseCatalogModelView, PatchedAdmin
 
 from .config import config
 from .constants import DEFAULT_GEO_COLUMN_NAME
@@ -38,6 +40,33 @@ app = FastAPI()
 admin = PatchedAdmin(app, engine)
 
 
+async def refresh_course_derived_data(
+        course_ids: List[int] | None = None,
+        interval_ids: List[int] | None = None,
+        place_ids: List[int] | None = None,
+) -> None:
+    """
+    코스/구간/장소 저장 후 파생 데이터(코스 중간 지점, 구간 LOD, 코스 검색 문서 등)를 별도 트랜잭션으로 갱신합니다.
+
+    동기 DB 세션으로 갱신하므로, 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다.
+    """
+    await run_in_threadpool(_refresh_course_derived_data, course_ids, interval_ids, place_ids)
+
+
+def _refresh_course_derived_data(
+        course_ids: List[int] | None,
+        interval_ids: List[int] | None,
+        place_ids: List[int] | None,
+) -> None:
+    with SessionLocal() as session, session.begin():
+        if course_ids:
+            on_courses_changed(session, course_ids)
+        if interval_ids:
+            on_intervals_changed(session, interval_ids)
+        if place_ids:
+            on_places_changed(session, place_ids)
+
+
 class UserAdmin(ModelView, model=User):
     # 생성 및 수정 폼에서 created_at과 updated_at 필드를 제외합니다.
     form_excluded_columns = [User.created_at, User.updated_at]
@@ -54,7 +83,7 @@ class UserAdmin(ModelView, model=User):
     ]
 
 
-class CourseIntervalDifficultyAdmin(ModelView, model=CourseIntervalDifficulty):
+class CourseIntervalDifficultyAdmin(CourseCatalogModelView, model=CourseIntervalDifficulty):
     form_excluded_columns = [
         CourseIntervalDifficulty.created_at,
         CourseIntervalDifficulty.updated_at
@@ -69,7 +98,7 @@ class CourseIntervalDifficultyAdmin(ModelView, model=CourseIntervalDifficulty):
     column_default_sort = [(CourseIntervalDifficulty.level, False)]
 
 
-class PlaceAdmin(ModelView, model=Place):
+class PlaceAdmin(CourseCatalogModelView, model=Place):
     column_list = [
         Place.id,
         Place.name,
@@ -118,8 +147,16 @@ class PlaceAdmin(ModelView, model=Place):
         point_element = parse_location_to_wkt(lat, lon)
         model.geog = model.geom = point_element
 
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        # 주소가 바뀌면 이 장소를 지나는 코스들의 검색 문서도 바뀐다
+        if not is_created:
+            await refresh_course_derived_data(place_ids=[model.id])
+        await super().after_model_change(data, model, is_created, request)
 
-class PlaceImageAdmin(ModelView, model=PlaceImage):
+
+class PlaceImageAdmin(CourseCatalogModelView, model=PlaceImage):
     # 'url' 필드를 파일 업로드 필드로 대체합니다.
     form_overrides = {"url": FileField}
     # 폼에서 'url' 필드의 라벨을 'Image'로 변경합니다.
@@ -156,7 +193,7 @@ class PlaceImageAdmin(ModelView, model=PlaceImage):
         data["url"] = upload_image_to_s3(image, config.S3.BASE_PLACE_PATH, f"{place_id}/images")
 
 
-class CourseIntervalAdmin(ModelView, model=CourseInterval):
+class CourseIntervalAdmin(CourseCatalogModelView, model=CourseInterval):
     form_excluded_columns = [
         CourseInterval.created_at,
         CourseInterval.updated_at,
@@ -260,8 +297,15 @@ class CourseIntervalAdmin(ModelView, model=CourseInterval):
             # 모델에 저장하지 않을 가상 필드를 data 딕셔너리에서 항상 제거
             data["geom"] = model.geom
 
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        # 구간 라인이 바뀌면 구간 LOD와 이 구간을 포함하는 코스들의 중간 지점도 바뀐다
+        await refresh_course_derived_data(interval_ids=[model.id])
+        await super().after_model_change(data, model, is_created, request)
+
 
-class CourseDifficultyAdmin(ModelView, model=CourseDifficulty):
+class CourseDifficultyAdmin(CourseCatalogModelView, model=CourseDifficulty):
     form_excluded_columns = [
         CourseDifficulty.created_at,
         CourseDifficulty.updated_at,
@@ -276,7 +320,7 @@ class CourseDifficultyAdmin(ModelView, model=CourseDifficulty):
     column_default_sort = [(CourseDifficulty.level, False)]
 
 
-class CourseStyleAdmin(ModelView, model=CourseStyle):
+class CourseStyleAdmin(CourseCatalogModelView, model=CourseStyle):
     form_excluded_columns = [
         CourseStyle.created_at,
         CourseStyle.updated_at,
@@ -289,7 +333,7 @@ class CourseStyleAdmin(ModelView, model=CourseStyle):
     ]
 
 
-class CourseAdmin(ModelView, model=Course):
+class CourseAdmin(CourseCatalogModelView, model=Course):
     form_excluded_columns = [
         Course.created_at,
         Course.updated_at,
@@ -300,8 +344,14 @@ class CourseAdmin(ModelView, model=Course):
         Course.course_difficulty,
     ]
 
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        await refresh_course_derived_data(course_ids=[model.id])
+        await super().after_model_change(data, model, is_created, request)
+
 
-class CourseCourseIntervalAdmin(ModelView, model=CourseCourseInterval):
+class CourseCourseIntervalAdmin(CourseCatalogModelView, model=CourseCourseInterval):
     form_excluded_columns = [
         CourseCourseInterval.created_at,
         CourseCourseInterval.updated_at,
@@ -313,8 +363,19 @@ class CourseCourseIntervalAdmin(ModelView, model=CourseCourseInterval):
         CourseCourseInterval.is_reversed,
     ]
 
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        # 코스 구성(구간 순서/방향)이 바뀌면 코스 파생 데이터를 다시 계산
+        await refresh_course_derived_data(course_ids=[model.course_id])
+        await super().after_model_change(data, model, is_created, request)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await refresh_course_derived_data(course_ids=[model.course_id])
+        await super().after_model_delete(model, request)
+
 
-class CourseImageAdmin(ModelView, model=CourseImage):
+class CourseImageAdmin(CourseCatalogModelView, model=CourseImage):
     form_overrides = {"url": FileField}
     form_args = {
         "url": {
@@ -345,7 +406,7 @@ class CourseImageAdmin(ModelView, model=CourseImage):
         data["url"] = upload_image_to_s3(image, config.S3.BASE_COURSE_PATH, f"{course_id}/images")
 
 
-class CourseIntervalImageAdmin(ModelView, model=CourseIntervalImage):
+class CourseIntervalImageAdmin(CourseCatalogModelView, model=CourseIntervalImage):
     form_overrides = {"url": FileField}
     form_args = {
         "url": {
@@ -0,0 +1,90 @@
+"""
+단기예보 응답 파싱 성능 비교
+
+4일치 단기예보 응답(item 약 1,300개)을 이전 방식(strptime + 항목별 분기 + pydantic 검증)과
+현재 방식(KmaShortForecastAPI._collect_items / _build_items)으로 각각 파싱해 걸린 시간을 비교한다.
+
+server/api $ PYTHONPATH=src python benchmarks/kma_short_forecast.py
+"""
+import collections
+import math
+import timeit
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from trailine_api.common.types import DatagoShortForecastRainCondition, DatagoShortForecastSkyCondition
+from trailine_api.externals.datago import KmaShortForecastAPI
+
+from tests.data.kma_short_forecast import build_short_forecast_items
+
+BASE_DATETIME = datetime(2025, 10, 1, 5, 0)
+END_DATE = date(2025, 10, 5)
+REPEAT = 200
+
+
+class LegacyShortForecastItem(BaseModel):
+    forecast_date: datetime
+    rain_probability: int
+    rain_condition: DatagoShortForecastRainCondition
+    rain_amount: float
+    humidity: int
+    snow_amount: float
+    sky_condition: DatagoShortForecastSkyCondition
+    temperature: int
+    min_temperature: Optional[int] = None
+    max_temperature: Optional[int] = None
+
+
+def parse_legacy(items: List[Dict[str, Any]]) -> List[LegacyShortForecastItem]:
+    raw_items: Dict[datetime, Dict[str, Any]] = collections.defaultdict(dict)
+    for item in items:
+        forecast_date_key = datetime.strptime(f"{item['fcstDate']}{item['fcstTime']}", "%Y%m%d%H%M")
+        if forecast_date_key.date() > END_DATE:
+            break
+
+        category, value = item["category"], item["fcstValue"]
+        raw_items[forecast_date_key]["forecast_date"] = forecast_date_key
+        if category == "POP":
+            raw_items[forecast_date_key]["rain_probability"] = int(value)
+        elif category == "PTY":
+            raw_items[forecast_date_key]["rain_condition"] = DatagoShortForecastRainCondition.from_code(int(value))
+        elif category == "PCP":
+            raw_items[forecast_date_key]["rain_amount"] = KmaShortForecastAPI._parse_precipitation(value)
+        elif category == "REH":
+            raw_items[forecast_date_key]["humidity"] = int(value)
+        elif category == "SNO":
+            raw_items[forecast_date_key]["snow_amount"] = KmaShortForecastAPI._parse_snow(value)
+        elif category == "SKY":
+            raw_items[forecast_date_key]["sky_condition"] = DatagoShortForecastSkyCondition.from_code(int(value))
+        elif category == "TMP":
+            raw_items[forecast_date_key]["temperature"] = int(value)
+        elif category == "TMN":
+            raw_items[forecast_date_key]["min_temperature"] = math.floor(float(value))
+        elif category == "TMX":
+            raw_items[forecast_date_key]["max_temperature"] = math.floor(float(value))
+
+    return [LegacyShortForecastItem(**data) for _, data in sorted(raw_items.items())]
+
+
+def parse_current(items: List[Dict[str, Any]]) -> list:
+    raw_items: Dict = {}
+    KmaShortForecastAPI._collect_items(raw_items, items, END_DATE.strftime("%Y%m%d"))
+    return KmaShortForecastAPI._build_items(raw_items)
+
+
+def main() -> None:
+    items = build_short_forecast_items(BASE_DATETIME, hours=110)
+    assert len(parse_legacy(items)) == len(parse_current(items))
+
+    legacy = min(timeit.repeat(lambda: parse_legacy(items), number=REPEAT, repeat=5)) / REPEAT
+    current = min(timeit.repeat(lambda: parse_current(items), number=REPEAT, repeat=5)) / REPEAT
+
+    print(f"items: {len(items)}")
+    print(f"legacy : {legacy * 1000:.3f} ms")
+    print(f"current: {current * 1000:.3f} ms ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+테스트에 사용될 기상청 단기예보(getVilageFcst) 응답 item 데이터
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+HOURLY_CATEGORIES = ["TMP", "UUU", "VVV", "VEC", "WSD", "SKY", "PTY", "POP", "WAV", "PCP", "REH", "SNO"]
+
+_PRECIPITATIONS = ["강수없음", "1mm 미만", "2.0mm", "50.0mm 이상"]
+_SNOWS = ["적설없음", "0.5cm 미만", "1.0cm"]
+
+
+def build_short_forecast_items(base_datetime: datetime, hours: int) -> List[Dict[str, Any]]:
+    """
+    발표 시각 1시간 뒤부터 hours 시간 동안의 예보 item 리스트를 실제 응답과 같은 순서로 만든다.
+    (시각별 12개 항목 + 06시 TMN, 15시 TMX)
+    """
+    base_date = base_datetime.strftime("%Y%m%d")
+    base_time = base_datetime.strftime("%H%M")
+
+    items: List[Dict[str, Any]] = []
+    for hour in range(hours):
+        forecast_datetime = base_datetime + timedelta(hours=hour + 1)
+        forecast_date = forecast_datetime.strftime("%Y%m%d")
+        forecast_time = forecast_datetime.strftime("%H%M")
+
+        values = {
+            "TMP": str(10 + hour % 7),
+            "SKY": ["1", "3", "4"][hour % 3],
+            "PTY": ["0", "1", "2", "3", "4"][hour % 5],
+            "POP": str(hour * 10 % 100),
+            "PCP": _PRECIPITATIONS[hour % len(_PRECIPITATIONS)],
+            "REH": "55",
+            "SNO": _SNOWS[hour % len(_SNOWS)],
+        }
+        categories = list(HOURLY_CATEGORIES)
+        if forecast_datetime.hour == 6:
+            categories.append("TMN")
+            values["TMN"] = "3.0"
+        if forecast_datetime.hour == 15:
+            categories.append("TMX")
+            values["TMX"] = "18.5"
+
+        for category in categories:
+            items.append({
+                "baseDate": base_date,
+                "baseTime": base_time,
+                "category": category,
+                "fcstDate": forecast_date,
+                "fcstTime": forecast_time,
+                "fcstValue": values.get(category, "1.5"),
+                "nx": 60,
+                "ny": 127,
+            })
+    return items
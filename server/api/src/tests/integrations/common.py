@@ -18,6 +18,7 @@ from tests.factories import (
     CourseDifficultyFactory,
     CourseStyleFactory, CourseImageFactory
 )
+from trailine_model.hooks import refresh_course_search_documents
 
 
 def setup_course_data_no_1():
@@ -61,6 +62,11 @@ def setup_course_data_no_1():
     CourseImageFactory.create(sort_order=1, course_id=course.id)
     CourseImageFactory.create(sort_order=2, course_id=course.id)
 
+    # 어드민/업로드 스크립트처럼 코스 검색 문서를 만든다 (팩토리는 훅을 거치지 않는다)
+    session = CourseFactory._meta.sqlalchemy_session
+    session.flush()
+    refresh_course_search_documents(session, [course.id])
+
     total_length = (
             interval_a_to_b.length_m
             + interval_b_to_c.length_m
@@ -1,11 +1,19 @@
 from typing import Dict
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from starlette.testclient import TestClient
 import pytest
 from httpx import Response
 
+from tests.factories import CourseFactory
 from tests.integrations.common import setup_course_data_no_1
+from trailine_api.common.types import CourseSearchMode
+from trailine_api.config import Config
+from trailine_api.repositories.course_repositories import _build_course_search_query
+from trailine_model.hooks import on_places_changed, refresh_course_search_documents
+from trailine_model.models.course import CourseInterval
+from trailine_model.models.place import Place
 
 
 def _setup_data(session: Session):
@@ -49,3 +57,107 @@ def test_search_course_list(
 
         assert output["courses"][0]["loadAddresses"] == ["경기도 과천시 특정도로명주소-1", "경기도 과천시 특정도로명주소-2"]
         assert output["courses"][0]["roadAddresses"] == ["경기도 과천시 특정지번주소-1", "경기도 과천시 특정지번주소-2"]
+
+
+@pytest.mark.parametrize("word", ["관악", "-1", "-3", "특정도로명주소"])
+def test_search_course_list_same_result_in_like_mode(
+        client: TestClient,
+        dbsession: Session,
+        monkeypatch: pytest.MonkeyPatch,
+        word: str,
+):
+    _setup_data(dbsession)
+
+    trigram = client.get("/api/v1/courses", params={"word": word}).json()
+    monkeypatch.setattr(Config, "COURSE_SEARCH_MODE", CourseSearchMode.LIKE)
+    like = client.get("/api/v1/courses", params={"word": word}).json()
+
+    assert trigram["total"] == like["total"]
+    assert [course["id"] for course in trigram["courses"]] == [course["id"] for course in like["courses"]]
+
+
+def test_search_course_query_uses_trigram_indexes(dbsession: Session):
+    # 테스트 데이터가 적으면 순차 탐색이 더 싸므로, 인덱스를 쓸 수 있는 쿼리인지 보기 위해 순차 탐색을 끈다
+    dbsession.execute(text("SET LOCAL enable_seqscan = off"))
+
+    stmt = _build_course_search_query("관악산", None, None, CourseSearchMode.TRIGRAM)
+    compiled = stmt.compile(dialect=dbsession.bind.dialect, compile_kwargs={"render_postcompile": True})
+    plan = "\n".join(
+        row[0] for row in dbsession.connection().exec_driver_sql(f"EXPLAIN {compiled}", compiled.params)
+    )
+
+    assert "ix_course_search_document_name_trgm" in plan
+    assert "ix_course_search_document_address_text_trgm" in plan
+
+
+def test_search_course_document_follows_place_change(client: TestClient, dbsession: Session):
+    _setup_data(dbsession)
+
+    # 장소 주소가 바뀌면 그 장소를 지나는 코스의 검색 문서도 갱신된다
+    place = dbsession.query(Place).order_by(Place.id).first()
+    place.road_address = "서울특별시 관악구 새도로명주소"
+    dbsession.flush()
+    on_places_changed(dbsession, [place.id])
+    dbsession.commit()
+
+    output = client.get("/api/v1/courses", params={"word": "새도로명주소"}).json()
+
+    assert output["total"] == 1
+    assert "서울특별시 관악구 새도로명주소" in output["courses"][0]["loadAddresses"]
+
+
+def test_search_course_list_with_cursor(client: TestClient, dbsession: Session):
+    _setup_data(dbsession)
+
+    first = client.get("/api/v1/courses", params={"word": "관악", "pageSize": 1}).json()
+    assert len(first["courses"]) == 1
+    assert first["nextCursor"] is None    # 코스가 하나뿐이므로 다음 페이지가 없다
+
+    no_total = client.get("/api/v1/courses", params={"word": "관악", "includeTotal": False}).json()
+    assert no_total["total"] is None
+    assert no_total["totalPages"] is None
+    assert len(no_total["courses"]) == 1
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "eyJmIjoiMCIsImsiOlsxXX0"])
+def test_search_course_list_with_invalid_cursor(client: TestClient, dbsession: Session, cursor: str):
+    _setup_data(dbsession)
+
+    # 형식이 잘못되었거나 다른 검색 조건에서 만든 커서는 거절한다
+    response = client.get("/api/v1/courses", params={"word": "관악", "cursor": cursor})
+
+    assert response.status_code == 400
+    assert "첫 페이지부터 다시 조회" in response.json()["detail"]
+
+
+def test_search_course_list_cursor_crosses_fractional_similarity(
+        client: TestClient,
+        dbsession: Session,
+        monkeypatch: pytest.MonkeyPatch,
+):
+    _setup_data(dbsession)
+    interval = dbsession.query(CourseInterval).order_by(CourseInterval.id).first()
+    courses = [
+        CourseFactory.create(name=f"Gwanak trail {n}", links=[{"interval": interval, "position": 1}])
+        for n in range(5)
+    ]
+    dbsession.flush()
+    refresh_course_search_documents(dbsession, [course.id for course in courses])
+    dbsession.commit()
+
+    # 캐시된 목록이 아닌 DB keyset 조회를 확인한다
+    monkeypatch.setattr(Config, "COURSE_CACHE_ENABLED", False)
+
+    # 오타 검색어는 단어 유사도(소수)로만 일치하고, 다섯 코스의 유사도가 같아 페이지 경계에 동점이 걸친다
+    course_ids, cursor = [], None
+    for _ in range(len(courses) + 1):
+        params = {"word": "Gwanac", "pageSize": 2, "includeTotal": False}
+        if cursor:
+            params["cursor"] = cursor
+        output = client.get("/api/v1/courses", params=params).json()
+        course_ids += [course["id"] for course in output["courses"]]
+        cursor = output["nextCursor"]
+        if cursor is None:
+            break
+
+    assert course_ids == sorted(course.id for course in courses)
@@ -1,11 +1,16 @@
-from typing import Dict
+from typing import Dict, List
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from starlette.testclient import TestClient
 import pytest
 from httpx import Response
 
+from tests.data.course_intervals import POINTS_A_TO_B_DATA, POINTS_A_TO_C_DATA
+from tests.data.places import PLACE_A_DATA
 from tests.integrations.common import setup_course_data_no_1
+from trailine_model.base import async_engine
+from trailine_model.hooks import refresh_interval_lods
 
 
 def _setup_data(session: Session):
@@ -38,3 +43,54 @@ def test_search_course_interval(client: TestClient, dbsession: Session, params:
         assert output_intervals[0]["description"] == "정방향 설명"
         assert output_intervals[1]["description"] == "정방향 설명"
         assert output_intervals[2]["description"] == "역방향 설명"
+
+        # 역방향 구간은 시작/마감 지점이 뒤바뀐다 (A: 1, B: 2, C: 3)
+        assert output_intervals[0]["startPlace"]["id"] == 1
+        assert output_intervals[0]["endPlace"]["id"] == 2
+        assert output_intervals[2]["startPlace"]["id"] == 3
+        assert output_intervals[2]["endPlace"]["id"] == 1
+        assert output_intervals[0]["startPlace"]["lat"] == pytest.approx(PLACE_A_DATA["latitude"])
+        assert output_intervals[0]["startPlace"]["lon"] == pytest.approx(PLACE_A_DATA["longitude"])
+
+        # 경로 좌표는 진행 방향 순서로 내려온다
+        assert output_intervals[0]["points"] == [pytest.approx(p) for p in POINTS_A_TO_B_DATA]
+        assert output_intervals[2]["points"] == [pytest.approx(p) for p in reversed(POINTS_A_TO_C_DATA)]
+
+
+def test_search_course_interval_with_zoom(client: TestClient, dbsession: Session):
+    """줌 레벨을 주면 미리 계산된 단순화 경로(LOD)를 돌려준다"""
+    _setup_data(dbsession)
+    refresh_interval_lods(dbsession)
+    dbsession.commit()
+
+    # when
+    response: Response = client.get("/api/v1/courses/1/intervals", params={"zoom": 10})
+
+    # then
+    assert response.status_code == 200
+    output_intervals = response.json()["intervals"]
+
+    # A -> C 구간은 직선이므로 시작/끝 좌표만 남고, 진행 방향도 유지된다
+    reversed_a_to_c = list(reversed(POINTS_A_TO_C_DATA))
+    assert output_intervals[2]["points"] == [
+        pytest.approx(reversed_a_to_c[0]), pytest.approx(reversed_a_to_c[-1])
+    ]
+
+
+def test_search_course_interval_query_count(client: TestClient, dbsession: Session):
+    """구간 수와 관계없이 고정된 수의 쿼리로 조회해야 한다 (구간 + 이미지 + 난이도)"""
+    _setup_data(dbsession)
+
+    statements: List[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        response: Response = client.get("/api/v1/courses/1/intervals")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", _count)
+
+    assert response.status_code == 200
+    assert len(statements) == 3
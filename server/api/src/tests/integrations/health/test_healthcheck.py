@@ -1,3 +1,9 @@
 def test_healthcheck(client):
     response = client.get("/api/v1/health")
     assert response.status_code == 204
+
+
+def test_cache_stats(client):
+    response = client.get("/api/v1/health/cache")
+    assert response.status_code == 200
+    assert "local" in response.json()
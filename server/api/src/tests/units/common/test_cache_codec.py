@@ -0,0 +1,18 @@
+from trailine_api.common.cache import JsonCacheCodec
+
+
+def test_json_cache_codec_compresses_large_values():
+    codec = JsonCacheCodec(compress_threshold_bytes=64)
+    small = {"name": "관악산"}
+    large = {"points": [{"lat": 37.4471, "lon": 126.9496, "ele": 234}] * 50}
+
+    assert codec.encode(small).startswith(JsonCacheCodec.JSON_TAG)
+    assert codec.encode(large).startswith(JsonCacheCodec.ZLIB_JSON_TAG)
+    assert codec.decode(codec.encode(small)) == small
+    assert codec.decode(codec.encode(large)) == large
+
+
+def test_json_cache_codec_reads_untagged_json():
+    # 코덱 도입 전 json.dumps로 저장된 값
+    assert JsonCacheCodec(compress_threshold_bytes=64).decode('{"a": [1]}'.encode()) == {"a": [1]}
+
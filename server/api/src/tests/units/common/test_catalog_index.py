@@ -0,0 +1,59 @@
+import pytest
+
+from trailine_api.common.catalog_index import CatalogDocument, CatalogIndex
+from trailine_api.common.hangul import decompose_hangul
+
+
+def _document(id: int, name: str, addresses: list[str], difficulty_id: int = 1, style_id: int = 1) -> CatalogDocument[int]:
+    return CatalogDocument(
+        id=id, name=name, addresses=addresses, difficulty_id=difficulty_id, style_id=style_id, payload=id
+    )
+
+
+@pytest.fixture
+def index() -> CatalogIndex[int]:
+    return CatalogIndex([
+        _document(3, "북한산 둘레길", ["서울특별시 강북구 우이동"], difficulty_id=2, style_id=2),
+        _document(1, "관악산 일부 코스", ["경기도 과천시 중앙동"]),
+        _document(2, "삼성산 코스", ["서울특별시 관악구 신림동"], style_id=2),
+    ])
+
+
+def test_decompose_hangul_splits_compound_jamo():
+    assert decompose_hangul("관악") == "ㄱㅗㅏㄴㅇㅏㄱ"
+    assert decompose_hangul("닭") == "ㄷㅏㄹㄱ"
+    assert decompose_hangul("A-1") == "A-1"
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        (None, [1, 2, 3]),
+        ("관악", [1, 2]),      # 코스명 일치가 주소(관악구) 일치보다 먼저
+        ("관아", [1, 2]),      # 입력 중인 마지막 음절
+        ("과처", [1]),         # 주소의 입력 중인 음절 ("과천")
+        ("신림동", [2]),
+        ("코스", [1, 2]),
+        ("없는산", []),
+    ]
+)
+def test_search_matches_name_then_address(index: CatalogIndex[int], word, expected):
+    total, courses = index.search(word, None, None, 10)
+
+    assert total == len(expected)
+    assert [payload for payload, _ in courses] == expected
+
+
+def test_search_filters_and_paginates(index: CatalogIndex[int]):
+    assert index.search(None, [2], None, 10) == (1, [(3, (3,))])
+    assert index.search(None, None, [2], 10) == (2, [(2, (2,)), (3, (3,))])
+    assert index.search(None, [1], [2], 10) == (1, [(2, (2,))])
+    assert index.search(None, None, None, 2, offset=2) == (3, [(3, (3,))])
+
+
+def test_search_continues_after_sort_key(index: CatalogIndex[int]):
+    total, first_page = index.search("관악", None, None, 1)
+    assert (total, first_page) == (2, [(1, (0, 1))])
+
+    assert index.search("관악", None, None, 1, after=first_page[-1][1]) == (2, [(2, (2, 2))])
+    assert index.search(None, None, None, 10, after=(1,)) == (3, [(2, (2,)), (3, (3,))])
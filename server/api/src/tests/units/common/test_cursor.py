@@ -0,0 +1,24 @@
+import pytest
+
+from trailine_api.common.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("scope", (0, -0.5, 12))
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "scope", 3) == (0, -0.5, 12)
+
+
+@pytest.mark.parametrize(
+    "cursor, key_size",
+    [
+        (encode_cursor("other", (0, 1)), 2),    # 다른 검색 조건에서 만든 커서
+        (encode_cursor("scope", (0, 1)), 3),    # 정렬 키 길이가 다름
+        ("not-a-cursor", 1),
+        ("", 1),
+    ]
+)
+def test_decode_cursor_rejects_invalid_cursor(cursor: str, key_size: int):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "scope", key_size)
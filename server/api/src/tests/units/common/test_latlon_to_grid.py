@@ -0,0 +1,19 @@
+import numpy as np
+
+from trailine_api.common.utils import latlon_to_grid, latlon_to_grid_batch
+
+
+def test_latlon_to_grid_known_points():
+    # 기상청 격자 좌표 예시: 서울 중구, 제주시
+    assert latlon_to_grid(37.5635694444444, 126.980008333333) == (60, 127)
+    assert latlon_to_grid(33.4996213, 126.5311884) == (53, 38)
+
+
+def test_latlon_to_grid_batch_matches_scalar():
+    lat = np.array([37.5635694444444, 33.4996213, 35.1795543, 38.1195])
+    lon = np.array([126.980008333333, 126.5311884, 129.0756416, 128.4654])
+
+    nx, ny = latlon_to_grid_batch(lat, lon)
+
+    assert nx.shape == ny.shape == (4,)
+    assert list(zip(nx.tolist(), ny.tolist())) == [latlon_to_grid(a, b) for a, b in zip(lat, lon)]
@@ -0,0 +1,53 @@
+import time
+
+from trailine_api.common.local_cache import LocalLRUCache, LocalTTLCache
+
+
+def test_local_ttl_cache_expires_items():
+    table: LocalTTLCache[int, str] = LocalTTLCache(ttl_seconds=0.05)
+    table.set(1, "a")
+
+    assert table.get(1) == "a"
+
+    time.sleep(0.06)
+    assert table.get(1) is None
+    assert len(table) == 0
+
+
+def test_local_ttl_cache_evicts_oldest_when_full():
+    table: LocalTTLCache[int, str] = LocalTTLCache(ttl_seconds=60, max_size=2)
+    table.set(1, "a")
+    table.set(2, "b")
+    table.set(3, "c")
+
+    assert table.get(1) is None
+    assert table.get(2) == "b"
+    assert table.get(3) == "c"
+
+
+def test_local_lru_cache_evicts_least_recently_used():
+    table: LocalLRUCache[int, str] = LocalLRUCache(default_ttl_seconds=60, max_size=2)
+    table.set(1, "a")
+    table.set(2, "b")
+    table.get(1)
+    table.set(3, "c")
+
+    assert table.get(1) == "a"
+    assert table.get(2) is None
+    assert table.stats()["evictions"] == 1
+
+
+def test_local_lru_cache_respects_byte_budget_and_ttl():
+    table: LocalLRUCache[str, str] = LocalLRUCache(default_ttl_seconds=60, max_bytes=10)
+    table.set("a", "a", size=6)
+    table.set("b", "b", size=6)
+    table.set("huge", "huge", size=11)
+
+    assert table.get("a") is None
+    assert table.get("huge") is None
+    assert table.stats()["bytes"] == 6
+
+    table.set("short", "s", size=1, ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert table.get("short") is None
+    assert table.stats()["expirations"] == 1
@@ -0,0 +1,130 @@
+import asyncio
+import fnmatch
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import pytest
+
+from trailine_api.common import cache as cache_module
+from trailine_api.common.cache import RedisCache
+from trailine_api.common.local_cache import LocalLRUCache
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedisClient", transaction: bool) -> None:
+        self._client = client
+        self.transaction = transaction
+        self._commands: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def mget(self, keys: List[str]) -> None:
+        self._commands.append(("mget", (keys,), {}))
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self._commands.append(("set", (key, value), {"ex": ex}))
+
+    def unlink(self, *keys: str) -> None:
+        self._commands.append(("unlink", keys, {}))
+
+    async def execute(self) -> List[Any]:
+        self._client.pipelines.append((self.transaction, [name for name, _, _ in self._commands]))
+        return [getattr(self._client, f"_{name}")(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+class FakeRedisClient:
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+        self.ttls: Dict[str, Optional[int]] = {}
+        self.pipelines: List[Tuple[bool, List[str]]] = []
+        self.published: List[Tuple[str, str]] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self, transaction)
+
+    async def scan_iter(self, match: str, count: int) -> AsyncIterator[bytes]:
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key.encode()
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    def _mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.store.get(key) for key in keys]
+
+    def _set(self, key: str, value: bytes, ex: Optional[int] = None) -> bool:
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def _unlink(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+
+def _build_cache(local_cache: Optional[LocalLRUCache[str, Any]] = None) -> Tuple[RedisCache, FakeRedisClient]:
+    client = FakeRedisClient()
+    redis_cache = RedisCache(local_cache=local_cache)
+    redis_cache._client = client  # type: ignore[assignment]
+    return redis_cache, client
+
+
+def test_mget_json_returns_values_in_key_order_with_one_pipeline(monkeypatch):
+    monkeypatch.setattr(cache_module, "BATCH_SIZE", 2)
+    redis_cache, client = _build_cache()
+
+    asyncio.run(redis_cache.mset_json({"a": {"v": 1}, "c": [3], "d": {"v": 4}}, ttl_seconds=60))
+    client.pipelines.clear()
+
+    values = asyncio.run(redis_cache.mget_json(["a", "b", "c", "d"]))
+
+    assert values == [{"v": 1}, None, [3], {"v": 4}]
+    assert client.pipelines == [(False, ["mget", "mget"])]
+
+
+def test_mget_json_skips_keys_in_local_cache():
+    local_cache: LocalLRUCache[str, Any] = LocalLRUCache(default_ttl_seconds=60, max_size=10, max_bytes=10_000)
+    redis_cache, client = _build_cache(local_cache)
+    local_cache.set("a", {"v": "local"}, size=1)
+    client._set("b", b'J{"v":"redis"}')
+
+    values = asyncio.run(redis_cache.mget_json(["a", "b"]))
+
+    assert values == [{"v": "local"}, {"v": "redis"}]
+    assert client.pipelines == [(False, ["mget"])]
+    assert local_cache.get("b") == {"v": "redis"}
+
+
+def test_mset_json_applies_per_key_ttl():
+    redis_cache, client = _build_cache()
+
+    asyncio.run(redis_cache.mset_json({"a": {"v": 1}, "b": {"v": 2}}, ttl_seconds={"a": 10, "b": 20}))
+
+    assert client.ttls == {"a": 10, "b": 20}
+    assert client.pipelines == [(False, ["set", "set"])]
+
+
+def test_mset_json_rejects_key_without_ttl():
+    redis_cache, client = _build_cache()
+
+    with pytest.raises(ValueError):
+        asyncio.run(redis_cache.mset_json({"a": {"v": 1}, "b": {"v": 2}}, ttl_seconds={"a": 10}))
+
+    assert client.store == {}
+
+
+def test_delete_pattern_unlinks_matching_keys_in_batches(monkeypatch):
+    monkeypatch.setattr(cache_module, "BATCH_SIZE", 2)
+    redis_cache, client = _build_cache()
+    for key in ("course:response:1", "course:response:2", "course:response:3", "weather:short:1"):
+        client._set(key, b"J{}")
+
+    deleted = asyncio.run(redis_cache.delete_pattern("course:response:*"))
+
+    assert deleted == 3
+    assert list(client.store) == ["weather:short:1"]
+    assert client.pipelines == [(False, ["unlink"]), (False, ["unlink"])]
@@ -0,0 +1,41 @@
+import asyncio
+
+from trailine_api.common.async_utils import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(single_flight.do("key", loader) for _ in range(10)))
+
+    results = asyncio.run(run())
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert single_flight.inflight_count() == 0
+
+
+def test_single_flight_propagates_exception_to_all_waiters():
+    single_flight = SingleFlight()
+
+    async def loader() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(single_flight.do("key", loader) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert single_flight.inflight_count() == 0
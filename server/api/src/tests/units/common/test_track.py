@@ -0,0 +1,38 @@
+from trailine_api.common.track import delta_encode, encode_polyline, lod_level_for_zoom
+
+# Google Encoded Polyline 문서의 예시 좌표 (위도, 경도, 해발고도 배열)
+LAT = [38.5, 40.7, 43.252]
+LON = [-120.2, -120.95, -126.453]
+ELE = [0, 0, 0]
+
+
+def test_encode_polyline_matches_google_algorithm():
+    # 해발고도 delta가 0이면 좌표마다 "?"(0)가 하나씩 붙은 Google 예시 문자열과 같아야 한다
+    assert encode_polyline(LAT, LON, ELE) == "_p~iF~ps|U?_ulLnnqC?_mqNvxq`@?"
+
+
+def test_encode_polyline_with_elevation():
+    # ele: 100 -> -100 (0.1m 단위), None은 0으로 취급
+    assert encode_polyline([0, 0], [0, 0], [10.0, None]) == "??gE??fE"
+
+
+def test_delta_encode():
+    lat = [37.44713775, 37.44712866]
+    lon = [126.94967528, 126.94966790]
+    ele = [234, 233.5]
+
+    assert delta_encode(lat, lon, ele) == {
+        "lat": [3744714, -1],
+        "lon": [12694968, -1],
+        "ele": [2340, -5],
+    }
+
+
+def test_lod_level_for_zoom():
+    assert lod_level_for_zoom(None) == 0
+    assert lod_level_for_zoom(18) == 0
+    assert lod_level_for_zoom(16) == 0
+    assert lod_level_for_zoom(15) == 1
+    assert lod_level_for_zoom(12) == 2
+    assert lod_level_for_zoom(11) == 3
+    assert lod_level_for_zoom(0) == 3
@@ -0,0 +1,33 @@
+import pytest
+
+from trailine_api.common.types import (
+    DatagoMiddleForecastSkyCondition,
+    DatagoShortForecastRainCondition,
+    DatagoShortForecastSkyCondition,
+)
+
+
+def test_short_forecast_codes():
+    assert DatagoShortForecastRainCondition.from_code(3) == DatagoShortForecastRainCondition.SNOW
+    assert DatagoShortForecastRainCondition.from_code("3") == DatagoShortForecastRainCondition.SNOW
+    assert DatagoShortForecastSkyCondition.from_codes(["1", "4", 3]) == [
+        DatagoShortForecastSkyCondition.CLEAR,
+        DatagoShortForecastSkyCondition.OVERCAST,
+        DatagoShortForecastSkyCondition.MOSTLY_CLOUDY,
+    ]
+
+    with pytest.raises(ValueError):
+        DatagoShortForecastSkyCondition.from_code(2)
+    with pytest.raises(ValueError):
+        DatagoShortForecastRainCondition.from_codes(["0", "9"])
+
+
+def test_middle_forecast_korean():
+    assert DatagoMiddleForecastSkyCondition.from_korean("흐리고 비") == DatagoMiddleForecastSkyCondition.OVERCAST_RAIN
+    assert DatagoMiddleForecastSkyCondition.from_koreans(["맑음", "구름많음"]) == [
+        DatagoMiddleForecastSkyCondition.CLEAR,
+        DatagoMiddleForecastSkyCondition.MOSTLY_CLOUDY,
+    ]
+
+    with pytest.raises(ValueError):
+        DatagoMiddleForecastSkyCondition.from_korean("황사")
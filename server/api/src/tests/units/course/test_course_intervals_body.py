@@ -0,0 +1,75 @@
+import asyncio
+import contextlib
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from trailine_api.common.types import TrackFormat
+from trailine_api.config import Config
+from trailine_api.schemas.course import GettingCourseIntervalResponseSchema
+from trailine_api.services import course_services
+from trailine_api.services.course_services import CourseService
+
+POINTS_JSON = '[{"lat":37.5,"lon":126.9,"ele":234},{"lat":37.6,"lon":127,"ele":null}]'
+
+
+def _place(place_id: int) -> dict:
+    return dict(id=place_id, name=f"장소 {place_id}", land_address=None, road_address=None, lat=37.5, lon=126.9, ele=None)
+
+
+class StubCourseRepository:
+    async def get_intervals(self, session, course_id, lod_level, track_format):
+        interval = SimpleNamespace(
+            name="구간", description_ab="정방향 설명", description_ba="역방향 설명",
+            duration_ab_minutes=10, duration_ba_minutes=12, length_m=1234, images=[],
+            difficulty=SimpleNamespace(id=1, code="easy", name="쉬움", level=1),
+        )
+        return [{
+            "interval": interval,
+            "is_reversed": False,
+            "points_json": POINTS_JSON if track_format == TrackFormat.POINTS else None,
+            "coordinates": None if track_format == TrackFormat.POINTS else ([37.5, 37.6], [126.9, 127.0], [234.0, 0.0]),
+            "start_place": _place(1),
+            "end_place": _place(2),
+        }]
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> CourseService:
+    @contextlib.asynccontextmanager
+    async def session_scope():
+        yield None
+
+    monkeypatch.setattr(course_services, "async_session_scope", session_scope)
+    monkeypatch.setattr(Config, "COURSE_CACHE_ENABLED", False)
+    return CourseService(None, StubCourseRepository(), None, None, None, None)  # type: ignore[arg-type]
+
+
+def test_course_intervals_body_splices_points_json(service: CourseService):
+    body = asyncio.run(service.get_course_intervals_body(1))
+
+    # DB가 만든 좌표 JSON 텍스트를 그대로 담으면서도 응답 스키마를 만족한다
+    response = GettingCourseIntervalResponseSchema.model_validate_json(body)
+    assert response.interval_count == 1
+    assert json.loads(body)["intervals"][0]["points"] == json.loads(POINTS_JSON)
+    assert response.intervals[0].description == "정방향 설명"
+    assert response.intervals[0].track is None
+
+
+def test_course_intervals_body_with_encoded_track(service: CourseService):
+    body = asyncio.run(service.get_course_intervals_body(1, TrackFormat.DELTA))
+
+    interval = json.loads(body)["intervals"][0]
+    assert interval["points"] is None
+    assert interval["track"]["count"] == 2
+    assert interval["track"]["lat"] == [3750000, 10000]
+
+
+def test_course_intervals_schema_keeps_points(service: CourseService):
+    intervals = asyncio.run(service.get_course_intervals(1))
+
+    assert intervals is not None
+    assert [(point.lat, point.lon, point.ele) for point in intervals[0].points or []] == [
+        (37.5, 126.9, 234), (37.6, 127, None)
+    ]
@@ -0,0 +1,148 @@
+import asyncio
+import contextlib
+import json
+from typing import Dict, List, Optional
+
+import pytest
+
+from trailine_api.common.cache import RedisCache
+from trailine_api.common.catalog_index import CatalogDocument, CatalogIndex, CatalogIndexHolder
+from trailine_api.common.cursor import InvalidCursorError
+from trailine_api.config import Config
+from trailine_api.schemas.course import CourseStyleSchema
+from trailine_api.services import course_services
+from trailine_api.services.course_services import CourseService
+from trailine_model.cache import COURSE_CATALOG_VERSION_KEY
+
+
+class InMemoryCache(RedisCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.store: Dict[str, bytes] = {}
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str | bytes, ttl_seconds: Optional[int] = None) -> bool:
+        self.store[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+
+class StubCourseService(CourseService):
+    def __init__(self, cache: RedisCache) -> None:
+        super().__init__(cache, None, None, None, None, None)  # type: ignore[arg-type]
+        self.load_count = 0
+
+    async def get_course_style_list(self) -> List[CourseStyleSchema]:
+        self.load_count += 1
+        return [CourseStyleSchema(id=1, code="loop", name=f"순환형 {self.load_count}")]
+
+
+@pytest.fixture(autouse=True)
+def _enable_course_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Config, "REDIS_URL", "redis://cache")
+    monkeypatch.setattr(Config, "COURSE_CACHE_ENABLED", True)
+
+
+def test_course_response_cache_reads_through_until_version_bump():
+    cache = InMemoryCache()
+    service = StubCourseService(cache)
+
+    first = asyncio.run(service.get_course_style_list_body())
+    second = asyncio.run(service.get_course_style_list_body())
+
+    # 두 번째 요청은 캐시에서 응답한다
+    assert service.load_count == 1
+    assert second == first
+
+    # 어드민이 카탈로그 버전을 올리면 새로 조회한다
+    cache.store[COURSE_CATALOG_VERSION_KEY] = b"1"
+    third = asyncio.run(service.get_course_style_list_body())
+
+    assert service.load_count == 2
+    assert json.loads(third)[0]["name"] == "순환형 2"
+
+
+def test_course_response_cache_is_bypassed_without_redis(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Config, "REDIS_URL", None)
+    cache = InMemoryCache()
+    service = StubCourseService(cache)
+
+    asyncio.run(service.get_course_style_list_body())
+    asyncio.run(service.get_course_style_list_body())
+
+    assert service.load_count == 2
+    assert cache.store == {}
+
+
+class StubCourseRepository:
+    def __init__(self, course_ids: List[int]) -> None:
+        self.course_ids = course_ids
+        self.search_count = 0
+
+    async def get_course_ids_by_search(self, session, word, difficulties, course_styles, limit, offset, after, search_mode):
+        self.search_count += 1
+        course_ids = [course_id for course_id in self.course_ids if after is None or (course_id,) > tuple(after)]
+        return [(course_id, (course_id,)) for course_id in course_ids[offset:offset + limit]]
+
+    async def get_course_list_information(self, session, course_ids):
+        return [_course_row(course_id) for course_id in course_ids]
+
+
+def _course_row(course_id: int) -> Dict:
+    return dict(
+        id=course_id, name=f"코스 {course_id}", land_addresses=[], road_addresses=[],
+        difficulty_id=1, difficulty_level=1, difficulty_code="easy", difficulty_name="쉬움",
+        course_style_id=1, course_style_label="loop", course_style_name="순환형",
+    )
+
+
+@pytest.fixture
+def _no_db_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    @contextlib.asynccontextmanager
+    async def session_scope():
+        yield None
+
+    monkeypatch.setattr(course_services, "async_session_scope", session_scope)
+
+
+@pytest.mark.usefixtures("_no_db_session")
+def test_course_search_pages_are_sliced_from_cached_keys():
+    repository = StubCourseRepository(list(range(1, 8)))
+    service = CourseService(InMemoryCache(), repository, None, None, None, None)  # type: ignore[arg-type]
+
+    # 필터 순서/중복이 달라도 같은 검색 조건이다
+    total, first_page, cursor = asyncio.run(service.get_courses(None, [2, 1, 1], None, 1, 3))
+    total, second_page, _ = asyncio.run(service.get_courses(None, [1, 2], None, 1, 3, cursor))
+    _, last_page, last_cursor = asyncio.run(service.get_courses(None, [1, 2], None, 3, 3))
+
+    # 첫 요청에서만 검색하고, 이후 페이지는 캐시된 목록을 잘라 응답한다
+    assert repository.search_count == 1
+    assert total == 7
+    assert [course.id for course in first_page + second_page + last_page] == [1, 2, 3, 4, 5, 6, 7]
+    assert last_cursor is None
+
+
+@pytest.mark.usefixtures("_no_db_session")
+def test_course_search_cursor_from_index_requires_restart_on_db_fallback(monkeypatch: pytest.MonkeyPatch):
+    holder: CatalogIndexHolder = CatalogIndexHolder(version_check_interval_seconds=3600)
+    holder.replace(
+        CatalogIndex(
+            CatalogDocument(id=course_id, name=f"코스 {course_id}", addresses=[], difficulty_id=1, style_id=1, payload=None)
+            for course_id in range(1, 8)
+        ),
+        "0",
+    )
+    service = CourseService(InMemoryCache(), StubCourseRepository(list(range(1, 8))), None, None, None, holder)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Config, "COURSE_INDEX_ENABLED", True)
+    _, _, cursor = asyncio.run(service.get_courses(None, None, None, 1, 3))
+    assert cursor is not None
+
+    # 인덱스를 쓸 수 없어 DB 검색으로 넘어가면 인덱스 커서는 거절되고, 첫 페이지부터 다시 조회해야 한다
+    monkeypatch.setattr(Config, "COURSE_INDEX_ENABLED", False)
+    with pytest.raises(InvalidCursorError):
+        asyncio.run(service.get_courses(None, None, None, 1, 3, cursor))
+
+    _, courses, _ = asyncio.run(service.get_courses(None, None, None, 1, 3))
+    assert [course.id for course in courses] == [1, 2, 3]
@@ -0,0 +1,38 @@
+import pytest
+
+from trailine_api.common.types import DatagoMiddleForecastSkyCondition
+from trailine_api.externals.datago import KmaMidLandForecastAPI
+
+
+def _build_mid_land_item() -> dict:
+    item: dict = {"regId": "11B00000"}
+    for day in range(5, 8):
+        item[f"rnSt{day}Am"] = day * 10
+        item[f"rnSt{day}Pm"] = day * 10 + 1
+        item[f"wf{day}Am"] = "맑음"
+        item[f"wf{day}Pm"] = "흐리고 비"
+    for day in range(8, 11):
+        item[f"rnSt{day}"] = day * 10
+        item[f"wf{day}"] = "구름많음"
+    return item
+
+
+def test_parse_items_maps_am_pm_and_daily_columns():
+    results = KmaMidLandForecastAPI._parse_items(_build_mid_land_item())
+
+    assert [(r.rain_probability_am, r.rain_probability_pm) for r in results] == [
+        (50, 51), (60, 61), (70, 71), (80, 80), (90, 90), (100, 100),
+    ]
+    assert [(r.sky_condition_am, r.sky_condition_pm) for r in results] == [
+        (DatagoMiddleForecastSkyCondition.CLEAR, DatagoMiddleForecastSkyCondition.OVERCAST_RAIN),
+    ] * 3 + [
+        (DatagoMiddleForecastSkyCondition.MOSTLY_CLOUDY, DatagoMiddleForecastSkyCondition.MOSTLY_CLOUDY),
+    ] * 3
+
+
+def test_parse_items_rejects_unknown_sky_condition():
+    item = _build_mid_land_item()
+    item["wf9"] = "황사"
+
+    with pytest.raises(ValueError):
+        KmaMidLandForecastAPI._parse_items(item)
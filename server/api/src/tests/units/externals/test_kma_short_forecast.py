@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from trailine_api.common.types import DatagoShortForecastRainCondition, DatagoShortForecastSkyCondition
+from trailine_api.externals.datago import KmaShortForecastAPI
+
+from tests.data.kma_short_forecast import build_short_forecast_items
+
+
+def test_compute_num_of_rows_covers_until_next_day():
+    base_datetime = datetime(2025, 10, 1, 5, 0)
+    end_date = "20251004"
+    items = build_short_forecast_items(base_datetime, hours=110)
+
+    num_of_rows = KmaShortForecastAPI._compute_num_of_rows("20251001", "0500", end_date)
+
+    # end_date까지의 item 전부 + 다음 날 0시의 item까지 한 페이지에 들어와야 한다
+    in_range = [item for item in items if item["fcstDate"] <= end_date]
+    assert num_of_rows == len(in_range) + KmaShortForecastAPI._HOURLY_CATEGORY_COUNT
+    assert items[num_of_rows - 1]["fcstDate"] > end_date
+
+
+def test_collect_items_stops_after_end_date():
+    items = build_short_forecast_items(datetime(2025, 10, 1, 5, 0), hours=110)
+
+    raw_items: dict = {}
+    completed = not KmaShortForecastAPI._collect_items(raw_items, items, "20251002")
+
+    assert completed
+    assert min(raw_items) == ("20251001", "0600")
+    assert max(raw_items) == ("20251002", "2300")
+
+
+def test_build_items():
+    base_datetime = datetime(2025, 10, 1, 5, 0)
+    items = build_short_forecast_items(base_datetime, hours=24)
+
+    raw_items: dict = {}
+    KmaShortForecastAPI._collect_items(raw_items, items, "20251001")
+    results = KmaShortForecastAPI._build_items(raw_items)
+
+    assert [result.forecast_date for result in results] == [
+        base_datetime + timedelta(hours=hour + 1) for hour in range(18)
+    ]
+
+    first = results[0]
+    assert first.min_temperature == 3
+    assert first.max_temperature is None
+    assert first.temperature == 10
+    assert first.rain_condition == DatagoShortForecastRainCondition.NONE
+    assert first.sky_condition == DatagoShortForecastSkyCondition.CLEAR
+    assert first.rain_amount == 0.0
+    assert first.snow_amount == 0.0
+
+    assert results[9].max_temperature == 18
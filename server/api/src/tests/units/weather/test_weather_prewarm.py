@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from trailine_api.common.cache import RedisCache
+from trailine_api.tasks.weather_prewarm import (
+    MID_SLOT_TTL_SECONDS,
+    SHORT_SLOT_TTL_SECONDS,
+    SLOT_CLAIM_TTL_SECONDS,
+    WeatherPrewarmScheduler,
+)
+
+SHORT_PUBLISHED_AT = datetime(2026, 10, 18, 5, 0)
+MID_PUBLISHED_AT = datetime(2026, 10, 18, 6, 0)
+SHORT_SLOT_KEY = "lock:weather:prewarm:short:202610180500"
+MID_SLOT_KEY = "lock:weather:prewarm:mid:202610180600"
+
+
+class InMemoryLockCache(RedisCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.store: Dict[str, bytes] = {}
+        self.ttls: Dict[str, Optional[int]] = {}
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str | bytes, ttl_seconds: Optional[int] = None) -> bool:
+        self.store[key] = value.encode() if isinstance(value, str) else value
+        self.ttls[key] = ttl_seconds
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def acquire_lock(self, key: str, ttl_seconds: int = 30) -> Optional[str]:
+        if key in self.store:
+            return None
+        token = f"token-{len(self.ttls)}"
+        await self.set(key, token, ttl_seconds=ttl_seconds)
+        return token
+
+
+class StubPublishedAtAPI:
+    def __init__(self, published_at: datetime) -> None:
+        self.published_at = published_at
+
+    def get_published_at(self) -> datetime:
+        return self.published_at
+
+
+class StubWeatherService:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, object]] = []
+        self.fail_targets = False
+        self.failing_kinds: Set[str] = set()
+
+    async def get_forecast_targets(self) -> Tuple[List[Tuple[int, int]], List[str], List[str]]:
+        if self.fail_targets:
+            raise RuntimeError("db down")
+        return [(60, 127), (61, 128)], ["11B00000"], ["11B10101"]
+
+    async def warm_short_forecast(self, nx: int, ny: int) -> None:
+        await self._warm("short", (nx, ny))
+
+    async def warm_mid_land_forecast(self, status_code: str) -> None:
+        await self._warm("mid", status_code)
+
+    async def warm_mid_land_temperature(self, temp_code: str) -> None:
+        await self._warm("mid-temp", temp_code)
+
+    async def _warm(self, kind: str, target: object) -> None:
+        if kind.split("-")[0] in self.failing_kinds:
+            raise RuntimeError("upstream down")
+        self.calls.append((kind, target))
+
+
+def _build_scheduler(
+        cache: RedisCache, weather_service: StubWeatherService
+) -> Tuple[WeatherPrewarmScheduler, StubPublishedAtAPI, StubPublishedAtAPI]:
+    short_api, mid_api = StubPublishedAtAPI(SHORT_PUBLISHED_AT), StubPublishedAtAPI(MID_PUBLISHED_AT)
+    scheduler = WeatherPrewarmScheduler(
+        weather_service,  # type: ignore[arg-type]
+        cache,
+        short_api,  # type: ignore[arg-type]
+        mid_api,  # type: ignore[arg-type]
+        concurrency=2,
+        rate_per_second=1000,
+        poll_interval_seconds=30,
+    )
+    return scheduler, short_api, mid_api
+
+
+def test_prewarm_claims_slot_and_extends_it_after_success():
+    cache, weather_service = InMemoryLockCache(), StubWeatherService()
+    scheduler, _, _ = _build_scheduler(cache, weather_service)
+
+    asyncio.run(scheduler.run_once())
+
+    assert sorted(weather_service.calls, key=str) == sorted([
+        ("short", (60, 127)), ("short", (61, 128)), ("mid", "11B00000"), ("mid-temp", "11B10101"),
+    ], key=str)
+    assert cache.ttls[SHORT_SLOT_KEY] == SHORT_SLOT_TTL_SECONDS
+    assert cache.ttls[MID_SLOT_KEY] == MID_SLOT_TTL_SECONDS
+
+
+def test_prewarm_skips_same_slot_on_this_and_other_workers():
+    cache, weather_service = InMemoryLockCache(), StubWeatherService()
+    scheduler, short_api, _ = _build_scheduler(cache, weather_service)
+    other_worker, _, _ = _build_scheduler(cache, weather_service)
+
+    asyncio.run(scheduler.run_once())
+    weather_service.calls.clear()
+
+    asyncio.run(scheduler.run_once())
+    asyncio.run(other_worker.run_once())
+    assert weather_service.calls == []
+
+    # 새 단기예보 발표분만 다시 예열한다
+    short_api.published_at = datetime(2026, 10, 18, 8, 0)
+    asyncio.run(scheduler.run_once())
+    assert sorted(kind for kind, _ in weather_service.calls) == ["short", "short"]
+
+
+def test_prewarm_releases_slot_and_retries_when_targets_fail():
+    cache, weather_service = InMemoryLockCache(), StubWeatherService()
+    scheduler, _, _ = _build_scheduler(cache, weather_service)
+    other_worker, _, _ = _build_scheduler(cache, weather_service)
+
+    weather_service.fail_targets = True
+    with pytest.raises(RuntimeError):
+        asyncio.run(scheduler.run_once())
+    assert SHORT_SLOT_KEY not in cache.store
+    assert MID_SLOT_KEY not in cache.store
+
+    # 풀린 발표분은 다음 폴링에서 어느 워커든 다시 예열한다
+    weather_service.fail_targets = False
+    asyncio.run(other_worker.run_once())
+    assert len(weather_service.calls) == 4
+
+
+def test_prewarm_retries_only_the_kind_whose_jobs_all_failed():
+    cache, weather_service = InMemoryLockCache(), StubWeatherService()
+    scheduler, _, _ = _build_scheduler(cache, weather_service)
+
+    weather_service.failing_kinds = {"short"}
+    asyncio.run(scheduler.run_once())
+    assert SHORT_SLOT_KEY not in cache.store
+    assert cache.ttls[MID_SLOT_KEY] == MID_SLOT_TTL_SECONDS
+
+    weather_service.failing_kinds = set()
+    weather_service.calls.clear()
+    asyncio.run(scheduler.run_once())
+    assert sorted(kind for kind, _ in weather_service.calls) == ["short", "short"]
+    assert cache.ttls[SHORT_SLOT_KEY] == SHORT_SLOT_TTL_SECONDS
+
+
+def test_prewarm_claim_ttl_is_short_while_warming():
+    cache, weather_service = InMemoryLockCache(), StubWeatherService()
+    scheduler, _, _ = _build_scheduler(cache, weather_service)
+    claim_ttls: List[Optional[int]] = []
+
+    async def record_claim_ttl(nx: int, ny: int) -> None:
+        claim_ttls.append(cache.ttls[SHORT_SLOT_KEY])
+
+    weather_service.warm_short_forecast = record_claim_ttl  # type: ignore[method-assign]
+    asyncio.run(scheduler.run_once())
+
+    assert claim_ttls == [SLOT_CLAIM_TTL_SECONDS, SLOT_CLAIM_TTL_SECONDS]
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from trailine_api.common.cache import RedisCache
+from trailine_api.common.types import (
+    DatagoMiddleForecastSkyCondition,
+    DatagoShortForecastRainCondition,
+    DatagoShortForecastSkyCondition,
+)
+from trailine_api.schemas.weather import MidLandForecastItem, MidLandTemperatureItem, ShortForecastItem
+from trailine_api.services.weather_services import WeatherService
+
+CURRENT_PUBLISHED_AT = datetime(2026, 10, 18, 6, 0)
+
+
+class InMemoryCache(RedisCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.store: Dict[str, bytes] = {}
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str | bytes, ttl_seconds: Optional[int] = None) -> bool:
+        self.store[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+
+class StubPublishedAtAPI:
+    def get_published_at(self) -> datetime:
+        return CURRENT_PUBLISHED_AT
+
+
+class StubWeatherService(WeatherService):
+    """
+    육상예보는 현재 발표분, 기온예보는 하루 전 발표분(stale)을 돌려준다.
+    각 항목의 값은 발표분 안에서의 인덱스다.
+    """
+    def __init__(self, cache: RedisCache) -> None:
+        super().__init__(
+            cache, None, None, None, None, StubPublishedAtAPI(), StubPublishedAtAPI(), StubPublishedAtAPI()  # type: ignore[arg-type]
+        )
+
+    async def _get_mid_forecast_items(
+            self, status_code: str, allow_stale: bool = True
+    ) -> Tuple[datetime, List[MidLandForecastItem]]:
+        return CURRENT_PUBLISHED_AT, [
+            MidLandForecastItem(
+                rain_probability_am=i,
+                rain_probability_pm=0,
+                sky_condition_am=DatagoMiddleForecastSkyCondition.CLEAR,
+                sky_condition_pm=DatagoMiddleForecastSkyCondition.CLEAR,
+            )
+            for i in range(6)
+        ]
+
+    async def _get_mid_temperature_items(
+            self, temp_code: str, allow_stale: bool = True
+    ) -> Tuple[datetime, List[MidLandTemperatureItem]]:
+        return CURRENT_PUBLISHED_AT - timedelta(days=1), [
+            MidLandTemperatureItem(min_temperature=i, max_temperature=i + 10) for i in range(6)
+        ]
+
+
+def test_mid_forecasts_align_each_publication_to_its_own_date():
+    service = StubWeatherService(InMemoryCache())
+
+    published_at, results = asyncio.run(service._build_mid_forecasts("11B00000", "11B10101", 10))
+
+    # 응답 발표 시각은 더 오래된 기온예보 기준
+    assert published_at == CURRENT_PUBLISHED_AT - timedelta(days=1)
+    # 같은 날짜에 육상예보는 인덱스 i, 기온예보는 하루 전 발표분이라 인덱스 i + 1
+    assert [item.precipitation_probability for item in results] == [0, 1, 2, 3, 4]
+    assert [item.min_temperature for item in results] == [1, 2, 3, 4, 5]
+
+
+def test_short_forecasts_skip_past_days_of_stale_publication():
+    today = datetime.combine(date.today(), time())
+    stale_published_at = today - timedelta(hours=7)  # 전날 17:00 발표분
+    forecast_dates = [stale_published_at + timedelta(hours=hour) for hour in range(1, 72)]
+
+    class StaleShortForecastService(StubWeatherService):
+        async def _get_short_forecast_items(
+                self, nx: int, ny: int, allow_stale: bool = True
+        ) -> Tuple[datetime, List[ShortForecastItem]]:
+            return stale_published_at, [
+                ShortForecastItem(
+                    forecast_date=forecast_date,
+                    rain_probability=0,
+                    rain_condition=DatagoShortForecastRainCondition.NONE,
+                    rain_amount=0.0,
+                    humidity=50,
+                    snow_amount=0.0,
+                    sky_condition=DatagoShortForecastSkyCondition.CLEAR,
+                    temperature=10,
+                )
+                for forecast_date in forecast_dates
+            ]
+
+    service = StaleShortForecastService(InMemoryCache())
+
+    published_at, results = asyncio.run(service._build_short_forecasts(60, 127, 2))
+
+    assert published_at == stale_published_at
+    # 전날 예보는 빠지고 오늘부터 요청 일수만큼만 남는다
+    assert [item.date for item in results] == [
+        (today + timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(3)
+    ]
+
+
+def test_latest_is_not_overwritten_by_older_publication():
+    cache = InMemoryCache()
+    service = StubWeatherService(cache)
+    newer, older = CURRENT_PUBLISHED_AT, CURRENT_PUBLISHED_AT - timedelta(hours=12)
+
+    asyncio.run(service._set_latest_if_newer("weather:mid-land:11B00000:latest", newer, [{"v": "newer"}], 60))
+    # 늦게 끝난 이전 발표분 갱신은 latest를 되돌리지 않는다
+    asyncio.run(service._set_latest_if_newer("weather:mid-land:11B00000:latest", older, [{"v": "older"}], 60))
+
+    latest = asyncio.run(cache.get_json("weather:mid-land:11B00000:latest"))
+    assert latest == {"publishedAt": newer.strftime("%Y%m%d%H%M"), "items": [{"v": "newer"}]}
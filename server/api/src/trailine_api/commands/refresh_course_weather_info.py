@@ -0,0 +1,37 @@
+import argparse
+
+from trailine_api.common.db import session_scope
+from trailine_api.common.utils import latlon_to_grid_batch
+from trailine_api.repositories.weather_repositories import WeatherRepository
+from trailine_model.hooks import refresh_course_middle_points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="코스의 날씨 조회 정보(중간 지점, 기상청 격자)를 다시 계산")
+    parser.add_argument(
+        "--course-id",
+        type=int,
+        action="append",
+        dest="course_ids",
+        help="대상 코스 아이디 (여러 번 지정 가능, 생략 시 전체 코스)",
+    )
+    args = parser.parse_args()
+
+    repository = WeatherRepository()
+
+    with session_scope() as session:
+        refreshed = refresh_course_middle_points(session, args.course_ids)
+        print(f"Refreshed middle point of {refreshed} course(s).")
+
+        rows = repository.get_course_middle_points(session, args.course_ids)
+        nx, ny = latlon_to_grid_batch([row["lat"] for row in rows], [row["lon"] for row in rows])
+        grids = {
+            row["id"]: (int(grid_x), int(grid_y))
+            for row, grid_x, grid_y in zip(rows, nx.tolist(), ny.tolist())
+        }
+        repository.update_course_kma_grids(session, grids)
+        print(f"Updated KMA grid of {len(grids)} course(s).")
+
+
+if __name__ == "__main__":
+    main()
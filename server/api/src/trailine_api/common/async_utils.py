@@ -1,5 +1,6 @@
+import asyncio
 import inspect
-from typing import Awaitable, TypeVar
+from typing import Any, Awaitable, Callable, Dict, TypeVar, cast
 
 T = TypeVar("T")
 
@@ -26,3 +27,62 @@ async def await_if_needed(value: T | Awaitable[T]) -> T:
     if inspect.isawaitable(value):
         return await value
     return value
+
+
+class SingleFlight:
+    """
+    같은 key에 대한 동시 호출을 하나의 실행으로 합친다. (프로세스 내부, asyncio 레벨)
+
+    - 먼저 들어온 호출이 func를 Task로 실행하고, 실행 중에 들어온 같은 key의 호출은 그 Task의 결과를 함께 기다린다.
+    - 호출자가 취소되더라도 Task는 shield로 보호되어, 기다리는 다른 호출자에게 영향을 주지 않는다.
+    - 예외도 기다리던 모든 호출자에게 그대로 전달된다.
+    - Task가 끝나면 key가 제거되므로 결과를 보관(캐싱)하지는 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Task[Any]] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        return cast(T, await asyncio.shield(self.start(key, func)))
+
+    def start(self, key: str, func: Callable[[], Awaitable[T]]) -> "asyncio.Task[Any]":
+        """
+        기다리지 않고 실행만 시작한다. (백그라운드 갱신용)
+
+        같은 key가 이미 실행 중이면 그 Task를 반환한다.
+        실행 중인 Task는 끝날 때까지 내부에서 참조를 유지하므로 GC로 사라지지 않는다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+
+class RateLimiter:
+    """
+    초당 호출 횟수를 제한한다. (프로세스 내부, asyncio 레벨)
+
+    - acquire()를 호출한 순서대로 최소 1 / rate_per_second 초 간격을 두고 통과시킨다.
+    - 동시 실행 수 제한은 하지 않으므로, 필요하면 Semaphore와 함께 사용한다.
+    """
+
+    def __init__(self, rate_per_second: float) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self._interval = 1.0 / rate_per_second
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self._interval
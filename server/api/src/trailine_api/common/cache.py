@@ -1,22 +1,121 @@
+import asyncio
 import json
 import logging
-from typing import Any
+import zlib
+from abc import ABCMeta, abstractmethod
+from typing import Any, Awaitable, Callable, Mapping, Sequence, cast
 from contextlib import asynccontextmanager
 from uuid import uuid4
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from trailine_api.config import Config
 
 from trailine_api.common.async_utils import await_if_needed
+from trailine_api.common.local_cache import LocalLRUCache
 
 _logger = logging.getLogger(__name__)
 
+# 워커 메모리(L1) 캐시 무효화 메시지 채널 (메시지: 무효화할 키 리스트 JSON)
+LOCAL_CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+LOCAL_CACHE_LISTENER_RETRY_SECONDS = 1.0
+
+# 여러 키를 다룰 때 한 번의 명령(MGET/UNLINK)에 담는 키 수
+BATCH_SIZE = 500
+
+
+class ICacheCodec(metaclass=ABCMeta):
+    """
+    캐시 값(JSON 호환 객체) <-> Redis에 저장하는 bytes 변환기
+    """
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        pass
+
+    @abstractmethod
+    def encode_raw(self, body: bytes) -> bytes:
+        """
+        이미 직렬화된 JSON 본문을 저장 형식으로 바꾸는 함수
+        """
+        pass
+
+    @abstractmethod
+    def decode_raw(self, data: bytes) -> bytes:
+        """
+        저장된 값을 파싱하지 않고 JSON 본문(bytes)으로 되돌리는 함수
+        """
+        pass
+
+
+class JsonCacheCodec(ICacheCodec):
+    """
+    형식 태그를 앞에 붙여 저장하는 JSON 코덱
+
+    저장 형식: [형식 태그 1바이트][본문]
+    - b"J": UTF-8 JSON
+    - b"Z": zlib으로 압축한 UTF-8 JSON (본문이 compress_threshold_bytes 이상일 때)
+    - b"{" / b"[" 로 시작: 코덱 도입 전에 태그 없이 저장된 JSON
+
+    다른 직렬화/압축 방식을 추가할 때는 새 태그를 쓰고 decode가 기존 태그도 계속 읽도록 두면,
+    배포 도중 두 형식이 섞여 있어도 안전하게 읽을 수 있다.
+    """
+    JSON_TAG = b"J"
+    ZLIB_JSON_TAG = b"Z"
+
+    def __init__(self, compress_threshold_bytes: int, compress_level: int = 1) -> None:
+        self._compress_threshold_bytes = compress_threshold_bytes
+        self._compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        return self.encode_raw(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(self.decode_raw(data))
+
+    def encode_raw(self, body: bytes) -> bytes:
+        if len(body) >= self._compress_threshold_bytes:
+            return self.ZLIB_JSON_TAG + zlib.compress(body, self._compress_level)
+        return self.JSON_TAG + body
+
+    def decode_raw(self, data: bytes) -> bytes:
+        tag, body = data[:1], data[1:]
+        if tag == self.JSON_TAG:
+            return body
+        if tag == self.ZLIB_JSON_TAG:
+            return zlib.decompress(body)
+        if tag in (b"{", b"["):
+            return data
+        raise ValueError(f"Unknown cache value format: {tag!r}")
+
 
 class RedisCache:
-    def __init__(self) -> None:
+    """
+    Redis 캐시 클라이언트
+
+    local_cache를 주면 get_json 결과(역직렬화된 객체)를 워커 메모리에 함께 보관하는 L1 캐시로 동작한다.
+    - L1에서 꺼낸 객체는 여러 요청이 공유하므로 호출하는 쪽에서 수정하면 안 된다.
+    - set_json / delete 시 다른 워커의 L1 항목은 Redis pub/sub 메시지로 무효화한다.
+      (start_invalidation_listener로 구독을 시작해야 하며, 구독이 끊겼다 다시 연결되면 L1을 비운다)
+    - Redis TTL과 별개로 L1 항목은 최대 L1 TTL 동안 유지되므로, L1 TTL은 짧게 둔다.
+
+    JSON 값은 codec으로 bytes로 바꿔 저장한다. (기본: JsonCacheCodec)
+    """
+
+    def __init__(
+        self,
+        local_cache: LocalLRUCache[str, Any] | None = None,
+        codec: ICacheCodec | None = None,
+    ) -> None:
         self._client: Redis | None = None
+        self._local_cache = local_cache
+        self._codec = codec or JsonCacheCodec(Config.CACHE_COMPRESS_THRESHOLD_BYTES)
+        self._invalidation_task: asyncio.Task[None] | None = None
 
     def get_client(self) -> Redis:
         """
@@ -25,10 +124,10 @@ class RedisCache:
         if self._client is None:
             if Config.REDIS_URL is None:
                 raise RuntimeError("Config.REDIS_URL is not set")
+            # 압축된 값을 다루기 위해 응답을 bytes로 받는다 (문자열은 get에서 디코딩)
             self._client = redis.from_url(
                 Config.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
                 health_check_interval=Config.REDIS_HEALTH_CHECK_INTERVAL,
             )
         return self._client
@@ -46,19 +145,33 @@ class RedisCache:
         """
         FastAPI shutdown에서 호출해 Redis 연결을 종료한다.
         """
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+
         if self._client is not None:
             await self._client.close()
             self._client = None
             _logger.info("Redis connection closed")
 
     async def get(self, key: str) -> str | None:
+        raw = await self.get_bytes(key)
+        return raw.decode() if raw is not None else None
+
+    async def get_bytes(self, key: str) -> bytes | None:
         return await await_if_needed(self.get_client().get(key))
 
-    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+    async def set(self, key: str, value: str | bytes, ttl_seconds: int | None = None) -> bool:
         return await await_if_needed(self.get_client().set(key, value, ex=ttl_seconds))
 
     async def delete(self, *keys: str) -> int:
-        return await await_if_needed(self.get_client().delete(*keys))
+        deleted: int = await await_if_needed(self.get_client().delete(*keys))
+        await self._invalidate_local(*keys)
+        return deleted
 
     async def exists(self, key: str) -> bool:
         return bool(await await_if_needed(self.get_client().exists(key)))
@@ -72,13 +185,192 @@ class RedisCache:
         value: dict[str, Any] | list[Any],
         ttl_seconds: int | None = None,
     ) -> bool:
-        return await self.set(key, json.dumps(value, ensure_ascii=False), ttl_seconds=ttl_seconds)
+        ok = await self.set(key, self._codec.encode(value), ttl_seconds=ttl_seconds)
+        await self._invalidate_local(key)
+        return ok
+
+    async def get_json(
+        self,
+        key: str,
+        local_ttl_seconds: float | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """
+        :param local_ttl_seconds: L1 캐시 보관 시간 (없으면 L1 기본 TTL), 값이 바뀌지 않는 키는 길게 줄 수 있다
+        """
+        if self._local_cache is not None:
+            cached = self._local_cache.get(key)
+            if cached is not None:
+                return cached
+
+        raw = await self.get_bytes(key)
+        if raw is None:
+            return None
+
+        value = self._codec.decode(raw)
+        if self._local_cache is not None:
+            self._local_cache.set(key, value, size=len(raw), ttl_seconds=local_ttl_seconds)
+        return value
+
+    async def set_raw_json(self, key: str, body: bytes, ttl_seconds: int | None = None) -> bool:
+        """
+        이미 직렬화된 JSON 본문(예: API 응답 본문)을 저장하는 함수, get_raw_json / get_json으로 읽을 수 있다
+        """
+        ok = await self.set(key, self._codec.encode_raw(body), ttl_seconds=ttl_seconds)
+        await self._invalidate_local(key)
+        return ok
 
-    async def get_json(self, key: str) -> dict[str, Any] | list[Any] | None:
-        raw = await self.get(key)
+    async def get_raw_json(self, key: str, local_ttl_seconds: float | None = None) -> bytes | None:
+        """
+        저장된 JSON 본문을 파싱하지 않고 bytes로 반환하는 함수 (응답 본문으로 바로 내보낼 때 사용)
+
+        L1에는 bytes 그대로 보관하므로, 같은 키를 get_json과 섞어 읽지 않는다.
+        """
+        if self._local_cache is not None:
+            cached = self._local_cache.get(key)
+            if cached is not None:
+                return cast(bytes, cached)
+
+        raw = await self.get_bytes(key)
         if raw is None:
             return None
-        return json.loads(raw)
+
+        body = self._codec.decode_raw(raw)
+        if self._local_cache is not None:
+            self._local_cache.set(key, body, size=len(body), ttl_seconds=local_ttl_seconds)
+        return body
+
+    async def mget_json(
+        self,
+        keys: Sequence[str],
+        local_ttl_seconds: float | None = None,
+    ) -> list[dict[str, Any] | list[Any] | None]:
+        """
+        여러 키의 JSON 값을 트랜잭션 없는 파이프라인에 BATCH_SIZE개씩 나눈 MGET으로 한 번에 가져온다.
+        (L1에 있는 키는 Redis에 묻지 않는다)
+
+        :return: keys와 같은 순서의 값 리스트 (없는 키는 None)
+        """
+        results: list[dict[str, Any] | list[Any] | None] = [None] * len(keys)
+        missing: list[int] = []
+        for index, key in enumerate(keys):
+            cached = self._local_cache.get(key) if self._local_cache is not None else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                missing.append(index)
+        if not missing:
+            return results
+
+        batches = [missing[start:start + BATCH_SIZE] for start in range(0, len(missing), BATCH_SIZE)]
+        async with self.get_client().pipeline(transaction=False) as pipe:
+            for batch in batches:
+                pipe.mget([keys[index] for index in batch])
+            batch_raws = await pipe.execute()
+
+        for batch, raws in zip(batches, batch_raws):
+            # decode_responses=False 이므로 값은 항상 bytes
+            for index, raw in zip(batch, cast(list[bytes | None], raws)):
+                if raw is None:
+                    continue
+                value = self._codec.decode(raw)
+                results[index] = value
+                if self._local_cache is not None:
+                    self._local_cache.set(keys[index], value, size=len(raw), ttl_seconds=local_ttl_seconds)
+        return results
+
+    async def mset_json(
+        self,
+        values: Mapping[str, dict[str, Any] | list[Any]],
+        ttl_seconds: int | Mapping[str, int] | None = None,
+    ) -> None:
+        """
+        여러 키의 JSON 값을 트랜잭션 없는 파이프라인으로 한 번에 저장한다.
+
+        :param ttl_seconds: 모든 키에 같은 TTL을 주거나, 키별 TTL 매핑
+        :raises ValueError: 키별 TTL 매핑에 없는 키가 있을 때 (아무 키도 저장하지 않는다)
+        """
+        if isinstance(ttl_seconds, Mapping):
+            missing_ttl = [key for key in values if key not in ttl_seconds]
+            if missing_ttl:
+                raise ValueError(f"TTL is not given for keys: {missing_ttl}")
+        if not values:
+            return
+
+        async with self.get_client().pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                ttl = ttl_seconds[key] if isinstance(ttl_seconds, Mapping) else ttl_seconds
+                pipe.set(key, self._codec.encode(value), ex=ttl)
+            await pipe.execute()
+        await self._invalidate_local(*values)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """
+        패턴(예: "course:response:*")에 맞는 키를 SCAN으로 찾아 트랜잭션 없는 파이프라인에서 BATCH_SIZE개씩 UNLINK로 지운다.
+
+        KEYS와 달리 Redis를 막지 않지만 원자적이지 않으므로, 지우는 도중 새로 생긴 키는 남을 수 있다.
+
+        :return: 지운 키 수
+        """
+        deleted = 0
+        batch: list[str] = []
+        async for key in self.get_client().scan_iter(match=pattern, count=BATCH_SIZE):
+            batch.append(key.decode())
+            if len(batch) >= BATCH_SIZE:
+                deleted += await self._unlink_batch(batch)
+                batch = []
+        if batch:
+            deleted += await self._unlink_batch(batch)
+        return deleted
+
+    async def _unlink_batch(self, keys: list[str]) -> int:
+        async with self.get_client().pipeline(transaction=False) as pipe:
+            pipe.unlink(*keys)
+            (unlinked,) = await pipe.execute()
+        await self._invalidate_local(*keys)
+        return int(unlinked)
+
+    def local_cache_stats(self) -> dict[str, int] | None:
+        """
+        L1 캐시 적중/미스/제거 횟수와 현재 크기 (L1을 사용하지 않으면 None)
+        """
+        if self._local_cache is None:
+            return None
+        return self._local_cache.stats()
+
+    async def start_invalidation_listener(self) -> None:
+        """
+        FastAPI startup에서 호출해 다른 워커가 보낸 L1 무효화 메시지 구독을 시작한다.
+        """
+        if self._local_cache is None or self._invalidation_task is not None:
+            return
+        self._invalidation_task = asyncio.create_task(self._listen_invalidation(self._local_cache))
+
+    async def _listen_invalidation(self, local_cache: LocalLRUCache[str, Any]) -> None:
+        while True:
+            try:
+                pubsub = self.get_client().pubsub()
+                await pubsub.subscribe(LOCAL_CACHE_INVALIDATION_CHANNEL)
+                try:
+                    # 구독하지 않던 사이의 무효화 메시지는 받을 수 없으므로 (재)구독 시 L1을 비운다
+                    local_cache.clear()
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        for key in json.loads(message["data"]):
+                            local_cache.delete(key)
+                finally:
+                    await pubsub.aclose()
+            except (RedisError, OSError):
+                _logger.warning("Local cache invalidation listener disconnected, retrying", exc_info=True)
+                local_cache.clear()
+                await asyncio.sleep(LOCAL_CACHE_LISTENER_RETRY_SECONDS)
+
+    async def _invalidate_local(self, *keys: str) -> None:
+        if self._local_cache is None or not keys:
+            return
+        for key in keys:
+            self._local_cache.delete(key)
+        await self.get_client().publish(LOCAL_CACHE_INVALIDATION_CHANNEL, json.dumps(keys))
 
     def build_lock_key(self, key: str) -> str:
         return f"lock:{key}"
@@ -124,5 +416,67 @@ class RedisCache:
             if token is not None:
                 await self.release_lock(key, token)
 
+    async def get_or_load_json(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[dict[str, Any] | list[Any]]],
+        ttl_seconds: int | None = None,
+        lock_ttl_seconds: int = 30,
+        wait_timeout_seconds: float = 10.0,
+        poll_interval_seconds: float = 0.1,
+    ) -> dict[str, Any] | list[Any]:
+        """
+        캐시 미스 시 여러 워커(프로세스) 중 하나만 loader를 실행하도록 하는 cross-process single-flight.
+
+        - 락을 얻은 워커: 캐시를 한번 더 확인한 뒤 loader 실행 -> 캐시 저장
+        - 락을 얻지 못한 워커: poll_interval 간격으로 캐시를 확인하며 대기하다 값이 채워지면 그대로 반환
+        - 락을 가진 워커가 실패했거나(락 해제 + 값 없음) 대기 시간을 넘기면 직접 loader를 실행한다
+        """
+        cached = await self.get_json(key)
+        if cached is not None:
+            return cached
+
+        lock_key = self.build_lock_key(key)
+        async with self.lock(lock_key, ttl_seconds=lock_ttl_seconds) as token:
+            if token is not None:
+                # 락을 기다리는 사이 다른 워커가 채웠을 수 있으므로 한번 더 확인
+                cached = await self.get_json(key)
+                if cached is not None:
+                    return cached
+                return await self._load_and_set_json(key, loader, ttl_seconds)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_timeout_seconds
+        while loop.time() < deadline:
+            await asyncio.sleep(poll_interval_seconds)
+            cached = await self.get_json(key)
+            if cached is not None:
+                return cached
+            if not await self.exists(lock_key):
+                break
+
+        _logger.warning("Single-flight wait gave up, loading directly: %s", key)
+        return await self._load_and_set_json(key, loader, ttl_seconds)
+
+    async def _load_and_set_json(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[dict[str, Any] | list[Any]]],
+        ttl_seconds: int | None,
+    ) -> dict[str, Any] | list[Any]:
+        value = await loader()
+        await self.set_json(key, value, ttl_seconds=ttl_seconds)
+        return value
+
+
+def _build_local_cache() -> LocalLRUCache[str, Any] | None:
+    if not Config.LOCAL_CACHE_ENABLED:
+        return None
+    return LocalLRUCache(
+        default_ttl_seconds=Config.LOCAL_CACHE_TTL_SECONDS,
+        max_size=Config.LOCAL_CACHE_MAX_ENTRIES,
+        max_bytes=Config.LOCAL_CACHE_MAX_BYTES,
+    )
+
 
-cache = RedisCache()
+cache = RedisCache(local_cache=_build_local_cache())
@@ -0,0 +1,184 @@
+import asyncio
+import bisect
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from trailine_api.common.hangul import decompose_hangul
+from trailine_api.common.types import SearchSortKey
+
+T = TypeVar("T")
+
+# 검색어 후보를 좁히는 자모 n-gram 최대 길이
+NGRAM_SIZE = 3
+
+# 이름/주소를 이어 붙일 때 구분자 (검색어가 두 값에 걸쳐 일치하지 않도록)
+_TEXT_SEPARATOR = "\n"
+
+# 정렬 순위: 이름 부분 일치 > 이름 자모(입력 중인 음절) 일치 > 주소 일치
+_RANK_NAME = 0
+_RANK_NAME_JAMO = 1
+_RANK_ADDRESS = 2
+
+
+@dataclass(slots=True)
+class CatalogDocument(Generic[T]):
+    """
+    카탈로그 인덱스에 넣는 코스 한 건 (payload는 검색 결과로 그대로 돌려준다)
+    """
+    id: int
+    name: str
+    addresses: Sequence[str]
+    difficulty_id: int
+    style_id: int
+    payload: T
+
+
+class CatalogIndex(Generic[T]):
+    """
+    워커 메모리의 코스 카탈로그 검색 인덱스 (만든 뒤에는 바뀌지 않는다)
+
+    문서 i번째를 비트 i로 나타내는 정수 비트셋으로 조건을 조합한다.
+    - 난이도/스타일: 값별 비트셋을 OR 한 뒤 AND
+    - 검색어: 이름/주소를 자모로 분해한 문자열의 n-gram(1 ~ NGRAM_SIZE) 비트셋을 AND 해 후보를 좁히고,
+      후보마다 실제 부분 문자열 일치를 확인한다.
+    자모 단위로 비교하므로 입력 중인 마지막 음절("관아" -> "관악")도 찾는다.
+    DB 검색의 단어 유사도(오타 허용) 매칭은 하지 않는다.
+    """
+
+    def __init__(self, documents: Iterable[CatalogDocument[T]]) -> None:
+        self._documents = sorted(documents, key=lambda document: document.id)
+        self._names: List[str] = []
+        self._name_jamos: List[str] = []
+        self._text_jamos: List[str] = []
+        self._gram_masks: Dict[str, int] = {}
+        self._difficulty_masks: Dict[int, int] = {}
+        self._style_masks: Dict[int, int] = {}
+        self._all_mask = (1 << len(self._documents)) - 1
+
+        for position, document in enumerate(self._documents):
+            bit = 1 << position
+            text_jamo = decompose_hangul(_TEXT_SEPARATOR.join([document.name, *document.addresses]))
+            self._names.append(document.name)
+            self._name_jamos.append(decompose_hangul(document.name))
+            self._text_jamos.append(text_jamo)
+
+            for gram in _ngrams(text_jamo):
+                self._gram_masks[gram] = self._gram_masks.get(gram, 0) | bit
+            self._difficulty_masks[document.difficulty_id] = self._difficulty_masks.get(document.difficulty_id, 0) | bit
+            self._style_masks[document.style_id] = self._style_masks.get(document.style_id, 0) | bit
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def search(
+            self,
+            word: Optional[str],
+            difficulties: Optional[Sequence[int]],
+            styles: Optional[Sequence[int]],
+            limit: int,
+            offset: int = 0,
+            after: Optional[SearchSortKey] = None,
+    ) -> Tuple[int, List[Tuple[T, SearchSortKey]]]:
+        """
+        :param after: 이전 페이지 마지막 문서의 정렬 키 (주면 그 다음 문서부터)
+        :return: (전체 검색 개수, 해당 페이지 문서의 (payload, 정렬 키) 리스트)
+                 정렬 키는 검색어가 있으면 (순위, 아이디), 없으면 (아이디,)
+        """
+        mask = self._all_mask
+        if difficulties:
+            mask &= _union(self._difficulty_masks, difficulties)
+        if styles:
+            mask &= _union(self._style_masks, styles)
+
+        if word:
+            word_jamo = decompose_hangul(word)
+            for gram in _query_grams(word_jamo):
+                mask &= self._gram_masks.get(gram, 0)
+                if not mask:
+                    break
+            # 문서는 아이디 순이므로 (순위, 위치) 정렬은 (순위, 아이디) 정렬과 같다
+            matched = sorted(
+                (rank, position)
+                for position in _positions(mask)
+                if (rank := self._rank(position, word, word_jamo)) is not None
+            )
+            keys: List[SearchSortKey] = [(rank, self._documents[position].id) for rank, position in matched]
+            positions = [position for _, position in matched]
+        else:
+            positions = list(_positions(mask))
+            keys = [(self._documents[position].id,) for position in positions]
+
+        start = offset + (bisect.bisect_right(keys, tuple(after)) if after is not None else 0)
+        page = [(self._documents[positions[i]].payload, keys[i]) for i in range(start, min(start + limit, len(keys)))]
+        return len(positions), page
+
+    @staticmethod
+    def sort_key_size(word: Optional[str]) -> int:
+        return 2 if word else 1
+
+    def _rank(self, position: int, word: str, word_jamo: str) -> Optional[int]:
+        if word in self._names[position]:
+            return _RANK_NAME
+        if word_jamo in self._name_jamos[position]:
+            return _RANK_NAME_JAMO
+        if word_jamo in self._text_jamos[position]:
+            return _RANK_ADDRESS
+        return None
+
+
+class CatalogIndexHolder(Generic[T]):
+    """
+    현재 카탈로그 인덱스와 그 버전을 워커 메모리에 보관하는 홀더 (Container Singleton)
+
+    버전 확인(Redis 조회)은 version_check_interval_seconds 마다 한 번만 하도록 시각을 기록하고,
+    인덱스 교체는 lock으로 묶어 동시 요청이 한 번만 다시 만들게 한다.
+    """
+
+    def __init__(self, version_check_interval_seconds: float) -> None:
+        self._version_check_interval_seconds = version_check_interval_seconds
+        self._checked_at = -math.inf
+        self.index: Optional[CatalogIndex[T]] = None
+        self.version: Optional[str] = None
+        self.lock = asyncio.Lock()
+
+    def is_version_check_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= self._version_check_interval_seconds
+
+    def mark_version_checked(self) -> None:
+        self._checked_at = time.monotonic()
+
+    def replace(self, index: CatalogIndex[T], version: str) -> None:
+        self.index = index
+        self.version = version
+        self.mark_version_checked()
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    for size in range(1, NGRAM_SIZE + 1):
+        for start in range(len(text) - size + 1):
+            yield text[start:start + size]
+
+
+def _query_grams(word_jamo: str) -> List[str]:
+    """
+    검색어 후보를 좁히는 n-gram (짧은 검색어는 그 자체, 긴 검색어는 겹치는 NGRAM_SIZE 조각 모두)
+    """
+    if len(word_jamo) <= NGRAM_SIZE:
+        return [word_jamo]
+    return [word_jamo[start:start + NGRAM_SIZE] for start in range(len(word_jamo) - NGRAM_SIZE + 1)]
+
+
+def _union(masks: Dict[int, int], keys: Sequence[int]) -> int:
+    result = 0
+    for key in keys:
+        result |= masks.get(key, 0)
+    return result
+
+
+def _positions(mask: int) -> Iterable[int]:
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
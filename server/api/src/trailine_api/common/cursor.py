@@ -0,0 +1,46 @@
+"""
+검색 결과 keyset pagination 커서
+
+커서는 마지막으로 응답한 항목의 정렬 키와, 그 키를 만든 검색 조건(scope)을 담은 불투명한 문자열이다.
+검색 조건이 다른 요청에 커서를 쓰면 정렬 키의 의미가 달라지므로 InvalidCursorError로 거절한다.
+검색 방식(워커 메모리 인덱스 / DB)마다 정렬 키가 달라 scope에 검색 방식도 넣으므로,
+인덱스로 만든 커서는 DB 검색으로 넘어가면(또는 그 반대) 쓸 수 없다. 이때 클라이언트는 첫 페이지부터 다시 조회한다.
+"""
+import base64
+import binascii
+import json
+import math
+
+from trailine_api.common.types import SearchSortKey
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(scope: str, key: SearchSortKey) -> str:
+    payload = json.dumps({"f": scope, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str, key_size: int) -> SearchSortKey:
+    """
+    :param key_size: 검색 조건의 정렬 키 길이
+    :raises InvalidCursorError: 형식이 잘못되었거나 다른 검색 조건에서 만든 커서
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("malformed cursor") from e
+
+    if not isinstance(payload, dict) or payload.get("f") != scope:
+        raise InvalidCursorError("cursor does not match search conditions")
+
+    key = payload.get("k")
+    if (
+            not isinstance(key, list)
+            or len(key) != key_size
+            or not all(isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value) for value in key)
+    ):
+        raise InvalidCursorError("malformed cursor")
+    return tuple(key)
@@ -1,8 +1,9 @@
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from trailine_model.base import SessionLocal
+from trailine_model.base import AsyncSessionLocal, SessionLocal
 
 
 @contextmanager
@@ -18,3 +19,13 @@ def session_scope() -> Generator[Session, None, None]:
             """
             yield session
         # with 문을 빠져나오면 알아서 session.close() 호출
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """
+    session_scope의 비동기 버전 (API 조회 경로에서 이벤트 루프를 막지 않도록 사용)
+    """
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            yield session
@@ -0,0 +1,42 @@
+"""
+한글 자모 분해 (입력 중인 검색어의 부분 음절 매칭용)
+
+완성형 음절을 초성/중성/종성 호환 자모로 나누고, 겹모음/겹받침은 두벌식 키 입력 순서대로 한 번 더 나눈다.
+이렇게 분해한 문자열끼리 부분 문자열 비교를 하면 "관아"(ㄱㅗㅏㄴㅇㅏ)로 "관악"(ㄱㅗㅏㄴㅇㅏㄱ)을,
+"고"(ㄱㅗ)로 "과"(ㄱㅗㅏ)를 찾을 수 있다.
+"""
+
+HANGUL_SYLLABLE_BEGIN = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# 겹모음/겹받침 -> 키 입력 순서 (된소리 ㄲ, ㄸ 등은 한 키이므로 나누지 않는다)
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    문자열의 한글 음절/겹자모를 키 입력 순서의 호환 자모로 분해하는 함수 (한글 외 문자는 그대로 둔다)
+    """
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_SYLLABLE_BEGIN <= code <= HANGUL_SYLLABLE_END:
+            index = code - HANGUL_SYLLABLE_BEGIN
+            choseong, rest = divmod(index, 21 * 28)
+            jungseong, jongseong = divmod(rest, 28)
+            result.append(_CHOSEONG[choseong])
+            result.append(_COMPOUND_JAMO.get(_JUNGSEONG[jungseong], _JUNGSEONG[jungseong]))
+            if jongseong:
+                result.append(_COMPOUND_JAMO.get(_JONGSEONG[jongseong], _JONGSEONG[jongseong]))
+        else:
+            result.append(_COMPOUND_JAMO.get(char, char))
+    return "".join(result)
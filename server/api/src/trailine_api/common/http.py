@@ -0,0 +1,30 @@
+import logging
+from typing import AsyncIterator
+
+import httpx
+
+from trailine_api.config import Config
+
+_logger = logging.getLogger(__name__)
+
+
+async def init_async_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    외부 API 호출에 공용으로 사용하는 httpx.AsyncClient를 생성한다.
+
+    DI Container의 Resource로 등록되며, FastAPI lifespan에서 생성/종료된다.
+    워커(프로세스)당 하나의 커넥션 풀을 공유하므로 요청마다 TCP/TLS 연결을 새로 맺지 않는다.
+    """
+    client = httpx.AsyncClient(
+        timeout=httpx.Timeout(Config.HTTP_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+    _logger.info("Async HTTP client created")
+    try:
+        yield client
+    finally:
+        await client.aclose()
+        _logger.info("Async HTTP client closed")
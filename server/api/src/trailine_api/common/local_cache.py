@@ -0,0 +1,123 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LocalTTLCache(Generic[K, V]):
+    """
+    프로세스 메모리에 값을 보관하는 TTL 캐시 (워커 단위)
+
+    - 각 항목은 저장 시점부터 ttl_seconds가 지나면 만료된다.
+    - max_size를 넘으면 가장 오래 전에 저장된 항목부터 제거한다.
+    - 워커 간 공유되지 않으므로, 원본이 바뀌어도 최대 ttl_seconds 동안은 이전 값이 보일 수 있다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 10000) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._items: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            self._items.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._items.pop(key, None)
+        self._items[key] = (time.monotonic() + self._ttl_seconds, value)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class LocalLRUCache(Generic[K, V]):
+    """
+    프로세스 메모리에 값을 보관하는 LRU 캐시 (워커 단위)
+
+    - 항목마다 TTL을 지정할 수 있으며(없으면 default_ttl_seconds), 만료된 항목은 조회 시 제거한다.
+    - 항목 수가 max_size를 넘거나 크기 합이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+    - 항목 크기는 저장하는 쪽이 알려준 값(예: 직렬화된 문자열 길이)을 그대로 사용한다.
+    - 적중/미스/제거 횟수는 stats()로 확인해 크기를 조정하는 데 사용한다.
+    """
+
+    def __init__(self, default_ttl_seconds: float, max_size: int = 10000, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._default_ttl_seconds = default_ttl_seconds
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._items: OrderedDict[K, Tuple[float, int, V]] = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: K) -> Optional[V]:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, value = item
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, size: int = 0, ttl_seconds: Optional[float] = None) -> None:
+        self.delete(key)
+        if size > self._max_bytes:
+            # 혼자서 용량을 넘는 항목은 보관하지 않는다
+            return
+
+        ttl = self._default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._items[key] = (time.monotonic() + ttl, size, value)
+        self._bytes += size
+        while len(self._items) > self._max_size or self._bytes > self._max_bytes:
+            _, (_, evicted_size, _) = self._items.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._items),
+            "bytes": self._bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,23 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    pydantic-core(Rust)의 to_json으로 본문을 직렬화하는 JSON 응답 (앱 기본 응답 클래스)
+
+    표준 json.dumps보다 빠르며, 출력 형식(UTF-8, 공백 없음)은 JSONResponse와 같다.
+    """
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class RawJSONResponse(Response):
+    """
+    이미 직렬화된 JSON 본문(bytes)을 그대로 내보내는 응답 (캐시된 응답 본문 등)
+
+    라우터의 response_model은 검증/직렬화에 쓰이지 않으므로, 본문은 response_model 형식으로 만들어져 있어야 한다.
+    """
+    media_type = "application/json"
@@ -0,0 +1,94 @@
+"""
+구간 경로(track) 좌표를 압축된 형태로 인코딩하는 함수 모음
+
+[디코딩 규약] (web/src/lib/track-decoder.ts 가 이 규약을 따른다)
+- 위도/경도는 10^precision, 해발고도는 10^elePrecision 을 곱한 뒤 반올림한 정수로 양자화한다.
+- 첫 좌표는 0 기준, 이후 좌표는 바로 앞 좌표와의 차이(delta)로 표현한다.
+- delta: 위도/경도/해발고도별 delta 정수 배열 (lat, lon, ele). 누적합 후 10^precision 으로 나누면 원래 값이 된다.
+- polyline: Google Encoded Polyline 알고리즘을 3차원으로 확장한 문자열.
+  좌표마다 (위도, 경도, 해발고도) delta 순서로 값을 이어 붙이며, 각 값은
+  zigzag(음수는 ~(v << 1), 양수는 v << 1) → 하위 5비트씩 잘라 다음 묶음이 있으면 0x20을 더함 → 63을 더한 문자 로 인코딩한다.
+- 해발고도가 없는 좌표(null)는 0으로 인코딩한다.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+COORDINATE_PRECISION = 5  # 위경도 소수점 자리수 (약 1m)
+ELEVATION_PRECISION = 1  # 해발고도 소수점 자리수 (0.1m)
+
+# (최소 줌 레벨, LOD 레벨) - 줌이 작을수록(넓게 볼수록) 더 단순한 경로를 쓴다
+# LOD 레벨별 허용 오차는 trailine_model.models.course.COURSE_INTERVAL_LOD_TOLERANCES 참고
+ZOOM_LOD_LEVELS = ((16, 0), (14, 1), (12, 2))
+MIN_LOD_LEVEL = 3
+
+
+def lod_level_for_zoom(zoom: Optional[int]) -> int:
+    """
+    지도 줌 레벨에 맞는 구간 LOD 레벨을 구한다. (줌이 없으면 원본 경로인 0)
+    """
+    if zoom is None:
+        return 0
+    for min_zoom, level in ZOOM_LOD_LEVELS:
+        if zoom >= min_zoom:
+            return level
+    return MIN_LOD_LEVEL
+
+
+def _quantized_deltas(
+        lat: Sequence[float], lon: Sequence[float], ele: Sequence[Optional[float]], precision: int, ele_precision: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def to_deltas(values: np.ndarray, digits: int) -> np.ndarray:
+        quantized = np.rint(values * (10 ** digits)).astype(np.int64)
+        return np.diff(quantized, prepend=0)
+
+    # 해발고도의 None은 NaN이 되므로 0으로 바꾼다
+    ele_values = np.nan_to_num(np.asarray(ele, dtype=np.float64), nan=0.0)
+    return (
+        to_deltas(np.asarray(lat, dtype=np.float64), precision),
+        to_deltas(np.asarray(lon, dtype=np.float64), precision),
+        to_deltas(ele_values, ele_precision),
+    )
+
+
+def delta_encode(
+        lat: Sequence[float],
+        lon: Sequence[float],
+        ele: Sequence[Optional[float]],
+        precision: int = COORDINATE_PRECISION,
+        ele_precision: int = ELEVATION_PRECISION,
+) -> Dict[str, List[int]]:
+    """
+    좌표를 위도/경도/해발고도별 delta 정수 배열로 인코딩한다.
+
+    :param lat, lon, ele: 진행 방향 순서의 위도/경도/해발고도 배열 (같은 길이)
+    :return: {"lat": [...], "lon": [...], "ele": [...]}
+    """
+    lat_deltas, lon_deltas, ele_deltas = _quantized_deltas(lat, lon, ele, precision, ele_precision)
+    return {"lat": lat_deltas.tolist(), "lon": lon_deltas.tolist(), "ele": ele_deltas.tolist()}
+
+
+def encode_polyline(
+        lat: Sequence[float],
+        lon: Sequence[float],
+        ele: Sequence[Optional[float]],
+        precision: int = COORDINATE_PRECISION,
+        ele_precision: int = ELEVATION_PRECISION,
+) -> str:
+    """
+    좌표를 해발고도를 포함한 Encoded Polyline 문자열로 인코딩한다.
+
+    :param lat, lon, ele: 진행 방향 순서의 위도/경도/해발고도 배열 (같은 길이)
+    """
+    lat_deltas, lon_deltas, ele_deltas = _quantized_deltas(lat, lon, ele, precision, ele_precision)
+    values = np.column_stack((lat_deltas, lon_deltas, ele_deltas)).ravel()
+    # zigzag 인코딩으로 부호를 최하위 비트로 옮긴다
+    zigzag = np.where(values < 0, ~(values << 1), values << 1).tolist()
+
+    chunks: List[str] = []
+    for value in zigzag:
+        while value >= 0x20:
+            chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+            value >>= 5
+        chunks.append(chr(value + 63))
+    return "".join(chunks)
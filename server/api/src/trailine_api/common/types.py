@@ -1,10 +1,13 @@
 from enum import StrEnum
-from typing import List, Dict, Any, TypeAlias
+from typing import List, Dict, Any, Iterable, Tuple, TypeAlias, Union
 
 
 SQLRow: TypeAlias = Dict[str, Any]
 SQLRowList: TypeAlias = List[SQLRow]
 
+# 검색 결과의 정렬 키 (오름차순, 마지막 값은 아이디), keyset pagination 커서에 담는다
+SearchSortKey: TypeAlias = Tuple[float, ...]
+
 
 class SkyCondition(StrEnum):
     CLEAR = "clear"     # 맑음
@@ -38,15 +41,28 @@ class DatagoMiddleForecastSkyCondition(StrEnum):
 
     @classmethod
     def from_korean(cls, korean: str) -> "DatagoMiddleForecastSkyCondition":
-        for member in cls:
-            if member.korean == korean:
-                return member
-        raise ValueError(f"Unknown korean sky condition: {korean}")
+        try:
+            return _MIDDLE_SKY_CONDITION_BY_KOREAN[korean]
+        except KeyError:
+            raise ValueError(f"Unknown korean sky condition: {korean}") from None
+
+    @classmethod
+    def from_koreans(cls, koreans: Iterable[str]) -> List["DatagoMiddleForecastSkyCondition"]:
+        """여러 한글 날씨 값을 한 번에 변환한다."""
+        try:
+            return [_MIDDLE_SKY_CONDITION_BY_KOREAN[korean] for korean in koreans]
+        except KeyError as e:
+            raise ValueError(f"Unknown korean sky condition: {e.args[0]}") from None
 
     def to_sky_condition(self) -> SkyCondition:
         return self.sky_condition
 
 
+_MIDDLE_SKY_CONDITION_BY_KOREAN: Dict[str, DatagoMiddleForecastSkyCondition] = {
+    member.korean: member for member in DatagoMiddleForecastSkyCondition
+}
+
+
 class DatagoShortForecastRainCondition(StrEnum):
     code: int
     sky_condition: SkyCondition
@@ -65,16 +81,31 @@ class DatagoShortForecastRainCondition(StrEnum):
     SHOWER = ("shower", 4, SkyCondition.RAIN)
 
     @classmethod
-    def from_code(cls, code: int) -> "DatagoShortForecastRainCondition":
-        for member in cls:
-            if member.code == code:
-                return member
-        raise ValueError(f"Unknown PTY code: {code}")
+    def from_code(cls, code: Union[int, str]) -> "DatagoShortForecastRainCondition":
+        try:
+            return _SHORT_RAIN_CONDITION_BY_CODE[code]
+        except KeyError:
+            raise ValueError(f"Unknown PTY code: {code}") from None
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[Union[int, str]]) -> List["DatagoShortForecastRainCondition"]:
+        """여러 코드 값을 한 번에 변환한다. 응답의 문자열 코드("0", "1" 등)를 그대로 넘겨도 된다."""
+        try:
+            return [_SHORT_RAIN_CONDITION_BY_CODE[code] for code in codes]
+        except KeyError as e:
+            raise ValueError(f"Unknown PTY code: {e.args[0]}") from None
 
     def to_sky_condition(self) -> SkyCondition:
         return self.sky_condition
 
 
+# 응답의 문자열 코드도 int 변환 없이 찾을 수 있도록 int, str 키를 함께 등록한다
+_SHORT_RAIN_CONDITION_BY_CODE: Dict[Union[int, str], DatagoShortForecastRainCondition] = {
+    **{member.code: member for member in DatagoShortForecastRainCondition},
+    **{str(member.code): member for member in DatagoShortForecastRainCondition},
+}
+
+
 class DatagoShortForecastSkyCondition(StrEnum):
     code: int
     sky_condition: SkyCondition
@@ -91,17 +122,43 @@ class DatagoShortForecastSkyCondition(StrEnum):
     OVERCAST = ("overcast", 4, SkyCondition.CLOUDY)
 
     @classmethod
-    def from_code(cls, code: int) -> "DatagoShortForecastSkyCondition":
-        for member in cls:
-            if member.code == code:
-                return member
-        raise ValueError(f"Unknown SKY code: {code}")
+    def from_code(cls, code: Union[int, str]) -> "DatagoShortForecastSkyCondition":
+        try:
+            return _SHORT_SKY_CONDITION_BY_CODE[code]
+        except KeyError:
+            raise ValueError(f"Unknown SKY code: {code}") from None
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[Union[int, str]]) -> List["DatagoShortForecastSkyCondition"]:
+        """여러 코드 값을 한 번에 변환한다. 응답의 문자열 코드("0", "1" 등)를 그대로 넘겨도 된다."""
+        try:
+            return [_SHORT_SKY_CONDITION_BY_CODE[code] for code in codes]
+        except KeyError as e:
+            raise ValueError(f"Unknown SKY code: {e.args[0]}") from None
 
     def to_sky_condition(self) -> SkyCondition:
         return self.sky_condition
 
 
+# 응답의 문자열 코드도 int 변환 없이 찾을 수 있도록 int, str 키를 함께 등록한다
+_SHORT_SKY_CONDITION_BY_CODE: Dict[Union[int, str], DatagoShortForecastSkyCondition] = {
+    **{member.code: member for member in DatagoShortForecastSkyCondition},
+    **{str(member.code): member for member in DatagoShortForecastSkyCondition},
+}
+
+
 class CourseLocationType(StrEnum):
     START = "start"
     MIDDLE = "middle"
     END = "end"
+
+
+class TrackFormat(StrEnum):
+    POINTS = "points"       # [{lat, lon, ele}, ...] (기본)
+    POLYLINE = "polyline"   # 해발고도를 포함한 Encoded Polyline 문자열
+    DELTA = "delta"         # 위도/경도/해발고도별 delta 정수 배열
+
+
+class CourseSearchMode(StrEnum):
+    TRIGRAM = "trigram"     # 코스 검색 문서(course_search_document)의 pg_trgm GIN 인덱스 검색 + 유사도 정렬 (기본)
+    LIKE = "like"           # 코스-구간-장소 조인 후 LIKE 필터 (인덱스 없이 동작하는 이전 방식)
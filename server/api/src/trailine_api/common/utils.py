@@ -1,61 +1,79 @@
 import math
 from typing import Tuple
 
+import numpy as np
+import numpy.typing as npt
 
-def latlon_to_grid(lat: float, lon: float) -> Tuple[int, int]:
+
+# 기상청 단기예보 격자 변환(Lambert Conformal Conic) 지도 파라미터 (원본 C 코드 기준)
+_RE = 6371.00877  # 지구 반경(km)
+_GRID = 5.0       # 격자 간격(km)
+_SLAT1 = 30.0     # 표준위도 1(degree)
+_SLAT2 = 60.0     # 표준위도 2(degree)
+_OLON = 126.0     # 기준점 경도(degree)
+_OLAT = 38.0      # 기준점 위도(degree)
+_XO = 210.0 / _GRID
+_YO = 675.0 / _GRID
+
+_DEGRAD = math.pi / 180.0
+
+# 지도 파라미터에서 유도되는 투영 상수 (import 시 한 번만 계산)
+_re = _RE / _GRID
+_slat1 = _SLAT1 * _DEGRAD
+_slat2 = _SLAT2 * _DEGRAD
+_olon = _OLON * _DEGRAD
+_olat = _OLAT * _DEGRAD
+
+_sn = math.log(math.cos(_slat1) / math.cos(_slat2)) / math.log(
+    math.tan(math.pi * 0.25 + _slat2 * 0.5) / math.tan(math.pi * 0.25 + _slat1 * 0.5)
+)
+_sf = (math.tan(math.pi * 0.25 + _slat1 * 0.5) ** _sn) * math.cos(_slat1) / _sn
+_ro = _re * _sf / (math.tan(math.pi * 0.25 + _olat * 0.5) ** _sn)
+
+
+def latlon_to_grid_batch(
+    lat: npt.ArrayLike, lon: npt.ArrayLike
+) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
     """
-    기상청 단기예보 위경도(lat, lon)를 격자(nx, ny)로 변환한다.
+    기상청 단기예보 위경도(lat, lon) 배열을 격자(nx, ny) 배열로 한번에 변환한다.
 
     Args:
-        lat: 위도 (degree)
-        lon: 경도 (degree)
+        lat: 위도 배열 (degree)
+        lon: 경도 배열 (degree)
 
     Returns:
-        (nx, ny): 정수 격자 좌표
+        (nx, ny): 입력과 같은 shape의 정수 격자 좌표 배열
     """
-    # 원본 C 코드의 지도 파라미터
-    RE = 6371.00877  # 지구 반경(km)
-    GRID = 5.0       # 격자 간격(km)
-    SLAT1 = 30.0     # 표준위도 1(degree)
-    SLAT2 = 60.0     # 표준위도 2(degree)
-    OLON = 126.0     # 기준점 경도(degree)
-    OLAT = 38.0      # 기준점 위도(degree)
-    XO = 210.0 / GRID
-    YO = 675.0 / GRID
+    lat_arr = np.asarray(lat, dtype=np.float64)
+    lon_arr = np.asarray(lon, dtype=np.float64)
 
-    DEGRAD = math.pi / 180.0
+    ra = _re * _sf / (np.tan(math.pi * 0.25 + lat_arr * _DEGRAD * 0.5) ** _sn)
 
-    re = RE / GRID
-    slat1 = SLAT1 * DEGRAD
-    slat2 = SLAT2 * DEGRAD
-    olon = OLON * DEGRAD
-    olat = OLAT * DEGRAD
+    theta = lon_arr * _DEGRAD - _olon
+    theta = np.where(theta > math.pi, theta - 2.0 * math.pi, theta)
+    theta = np.where(theta < -math.pi, theta + 2.0 * math.pi, theta)
+    theta *= _sn
 
-    sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
-    sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+    x = ra * np.sin(theta) + _XO
+    y = _ro - ra * np.cos(theta) + _YO
 
-    sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
-    sf = (sf ** sn) * math.cos(slat1) / sn
+    # 원본 C 코드와 동일한 반올림 처리 (int() 와 같이 0 방향으로 버림)
+    nx = np.trunc(x + 1.5).astype(np.int64)
+    ny = np.trunc(y + 1.5).astype(np.int64)
 
-    ro = math.tan(math.pi * 0.25 + olat * 0.5)
-    ro = re * sf / (ro ** sn)
+    return nx, ny
 
-    ra = math.tan(math.pi * 0.25 + lat * DEGRAD * 0.5)
-    ra = re * sf / (ra ** sn)
 
-    theta = lon * DEGRAD - olon
-    if theta > math.pi:
-        theta -= 2.0 * math.pi
-    if theta < -math.pi:
-        theta += 2.0 * math.pi
-
-    theta *= sn
-
-    x = ra * math.sin(theta) + XO
-    y = ro - ra * math.cos(theta) + YO
+def latlon_to_grid(lat: float, lon: float) -> Tuple[int, int]:
+    """
+    기상청 단기예보 위경도(lat, lon)를 격자(nx, ny)로 변환한다.
 
-    # 원본 C 코드와 동일한 반올림 처리
-    nx = int(x + 1.5)
-    ny = int(y + 1.5)
+    Args:
+        lat: 위도 (degree)
+        lon: 경도 (degree)
 
-    return nx, ny
\ No newline at end of file
+    Returns:
+        (nx, ny): 정수 격자 좌표
+    """
+    nx, ny = latlon_to_grid_batch(lat, lon)
+    return int(nx), int(ny)
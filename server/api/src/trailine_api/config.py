@@ -1,8 +1,57 @@
 import os
 from datetime import timedelta
 
+from trailine_api.common.types import CourseSearchMode
+
 class Config:
     DATAGO_SERVICE_KEY = os.environ.get("DATAGO_SERVICE_KEY")
     REDIS_URL = os.environ.get("REDIS_URL")
     REDIS_HEALTH_CHECK_INTERVAL = int(os.environ.get("REDIS_HEALTH_CHECK_INTERVAL", "30"))
     RUN_MODE = os.environ.get("RUN_MODE", "dev")
+
+    # Redis 앞단의 워커 메모리(L1) 캐시 (get_json 결과를 보관, 워커 간 무효화는 Redis pub/sub)
+    LOCAL_CACHE_ENABLED = os.environ.get("LOCAL_CACHE_ENABLED", "false").lower() == "true"
+    LOCAL_CACHE_TTL_SECONDS = float(os.environ.get("LOCAL_CACHE_TTL_SECONDS", "5"))
+    LOCAL_CACHE_MAX_ENTRIES = int(os.environ.get("LOCAL_CACHE_MAX_ENTRIES", "2000"))
+    LOCAL_CACHE_MAX_BYTES = int(os.environ.get("LOCAL_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+    # 이 크기(bytes) 이상의 캐시 값은 zlib으로 압축해 저장한다
+    CACHE_COMPRESS_THRESHOLD_BYTES = int(os.environ.get("CACHE_COMPRESS_THRESHOLD_BYTES", "4096"))
+
+    # 외부 API 호출용 공용 HTTP 클라이언트 (커넥션 풀)
+    HTTP_TIMEOUT_SECONDS = float(os.environ.get("HTTP_TIMEOUT_SECONDS", "5"))
+    HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", "50"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+    # 공공데이터포털(기상청) API 동시 요청 수 상한 (워커 단위)
+    DATAGO_MAX_CONCURRENCY = int(os.environ.get("DATAGO_MAX_CONCURRENCY", "8"))
+
+    # 기상청 예보 캐시 예열 (발표 시각마다 공개 코스의 격자/지역 예보를 미리 조회)
+    WEATHER_PREWARM_ENABLED = os.environ.get("WEATHER_PREWARM_ENABLED", "false").lower() == "true"
+    WEATHER_PREWARM_CONCURRENCY = int(os.environ.get("WEATHER_PREWARM_CONCURRENCY", "4"))
+    WEATHER_PREWARM_RATE_PER_SECOND = float(os.environ.get("WEATHER_PREWARM_RATE_PER_SECOND", "5"))
+    WEATHER_PREWARM_POLL_SECONDS = float(os.environ.get("WEATHER_PREWARM_POLL_SECONDS", "30"))
+
+    # 새 발표분을 아직 가져오지 못했을 때, 이전 발표분을 응답할 수 있는 최대 시간 차이 (stale-while-revalidate)
+    WEATHER_STALE_MAX_SECONDS = int(os.environ.get("WEATHER_STALE_MAX_SECONDS", str(3600 * 12)))
+
+    # 코스별 날씨 조회 정보(지역 코드, 격자)를 워커 메모리에 보관하는 시간
+    COURSE_WEATHER_INFO_TTL_SECONDS = int(os.environ.get("COURSE_WEATHER_INFO_TTL_SECONDS", "600"))
+
+    # 코스 응답(상세, 구간, 난이도/스타일 목록) Redis 캐시
+    # 어드민/업로드 스크립트가 trailine_model.cache로 버전을 올려 무효화하며, TTL은 무효화가 누락됐을 때의 안전장치
+    COURSE_CACHE_ENABLED = os.environ.get("COURSE_CACHE_ENABLED", "true").lower() == "true"
+    COURSE_CACHE_TTL_SECONDS = int(os.environ.get("COURSE_CACHE_TTL_SECONDS", str(3600 * 6)))
+
+    # 코스 연관 검색 결과(검색 조건별 정렬된 코스 목록과 전체 개수) Redis 캐시 (COURSE_CACHE_ENABLED일 때)
+    # 결과가 COURSE_SEARCH_CACHE_MAX_IDS개를 넘으면 목록은 저장하지 않고 전체 개수만 저장한다
+    COURSE_SEARCH_CACHE_TTL_SECONDS = int(os.environ.get("COURSE_SEARCH_CACHE_TTL_SECONDS", "60"))
+    COURSE_SEARCH_CACHE_MAX_IDS = int(os.environ.get("COURSE_SEARCH_CACHE_MAX_IDS", "2000"))
+
+    # 코스 연관 검색 방식 (trigram: 코스 검색 문서 + pg_trgm 인덱스, like: 원본 테이블 조인 후 LIKE)
+    COURSE_SEARCH_MODE = CourseSearchMode(os.environ.get("COURSE_SEARCH_MODE", CourseSearchMode.TRIGRAM))
+
+    # 코스 연관 검색을 워커 메모리 카탈로그 인덱스로 응답 (Postgres 조회 없음)
+    # 코스 카탈로그 버전(Redis)을 주기적으로 확인해 바뀌면 다시 만들며, REDIS_URL이 없으면 시작 시 한 번만 만든다
+    COURSE_INDEX_ENABLED = os.environ.get("COURSE_INDEX_ENABLED", "false").lower() == "true"
+    COURSE_INDEX_VERSION_CHECK_SECONDS = float(os.environ.get("COURSE_INDEX_VERSION_CHECK_SECONDS", "5"))
@@ -1,22 +1,30 @@
+import asyncio
+
+import httpx
 from dependency_injector import containers
 from dependency_injector.providers import Factory, Singleton, Resource
 
+from trailine_api.common.async_utils import SingleFlight
 from trailine_api.common.cache import cache
+from trailine_api.common.catalog_index import CatalogIndexHolder
+from trailine_api.common.http import init_async_http_client
+from trailine_api.common.local_cache import LocalTTLCache
 from trailine_api.config import Config
 from trailine_api.repositories.course_repositories import (
-    CourseRepository,
-    ICourseRepository,
-    ICourseDifficultyRepository,
-    CourseDifficultyRepository,
-    ICourseStyleRepository,
-    CourseStyleRepository
+    AsyncCourseRepository,
+    IAsyncCourseRepository,
+    IAsyncCourseDifficultyRepository,
+    AsyncCourseDifficultyRepository,
+    IAsyncCourseStyleRepository,
+    AsyncCourseStyleRepository
 )
-from trailine_api.repositories.place_repositories import IPlaceRepository, PlaceRepository
-from trailine_api.repositories.weather_repositories import IWeatherRepository, WeatherRepository
+from trailine_api.repositories.place_repositories import IAsyncPlaceRepository, AsyncPlaceRepository
+from trailine_api.repositories.weather_repositories import IAsyncWeatherRepository, AsyncWeatherRepository
 from trailine_api.externals.datago import IKmaMidLandForecastAPI, KmaMidLandForecastAPI, IKmaMidLandTemperatureAPI, \
     KmaMidLandTemperatureAPI, IKmaShortForecastAPI, KmaShortForecastAPI
 from trailine_api.services.course_services import ICourseService, CourseService
 from trailine_api.services.weather_services import IWeatherService, WeatherService
+from trailine_api.tasks.weather_prewarm import WeatherPrewarmScheduler
 
 
 class Container(containers.DeclarativeContainer):
@@ -26,41 +34,83 @@ class Container(containers.DeclarativeContainer):
         ]
     )
 
+    # Resource (FastAPI lifespan에서 init_resources / shutdown_resources로 관리)
+    http_client: Resource[httpx.AsyncClient] = Resource(init_async_http_client)
+
     # External
+    # 모든 공공데이터포털 API가 공유하는 동시 요청 제한
+    datago_limiter: Singleton[asyncio.Semaphore] = Singleton(asyncio.Semaphore, Config.DATAGO_MAX_CONCURRENCY)
     kma_mid_forecast_api: Singleton[IKmaMidLandForecastAPI] = Singleton(
         KmaMidLandForecastAPI,
-        service_key=Config.DATAGO_SERVICE_KEY
+        service_key=Config.DATAGO_SERVICE_KEY,
+        client=http_client,
+        limiter=datago_limiter,
     )
     kma_mid_temperature_api: Singleton[IKmaMidLandTemperatureAPI] = Singleton(
         KmaMidLandTemperatureAPI,
-        service_key=Config.DATAGO_SERVICE_KEY
+        service_key=Config.DATAGO_SERVICE_KEY,
+        client=http_client,
+        limiter=datago_limiter,
     )
     kma_short_forecast_api: Singleton[IKmaShortForecastAPI] = Singleton(
         KmaShortForecastAPI,
-        service_key=Config.DATAGO_SERVICE_KEY
+        service_key=Config.DATAGO_SERVICE_KEY,
+        client=http_client,
+        limiter=datago_limiter,
+    )
+
+    # 같은 워커 내 동시 캐시 미스를 하나의 조회로 합치는 coalescer
+    single_flight: Singleton[SingleFlight] = Singleton(SingleFlight)
+
+    # 코스별 날씨 조회 정보(지역 코드, 격자)의 워커 메모리 lookup table
+    course_weather_info_table: Singleton[LocalTTLCache] = Singleton(
+        LocalTTLCache,
+        ttl_seconds=Config.COURSE_WEATHER_INFO_TTL_SECONDS,
+    )
+
+    # 코스 연관 검색용 워커 메모리 카탈로그 인덱스
+    course_catalog_index: Singleton[CatalogIndexHolder] = Singleton(
+        CatalogIndexHolder,
+        version_check_interval_seconds=Config.COURSE_INDEX_VERSION_CHECK_SECONDS,
     )
 
-    # Repository
-    course_repository: Factory[ICourseRepository] = Factory(CourseRepository)
-    course_difficulty_repository: Factory[ICourseDifficultyRepository] = Factory(CourseDifficultyRepository)
-    course_style_repository: Factory[ICourseStyleRepository] = Factory(CourseStyleRepository)
-    place_repository: Factory[IPlaceRepository] = Factory(PlaceRepository)
-    weather_repository: Factory[IWeatherRepository] = Factory(WeatherRepository)
+    # Repository (API 조회 경로는 비동기 세션을 사용한다)
+    course_repository: Factory[IAsyncCourseRepository] = Factory(AsyncCourseRepository)
+    course_difficulty_repository: Factory[IAsyncCourseDifficultyRepository] = Factory(AsyncCourseDifficultyRepository)
+    course_style_repository: Factory[IAsyncCourseStyleRepository] = Factory(AsyncCourseStyleRepository)
+    place_repository: Factory[IAsyncPlaceRepository] = Factory(AsyncPlaceRepository)
+    weather_repository: Factory[IAsyncWeatherRepository] = Factory(AsyncWeatherRepository)
 
     # Service
     course_service: Factory[ICourseService] = Factory(
         CourseService,
+        cache=cache,
         course_repository=course_repository,
         place_repository=place_repository,
         course_difficulty_repository=course_difficulty_repository,
         course_style_repository=course_style_repository,
+        course_catalog_index=course_catalog_index,
     )
     weather_service: Factory[IWeatherService] = Factory(
         WeatherService,
         cache=cache,
+        single_flight=single_flight,
+        course_weather_info_table=course_weather_info_table,
         weather_repository=weather_repository,
         course_repository=course_repository,
         kma_mid_forecast_api=kma_mid_forecast_api,
         kma_mid_temperature_api=kma_mid_temperature_api,
         kma_short_forecast_api=kma_short_forecast_api,
     )
+
+    # Background Task
+    weather_prewarm_scheduler: Singleton[WeatherPrewarmScheduler] = Singleton(
+        WeatherPrewarmScheduler,
+        weather_service=weather_service,
+        cache=cache,
+        kma_short_forecast_api=kma_short_forecast_api,
+        kma_mid_forecast_api=kma_mid_forecast_api,
+        concurrency=Config.WEATHER_PREWARM_CONCURRENCY,
+        rate_per_second=Config.WEATHER_PREWARM_RATE_PER_SECOND,
+        poll_interval_seconds=Config.WEATHER_PREWARM_POLL_SECONDS,
+    )
@@ -1,7 +1,8 @@
 from abc import ABCMeta, abstractmethod
+import asyncio
 from datetime import datetime, timedelta, date
 from typing import Any, Dict, List, Tuple
-import collections
+import functools
 import math
 
 import httpx
@@ -22,13 +23,27 @@ class DatagoAPI:
     service_key: str
     url: str
     base_url: str = "https://apis.data.go.kr"
+    _client: httpx.AsyncClient
+    _limiter: asyncio.Semaphore
 
-    def __init__(self, service_key: str, uri: str):
+    def __init__(self, service_key: str, uri: str, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
         self.service_key = service_key
         self.url = f"{self.base_url}{uri}"
+        self._client = client
+        self._limiter = limiter
+
+    async def _get(self, params: Dict[str, Any]) -> httpx.Response:
+        """공용 AsyncClient(커넥션 풀)로 GET 요청을 보낸다.
+
+        limiter는 모든 공공데이터포털 API가 공유하므로, 동시에 나가는 업스트림 요청 수가 제한된다.
+        """
+        async with self._limiter:
+            response = await self._client.get(self.url, params={"serviceKey": self.service_key, **params})
+        response.raise_for_status()
+        return response
 
     @staticmethod
-    def _parse_response(response: httpx.Response) -> Dict | None:
+    def _parse_body(response: httpx.Response) -> Dict | None:
         data = response.json()
         result_code = data["response"]["header"]["resultCode"]
         if result_code == "03": # 데이터 없음
@@ -36,7 +51,14 @@ class DatagoAPI:
         elif result_code != "00":
             result_msg = data["response"]["header"]["resultMsg"]
             raise ValueError(f"Datago API error: [{result_code}] {result_msg}")
-        return data["response"]["body"]["items"]
+        return data["response"]["body"]
+
+    @classmethod
+    def _parse_response(cls, response: httpx.Response) -> Dict | None:
+        body = cls._parse_body(response)
+        if body is None:
+            return None
+        return body["items"]
 
 
 class KmaMidForecastBase(DatagoAPI):
@@ -50,17 +72,15 @@ class KmaMidForecastBase(DatagoAPI):
         forecast_time_str = self._convert_time_to_forecast_time(datetime.now())
         return datetime.strptime(forecast_time_str, "%Y%m%d%H%M")
 
-    def _fetch_first_item(self, regional_code: str) -> Dict[str, Any]:
+    async def _fetch_first_item(self, regional_code: str) -> Dict[str, Any]:
         """정상 응답 시, 실제 데이터 추출
         """
         forecast_time = self._convert_time_to_forecast_time(datetime.now())
-        response = httpx.get(self.url, params={
-            "serviceKey": self.service_key,
+        response = await self._get({
             "dataType": "JSON",
             "regId": regional_code,
             "tmFc": forecast_time,
         })
-        response.raise_for_status()
 
         res_items = self._parse_response(response)
 
@@ -99,7 +119,7 @@ class IKmaMidLandForecastAPI(metaclass=ABCMeta):
     """중기 날씨 상태 예보
     """
     @abstractmethod
-    def call(self, regional_code: str) -> List[MidLandForecastItem]:
+    async def call(self, regional_code: str) -> List[MidLandForecastItem]:
         pass
 
     @abstractmethod
@@ -111,7 +131,7 @@ class IKmaMidLandTemperatureAPI(metaclass=ABCMeta):
     """중기 날씨 기온 예보
     """
     @abstractmethod
-    def call(self, regional_code: str) -> List[MidLandTemperatureItem]:
+    async def call(self, regional_code: str) -> List[MidLandTemperatureItem]:
         pass
 
     @abstractmethod
@@ -123,7 +143,7 @@ class IKmaShortForecastAPI(metaclass=ABCMeta):
     """단기 날씨 예보
     """
     @abstractmethod
-    def call(self, nx: int, ny: int, days: int) -> List[ShortForecastItem]:
+    async def call(self, nx: int, ny: int, days: int) -> List[ShortForecastItem]:
         pass
 
     @abstractmethod
@@ -135,43 +155,42 @@ class IKmaShortForecastAPI(metaclass=ABCMeta):
 # ──────────────────────────────────────────
 
 class KmaMidLandForecastAPI(KmaMidForecastBase, IKmaMidLandForecastAPI):
-    def __init__(self, service_key: str):
-        super().__init__(service_key, "/1360000/MidFcstInfoService/getMidLandFcst")
+    def __init__(self, service_key: str, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
+        super().__init__(service_key, "/1360000/MidFcstInfoService/getMidLandFcst", client, limiter)
 
-    def call(self, regional_code: str) -> List[MidLandForecastItem]:
-        return self._parse_items(self._fetch_first_item(regional_code))
+    async def call(self, regional_code: str) -> List[MidLandForecastItem]:
+        return self._parse_items(await self._fetch_first_item(regional_code))
 
     @staticmethod
     def _parse_items(item: Dict[str, Any]) -> List[MidLandForecastItem]:
-        results: List[MidLandForecastItem] = []
-        for day in range(5, 11):
-            if day <= 7:
-                rain_am = item[f"rnSt{day}Am"]
-                rain_pm = item[f"rnSt{day}Pm"]
-                sky_am = DatagoMiddleForecastSkyCondition.from_korean(item[f"wf{day}Am"])
-                sky_pm = DatagoMiddleForecastSkyCondition.from_korean(item[f"wf{day}Pm"])
-            else:
-                rain_am = item[f"rnSt{day}"]
-                rain_pm = rain_am
-                sky_am = DatagoMiddleForecastSkyCondition.from_korean(item[f"wf{day}"])
-                sky_pm = sky_am
-
-            results.append(MidLandForecastItem(
-                rain_probability_am=rain_am,
-                rain_probability_pm=rain_pm,
-                sky_condition_am=sky_am,
-                sky_condition_pm=sky_pm,
-            ))
-        return results
+        # 7일 후까지는 오전/오후, 8일 후부터는 하루 단위 값이므로 오전/오후에 같은 열을 쓴다
+        columns = [
+            (f"{day}Am", f"{day}Pm") if day <= 7 else (f"{day}", f"{day}")
+            for day in range(5, 11)
+        ]
+        # 날씨 값은 열 단위로 한 번에 변환한다
+        sky_conditions = DatagoMiddleForecastSkyCondition.from_koreans(
+            item[f"wf{column}"] for am_pm in columns for column in am_pm
+        )
+
+        return [
+            MidLandForecastItem(
+                rain_probability_am=item[f"rnSt{am}"],
+                rain_probability_pm=item[f"rnSt{pm}"],
+                sky_condition_am=sky_conditions[2 * index],
+                sky_condition_pm=sky_conditions[2 * index + 1],
+            )
+            for index, (am, pm) in enumerate(columns)
+        ]
 
 
 
 class KmaMidLandTemperatureAPI(KmaMidForecastBase, IKmaMidLandTemperatureAPI):
-    def __init__(self, service_key: str):
-        super().__init__(service_key, "/1360000/MidFcstInfoService/getMidTa")
+    def __init__(self, service_key: str, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
+        super().__init__(service_key, "/1360000/MidFcstInfoService/getMidTa", client, limiter)
 
-    def call(self, regional_code: str) -> List[MidLandTemperatureItem]:
-        return self._parse_items(self._fetch_first_item(regional_code))
+    async def call(self, regional_code: str) -> List[MidLandTemperatureItem]:
+        return self._parse_items(await self._fetch_first_item(regional_code))
 
     @staticmethod
     def _parse_items(item: Dict[str, Any]) -> List[MidLandTemperatureItem]:
@@ -186,91 +205,143 @@ class KmaMidLandTemperatureAPI(KmaMidForecastBase, IKmaMidLandTemperatureAPI):
 
 class KmaShortForecastAPI(DatagoAPI, IKmaShortForecastAPI):
     _BASE_TIMES = ["0200", "0500", "0800", "1100", "1400", "1700", "2000", "2300"]
+    # 매 시각마다 제공되는 항목 수 (TMP, UUU, VVV, VEC, WSD, SKY, PTY, POP, WAV, PCP, REH, SNO)
+    _HOURLY_CATEGORY_COUNT = 12
+    # 하루에 한 번만 제공되는 항목의 예보 시각 (TMN: 06시, TMX: 15시)
+    _DAILY_CATEGORY_HOURS = (6, 15)
 
-    def __init__(self, service_key: str):
-        super().__init__(service_key, "/1360000/VilageFcstInfoService_2.0/getVilageFcst")
+    def __init__(self, service_key: str, client: httpx.AsyncClient, limiter: asyncio.Semaphore):
+        super().__init__(service_key, "/1360000/VilageFcstInfoService_2.0/getVilageFcst", client, limiter)
 
     def get_published_at(self) -> datetime:
         """현재 시각 기준 단기예보의 발표 시각을 datetime으로 반환한다."""
         base_date, base_time = self._convert_time_to_forecast_time(datetime.now())
         return datetime.strptime(f"{base_date}{base_time}", "%Y%m%d%H%M")
 
-    def call(self, nx: int, ny: int, days: int) -> List[ShortForecastItem]:
+    async def call(self, nx: int, ny: int, days: int) -> List[ShortForecastItem]:
         if days > 4:
             days = 4
 
         today = date.today()
         base_date, base_time = self._convert_time_to_forecast_time(datetime.now())
+        end_date = (today + timedelta(days=days)).strftime("%Y%m%d")
 
-        end_date = today + timedelta(days=days)
-        prev_base_date: None | date = None
-        page = 1
-        raw_items: Dict[datetime, Dict[str, Any]] = collections.defaultdict(dict)
-
-        while True:
-            # While문 탈출 여부
-            if (
-                    prev_base_date is not None
-                    and prev_base_date > end_date
-            ):
-                break
-
-            # API 호출
-            response = httpx.get(self.url, params={
-                "serviceKey": self.service_key,
-                "dataType": "JSON",
-                "numOfRows": 500,
-                "pageNo": page,
-                "base_date": base_date,
-                "base_time": base_time,
-                "nx": nx,
-                "ny": ny,
-            })
-            response.raise_for_status()
-
-            # 데이터 수집
-            res_items: Dict | None = self._parse_response(response)
-            if not res_items:
-                break
-
-            items = res_items["item"]
-
-            for item in items:
-                forecast_date, forecast_time = item["fcstDate"], item["fcstTime"]
-                forecast_date_key = datetime.strptime(f"{forecast_date}{forecast_time}", "%Y%m%d%H%M")
-
-                category, value = item["category"], item["fcstValue"]
-                prev_base_date = forecast_date_key.date()
-                if prev_base_date > end_date:
-                    break
-
-                raw_items[forecast_date_key]["forecast_date"] = forecast_date_key
-
-                if category == "POP":
-                    raw_items[forecast_date_key]["rain_probability"] = int(value)
-                elif category == "PTY":
-                    raw_items[forecast_date_key]["rain_condition"] = DatagoShortForecastRainCondition.from_code(int(value))
-                elif category == "PCP":
-                    raw_items[forecast_date_key]["rain_amount"] = self._parse_precipitation(value)
-                elif category == "REH":
-                    raw_items[forecast_date_key]["humidity"] = int(value)
-                elif category == "SNO":
-                    raw_items[forecast_date_key]["snow_amount"] = self._parse_snow(value)
-                elif category == "SKY":
-                    raw_items[forecast_date_key]["sky_condition"] = DatagoShortForecastSkyCondition.from_code(int(value))
-                elif category == "TMP":
-                    raw_items[forecast_date_key]["temperature"] = int(value)
-                elif category == "TMN":
-                    raw_items[forecast_date_key]["min_temperature"] = math.floor(float(value))
-                elif category == "TMX":
-                    raw_items[forecast_date_key]["max_temperature"] = math.floor(float(value))
+        # 필요한 행 수를 계산해 한 페이지로 요청한다
+        num_of_rows = self._compute_num_of_rows(base_date, base_time, end_date)
+        total_count, items = await self._fetch_page(nx, ny, base_date, base_time, 1, num_of_rows)
 
+        raw_items: Dict[Tuple[str, str], Dict[str, str]] = {}
+        completed = not self._collect_items(raw_items, items, end_date)
+
+        # 계산한 행 수가 모자란 경우(항목 추가 등)에만 다음 페이지를 이어서 요청한다
+        page = 1
+        while not completed and page * num_of_rows < total_count:
             page += 1
+            _, items = await self._fetch_page(nx, ny, base_date, base_time, page, num_of_rows)
+            completed = not self._collect_items(raw_items, items, end_date)
 
-        return [
-            ShortForecastItem(**data)
-            for _, data in sorted(raw_items.items())
-        ]
+        return self._build_items(raw_items)
+
+    @classmethod
+    def _compute_num_of_rows(cls, base_date: str, base_time: str, end_date: str) -> int:
+        """발표 시각부터 end_date까지의 예보를 담는 데 필요한 행 수를 계산한다.
+
+        예보는 발표 시각 1시간 뒤부터 시각 순서대로 제공되며, 종료 판정을 위해 end_date 다음 날 0시까지 포함한다.
+        """
+        first = cls._to_datetime(base_date, base_time) + timedelta(hours=1)
+        last = cls._to_datetime(end_date, "0000") + timedelta(days=1)
+        if last < first:
+            return cls._HOURLY_CATEGORY_COUNT
+
+        hours = (last - first) // timedelta(hours=1) + 1
+        daily_rows = 0
+        day = first.replace(hour=0)
+        while day <= last:
+            daily_rows += sum(1 for hour in cls._DAILY_CATEGORY_HOURS if first <= day.replace(hour=hour) <= last)
+            day += timedelta(days=1)
+
+        return hours * cls._HOURLY_CATEGORY_COUNT + daily_rows
+
+    async def _fetch_page(
+            self, nx: int, ny: int, base_date: str, base_time: str, page: int, num_of_rows: int
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """단기예보 한 페이지를 조회한다.
+
+        Returns:
+            (전체 건수, 해당 페이지의 item 리스트)
+        """
+        response = await self._get({
+            "dataType": "JSON",
+            "numOfRows": num_of_rows,
+            "pageNo": page,
+            "base_date": base_date,
+            "base_time": base_time,
+            "nx": nx,
+            "ny": ny,
+        })
+
+        body = self._parse_body(response)
+        if not body or not body["items"]:
+            return 0, []
+        return int(body["totalCount"]), body["items"]["item"]
+
+    @staticmethod
+    def _collect_items(
+            raw_items: Dict[Tuple[str, str], Dict[str, str]], items: List[Dict[str, Any]], end_date: str
+    ) -> bool:
+        """item들의 값을 (fcstDate, fcstTime)별로 모은다. end_date를 넘어서는 항목을 만나면 False를 반환한다.
+
+        fcstDate, end_date는 모두 "YYYYMMDD" 형식이므로 날짜 비교는 문자열 비교로 충분하다.
+        값의 변환은 시각별 레코드를 만들 때 한 번만 수행한다.
+        """
+        for item in items:
+            forecast_date = item["fcstDate"]
+            if forecast_date > end_date:
+                return False
+
+            key = (forecast_date, item["fcstTime"])
+            values = raw_items.get(key)
+            if values is None:
+                values = raw_items[key] = {}
+            values[item["category"]] = item["fcstValue"]
+
+        return True
+
+    @classmethod
+    def _build_items(cls, raw_items: Dict[Tuple[str, str], Dict[str, str]]) -> List[ShortForecastItem]:
+        """시각별로 모은 값을 ShortForecastItem으로 변환한다. ("YYYYMMDD", "HHMM") 키는 문자열 정렬이 곧 시간순이다."""
+        rows = sorted(raw_items.items())
+        # 코드 값은 열 단위로 한 번에 변환한다
+        rain_conditions = DatagoShortForecastRainCondition.from_codes(values["PTY"] for _, values in rows)
+        sky_conditions = DatagoShortForecastSkyCondition.from_codes(values["SKY"] for _, values in rows)
+
+        results: List[ShortForecastItem] = []
+        for ((forecast_date, forecast_time), values), rain_condition, sky_condition in zip(
+                rows, rain_conditions, sky_conditions
+        ):
+            min_temperature = values.get("TMN")
+            max_temperature = values.get("TMX")
+            results.append(ShortForecastItem(
+                forecast_date=cls._to_datetime(forecast_date, forecast_time),
+                rain_probability=int(values["POP"]),
+                rain_condition=rain_condition,
+                rain_amount=cls._parse_precipitation(values["PCP"]),
+                humidity=int(values["REH"]),
+                snow_amount=cls._parse_snow(values["SNO"]),
+                sky_condition=sky_condition,
+                temperature=int(values["TMP"]),
+                min_temperature=math.floor(float(min_temperature)) if min_temperature is not None else None,
+                max_temperature=math.floor(float(max_temperature)) if max_temperature is not None else None,
+            ))
+        return results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _to_datetime(forecast_date: str, forecast_time: str) -> datetime:
+        """"YYYYMMDD", "HHMM" 문자열을 정수 연산으로 datetime으로 변환한다. (strptime 대비 빠르고, 결과를 캐싱한다)"""
+        ymd = int(forecast_date)
+        hm = int(forecast_time)
+        return datetime(ymd // 10000, ymd // 100 % 100, ymd % 100, hm // 100, hm % 100)
 
     @staticmethod
     def _parse_precipitation(value: str) -> float:
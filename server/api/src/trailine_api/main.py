@@ -1,11 +1,55 @@
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from trailine_api.common.async_utils import await_if_needed
+from trailine_api.common.cache import cache
 from trailine_api.common.logger import setup_logging
+from trailine_api.common.responses import PydanticJSONResponse
+from trailine_api.config import Config
 from trailine_api.container import Container
 from trailine_api.middlewares.request_logger import RequestLoggingMiddleware
 from trailine_api.routers import router as api_router
+from trailine_api.tasks.weather_prewarm import WeatherPrewarmScheduler
+from trailine_model.base import async_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container: Container = app.container  # type: ignore[attr-defined]
+
+    # 공용 HTTP 클라이언트 등 Resource 초기화
+    await await_if_needed(container.init_resources())
+
+    # 다른 워커가 보낸 워커 메모리(L1) 캐시 무효화 메시지 구독
+    if Config.REDIS_URL is not None:
+        await cache.start_invalidation_listener()
+
+    # 코스 연관 검색용 워커 메모리 카탈로그 인덱스 미리 만들기
+    if Config.COURSE_INDEX_ENABLED:
+        course_service = await await_if_needed(container.course_service())
+        await course_service.load_course_catalog_index()
+
+    # 기상청 발표 시각에 맞춘 예보 캐시 예열
+    prewarm_scheduler: WeatherPrewarmScheduler | None = None
+    if Config.WEATHER_PREWARM_ENABLED:
+        prewarm_scheduler = await await_if_needed(container.weather_prewarm_scheduler())
+        prewarm_scheduler.start()
+
+    try:
+        yield
+    finally:
+        if prewarm_scheduler is not None:
+            await prewarm_scheduler.stop()
+        await await_if_needed(container.shutdown_resources())
+        # 종료된 Resource를 물고 있는 Singleton을 비워 다음 lifespan에서 새로 생성되도록 한다
+        container.reset_singletons()
+        await cache.close()
+        # 워커 종료 시 비동기 DB 커넥션 풀 정리
+        await async_engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -18,6 +62,8 @@ def create_app() -> FastAPI:
         docs_url="/api/docs" if os.getenv("APP_ENV") != "prod" else None,
         redoc_url="/api/redoc" if os.getenv("APP_ENV") != "prod" else None,
         openapi_url="/api/openapi.json"  if os.getenv("APP_ENV") != "prod" else None,
+        lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
     )
     app.container = container  # type: ignore[attr-defined]
     app.add_middleware(RequestLoggingMiddleware)
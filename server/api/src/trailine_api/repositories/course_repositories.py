@@ -1,25 +1,28 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Sequence, List, Tuple
+from typing import Any, Optional, Sequence, List, Tuple
 
 from geoalchemy2.functions import ST_MakeLine, ST_StartPoint, ST_EndPoint, ST_LineInterpolatePoint, ST_Reverse
 from geoalchemy2.shape import to_shape
-from sqlalchemy import select, or_, func, cast, case, Integer, values, literal, literal_column
-from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy import RowMapping, Select, select, or_, func, cast, case, Integer, Text, values, literal, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, aggregate_order_by, array
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, aliased
-from sqlalchemy.orm import selectinload
-from trailine_api.common.types import SQLRowList, SQLRow, CourseLocationType
+from sqlalchemy.orm import defer, selectinload
+from trailine_api.common.types import SQLRowList, SQLRow, CourseLocationType, CourseSearchMode, SearchSortKey, TrackFormat
+from trailine_api.repositories.place_repositories import extract_place, select_place_columns
 from trailine_model.models.place import Place
 from trailine_model.models.course import (
     Course,
     CourseCourseInterval,
     CourseInterval,
+    CourseIntervalLod,
     CourseDifficulty,
     CourseStyle,
     CourseImage,
+    CourseSearchDocument,
 )
 
 
-
 class ICourseDifficultyRepository(metaclass=ABCMeta):
     @abstractmethod
     def get_course_difficulty_all(self, session: Session) -> Sequence[CourseDifficulty]:
@@ -44,9 +47,27 @@ class ICourseRepository(metaclass=ABCMeta):
             word: Optional[str],
             difficulties: Optional[List[int]],
             course_styles: Optional[List[int]],
-            page: int,
-            page_size: int
-    ) -> Tuple[int, Sequence[int]]:
+            limit: int,
+            offset: int = 0,
+            after: Optional[SearchSortKey] = None,
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> List[Tuple[int, SearchSortKey]]:
+        """
+        검색 순서대로 코스 아이디와 정렬 키를 가져오는 함수
+
+        after(이전 페이지 마지막 코스의 정렬 키)를 주면 그 다음 코스부터 가져온다. (keyset pagination)
+        """
+        pass
+
+    @abstractmethod
+    def count_courses_by_search(
+            self,
+            session: Session,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> int:
         pass
 
     @abstractmethod
@@ -56,6 +77,13 @@ class ICourseRepository(metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def get_all_course_list_information(self, session: Session) -> SQLRowList:
+        """
+        검색 가능한(검색 문서가 있는) 모든 코스의 리스트 조회 정보를 가져오는 함수 (워커 메모리 카탈로그 인덱스용)
+        """
+        pass
+
     @abstractmethod
     def get_course_detail(self, session: Session, course_id: int) -> Optional[SQLRow]:
         """
@@ -64,9 +92,23 @@ class ICourseRepository(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def get_intervals(self, session: Session, course_id: int) -> Tuple[List[CourseInterval], List[bool]]:
+    def get_intervals(
+            self, session: Session, course_id: int, lod_level: int = 0, track_format: TrackFormat = TrackFormat.POINTS
+    ) -> SQLRowList:
         """
         특정 코스에 대해 구간 정보 가져오는 구문
+
+        구간의 시작/끝 지점(장소)도 같은 쿼리에서 join해 가져오며, 진행 방향(is_reversed)에 맞춰 시작/끝을 정해서 돌려준다.
+
+        경로 좌표는 PostGIS에서 진행 방향 순서로 꺼내며, interval의 geom은 로드하지 않는다. (좌표마다 파이썬 객체를 만들지 않는다)
+        - track_format이 points면 응답 본문에 그대로 넣을 [{"lat", "lon", "ele"}, ...] JSON 텍스트 (points_json)
+        - 그 외(인코딩 형식)면 위도/경도/해발고도 배열 (coordinates, 해발고도가 없으면 0)
+        lod_level이 0보다 크면 미리 계산된 단순화 경로(CourseIntervalLod)를 사용하고, 없으면 원본 경로를 사용한다.
+
+        :return: [{"interval": CourseInterval, "is_reversed": bool,
+                   "points_json": Optional[str], "coordinates": Optional[Tuple[lat 리스트, lon 리스트, ele 리스트]],
+                   "start_place": SQLRow, "end_place": SQLRow}, ...]
+                 (장소 SQLRow의 형태는 IPlaceRepository.get_places_by_ids 참고)
         """
         pass
 
@@ -82,273 +124,696 @@ class ICourseRepository(metaclass=ABCMeta):
         pass
 
 
-class CourseDifficultyRepository(ICourseDifficultyRepository):
-    def get_course_difficulty_all(self, session: Session) -> Sequence[CourseDifficulty]:
-        stmt = select(CourseDifficulty).order_by(CourseDifficulty.level)
-        return session.execute(stmt).scalars().all()
-
-
-class CourseStyleRepository(ICourseStyleRepository):
-    def get_course_style_all(self, session: Session) -> Sequence[CourseStyle]:
-        stmt = select(CourseStyle)
-        return session.execute(stmt).scalars().all()
-
+class IAsyncCourseDifficultyRepository(metaclass=ABCMeta):
+    """ICourseDifficultyRepository의 비동기 버전"""
 
-class CourseRepository(ICourseRepository):
-    def get_course_location(self, session: Session, course_id: int, location_type: CourseLocationType) -> Optional[Tuple[float, float]]:
-        """RAW Query
-        WITH merged AS (
-            SELECT
-                ST_MakeLine(ci.geom ORDER BY cci.position) AS geom
-            FROM course_interval ci
-            JOIN course_course_interval cci ON cci.interval_id = ci.id
-            WHERE cci.course_id = :course_id
-        )
-        SELECT
-            ST_StartPoint(geom) AS start_point,
-            ST_LineInterpolatePoint(geom, 0.5) AS middle_point,
-            ST_EndPoint(geom) AS end_point
-        FROM merged;
-        """
+    @abstractmethod
+    async def get_course_difficulty_all(self, session: AsyncSession) -> Sequence[CourseDifficulty]:
+        pass
 
-        # is_reversed가 True이면 geom을 뒤집고, False이면 그대로 사용
-        oriented_geom = case(
-            (CourseCourseInterval.is_reversed.is_(True), ST_Reverse(CourseInterval.geom)),
-            else_=CourseInterval.geom
-        )
 
-        # CTE: ST_MakeLine으로 구간들을 position 순서대로 하나의 라인으로 병합
-        merged = (
-            select(
-                ST_MakeLine(
-                    aggregate_order_by(oriented_geom, CourseCourseInterval.position.asc()),
-                    type_=CourseInterval.geom.type
-                ).label("geom")
-            )
-            .join(CourseCourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
-            .where(CourseCourseInterval.course_id == course_id)
-            .cte("merged")
-        )
+class IAsyncCourseStyleRepository(metaclass=ABCMeta):
+    """ICourseStyleRepository의 비동기 버전"""
 
-        # location_type에 따라 적절한 포인트 함수 선택
-        point_func_map = {
-            CourseLocationType.START: ST_StartPoint(merged.c.geom),
-            CourseLocationType.MIDDLE: ST_LineInterpolatePoint(merged.c.geom, 0.5),
-            CourseLocationType.END: ST_EndPoint(merged.c.geom),
-        }
+    @abstractmethod
+    async def get_course_style_all(self, session: AsyncSession) -> Sequence[CourseStyle]:
+        pass
 
-        point_expr = point_func_map[location_type]
 
-        stmt = select(point_expr.label("geom"))
+class IAsyncCourseRepository(metaclass=ABCMeta):
+    """ICourseRepository의 비동기 버전 (각 메서드의 설명은 ICourseRepository 참고)"""
 
-        geom = session.execute(stmt).scalar()
-        if geom is None:
-            return None
+    @abstractmethod
+    async def get_course_location(
+            self, session: AsyncSession, course_id: int, location_type: CourseLocationType
+    ) -> Optional[Tuple[float, float]]:
+        pass
 
-        point = to_shape(geom)
-        return point.y, point.x
+    @abstractmethod
+    async def get_course_ids_by_search(
+            self,
+            session: AsyncSession,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            limit: int,
+            offset: int = 0,
+            after: Optional[SearchSortKey] = None,
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> List[Tuple[int, SearchSortKey]]:
+        pass
 
-    def get_course_ids_by_search(
+    @abstractmethod
+    async def count_courses_by_search(
             self,
-            session: Session,
+            session: AsyncSession,
             word: Optional[str],
             difficulties: Optional[List[int]],
             course_styles: Optional[List[int]],
-            page: int,
-            page_size: int
-    ) -> Tuple[int, Sequence[int]]:
-        # place_a, place_b를 조인하기 위해 별칭(alias)을 사용합니다.
-        place_a, place_b = aliased(Place), aliased(Place)
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> int:
+        pass
 
-        stmt = (
-            select(Course.id)
-            .join(CourseCourseInterval, CourseCourseInterval.course_id == Course.id)
-            .join(CourseInterval, CourseInterval.id == CourseCourseInterval.interval_id)
-            .join(place_a, CourseInterval.place_a_id == place_a.id)  # p1
-            .join(place_b, CourseInterval.place_b_id == place_b.id)  # p2
-        )
+    @abstractmethod
+    async def get_course_list_information(self, session: AsyncSession, course_id_list: Sequence[int]) -> SQLRowList:
+        pass
 
-        word_s: str = f"%{word}%" if word else ""
-        if word:
-            stmt = stmt.where(
-                or_(
-                    Course.name.like(word_s),
-                    place_a.land_address.like(word_s),
-                    place_b.land_address.like(word_s),
-                    place_a.road_address.like(word_s),
-                    place_b.road_address.like(word_s)
-                )
-            )
-        if difficulties:
-            stmt = stmt.where(Course.course_difficulty_id.in_(difficulties))
-        if course_styles:
-            stmt = stmt.where(Course.course_style_id.in_(course_styles))
+    @abstractmethod
+    async def get_all_course_list_information(self, session: AsyncSession) -> SQLRowList:
+        pass
 
-        # Course.id로 그룹화하고, 정렬 및 페이지네이션을 적용합니다.
-        stmt = (
-            stmt.group_by(Course.id)
-            .order_by(
-                # Course.name이 일치하는 경우를 우선 정렬합니다.
-                func.max(cast(Course.name.like(word_s), Integer)).desc(),
-                Course.id  # 2차 정렬
-            )
-        )
+    @abstractmethod
+    async def get_course_detail(self, session: AsyncSession, course_id: int) -> Optional[SQLRow]:
+        pass
+
+    @abstractmethod
+    async def get_intervals(
+            self, session: AsyncSession, course_id: int, lod_level: int = 0, track_format: TrackFormat = TrackFormat.POINTS
+    ) -> SQLRowList:
+        pass
 
-        total_count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = session.execute(total_count_stmt).scalar()
-        if not total:
-            total = 0
+    @abstractmethod
+    async def get_sum_of_length_and_duration(self, session: AsyncSession, course_id: int) -> Tuple[int, int]:
+        pass
 
-        stmt = stmt.limit(page_size).offset((page - 1) * page_size)
 
-        course_id_list: Sequence[int] = session.scalars(stmt).all()
-        return total, course_id_list
+# 아래 쿼리 빌더/결과 가공 함수는 동기(CourseRepository)와 비동기(AsyncCourseRepository) 구현이 함께 사용한다
 
-    def _build_course_information_query(self):
-        """
-        코스 리스트와 상세 정보 조회에 사용되는 공통 쿼리를 생성하는 헬퍼 메서드
-        """
-        place_a, place_b = aliased(Place), aliased(Place)
-
-        # corss join literal ... land_address
-        land_addr = values(
-            literal_column("land_addrs")
-        ).data(
-            [(place_a.land_address,), (place_b.land_address,)]
-        ).lateral("land_addr")
-
-        # cross join literal ... road_address
-        road_addr = values(
-            literal_column("road_addrs")
-        ).data(
-            [(place_a.road_address,), (place_b.road_address,)]
-        ).lateral("road_addr")
-
-        # Main Query
+
+def _build_course_difficulty_all_query() -> Select:
+    return select(CourseDifficulty).order_by(CourseDifficulty.level)
+
+
+def _build_course_style_all_query() -> Select:
+    return select(CourseStyle)
+
+
+def _build_course_location_query(course_id: int, location_type: CourseLocationType) -> Select:
+    """RAW Query
+    WITH merged AS (
+        SELECT
+            ST_MakeLine(ci.geom ORDER BY cci.position) AS geom
+        FROM course_interval ci
+        JOIN course_course_interval cci ON cci.interval_id = ci.id
+        WHERE cci.course_id = :course_id
+    )
+    SELECT
+        ST_StartPoint(geom) AS start_point,
+        ST_LineInterpolatePoint(geom, 0.5) AS middle_point,
+        ST_EndPoint(geom) AS end_point
+    FROM merged;
+    """
+
+    # is_reversed가 True이면 geom을 뒤집고, False이면 그대로 사용
+    oriented_geom = case(
+        (CourseCourseInterval.is_reversed.is_(True), ST_Reverse(CourseInterval.geom)),
+        else_=CourseInterval.geom
+    )
+
+    # CTE: ST_MakeLine으로 구간들을 position 순서대로 하나의 라인으로 병합
+    merged = (
+        select(
+            ST_MakeLine(
+                aggregate_order_by(oriented_geom, CourseCourseInterval.position.asc()),
+                type_=CourseInterval.geom.type
+            ).label("geom")
+        )
+        .join(CourseCourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
+        .where(CourseCourseInterval.course_id == course_id)
+        .cte("merged")
+    )
+
+    # location_type에 따라 적절한 포인트 함수 선택
+    point_func_map = {
+        CourseLocationType.START: ST_StartPoint(merged.c.geom),
+        CourseLocationType.MIDDLE: ST_LineInterpolatePoint(merged.c.geom, 0.5),
+        CourseLocationType.END: ST_EndPoint(merged.c.geom),
+    }
+
+    point_expr = point_func_map[location_type]
+
+    return select(point_expr.label("geom"))
+
+
+def _to_lat_lon(geom) -> Optional[Tuple[float, float]]:
+    if geom is None:
+        return None
+
+    point = to_shape(geom)
+    return point.y, point.x
+
+
+def _build_course_search_query(
+        word: Optional[str],
+        difficulties: Optional[List[int]],
+        course_styles: Optional[List[int]],
+        search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+) -> Select:
+    """
+    코스 검색 쿼리 (컬럼: 코스 아이디, 정렬 키 컬럼들)
+
+    정렬 키 컬럼은 모두 오름차순으로 정렬하며, 마지막 정렬 키는 코스 아이디다. (_build_course_search_page_query 참고)
+    """
+    if search_mode == CourseSearchMode.TRIGRAM:
+        return _build_course_trigram_search_query(word, difficulties, course_styles)
+    return _build_course_like_search_query(word, difficulties, course_styles)
+
+
+def _build_course_trigram_search_query(
+        word: Optional[str],
+        difficulties: Optional[List[int]],
+        course_styles: Optional[List[int]],
+) -> Select:
+    """
+    코스 검색 문서(CourseSearchDocument) 한 테이블만 읽는 코스 검색 쿼리
+
+    공개 코스만 검색되며, 코스명 / 주소 조건은 pg_trgm GIN 인덱스(ix_course_search_document_*_trgm)를 탄다.
+    - 코스명: 부분 일치(LIKE) 또는 단어 유사도(%>, 오타 허용)
+    - 주소: 부분 일치(LIKE)
+    정렬: 코스명 부분 일치 > 코스명 단어 유사도(word_similarity) > 코스 아이디
+    검색어가 2글자 이하이면 트라이그램을 만들 수 없어 인덱스 전체를 읽는다. (결과는 같다)
+    """
+    if not word:
+        stmt = select(CourseSearchDocument.course_id.label("id"))
+    else:
+        word_s = f"%{word}%"
         stmt = (
             select(
-                Course.id.label("id"),
-                Course.name.label("name"),
-                CourseDifficulty.id.label("difficulty_id"),
-                CourseDifficulty.level.label("difficulty_level"),
-                CourseDifficulty.code.label("difficulty_code"),
-                CourseDifficulty.name.label("difficulty_name"),
-                CourseStyle.id.label("course_style_id"),
-                CourseStyle.code.label("course_style_label"),
-                CourseStyle.name.label("course_style_name"),
-                land_addr.c.land_addrs.label("land_addresses"),
-                road_addr.c.road_addrs.label("road_addresses"),
+                CourseSearchDocument.course_id.label("id"),
+                case((CourseSearchDocument.name.like(word_s), 0), else_=1).label("match_rank"),
+                # word_similarity는 real(float4)이라 커서로 받은 값과 정확히 비교되도록 double precision으로 바꾼다
+                cast(-func.word_similarity(word, CourseSearchDocument.name), DOUBLE_PRECISION).label("similarity_rank"),
             )
-            .join(CourseCourseInterval, Course.id == CourseCourseInterval.course_id)
-            .join(CourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
-            .join(CourseDifficulty, Course.course_difficulty_id == CourseDifficulty.id)
-            .join(CourseStyle, Course.course_style_id == CourseStyle.id)
-            .join(place_a, CourseInterval.place_a_id == place_a.id)
-            .join(place_b, CourseInterval.place_b_id == place_b.id)
-            .join(land_addr, literal(True))
-            .join(road_addr, literal(True))
             .where(
-                Course.is_published.is_(True),
-                land_addr.c.land_addrs.is_not(None),
-                road_addr.c.road_addrs.is_not(None)
+                or_(
+                    CourseSearchDocument.name.like(word_s),
+                    CourseSearchDocument.name.op("%>")(word),
+                    CourseSearchDocument.address_text.like(word_s),
+                )
+            )
+        )
+
+    if difficulties:
+        stmt = stmt.where(CourseSearchDocument.course_difficulty_id.in_(difficulties))
+    if course_styles:
+        stmt = stmt.where(CourseSearchDocument.course_style_id.in_(course_styles))
+    return stmt
+
+
+def _build_course_like_search_query(
+        word: Optional[str],
+        difficulties: Optional[List[int]],
+        course_styles: Optional[List[int]],
+) -> Select:
+    # place_a, place_b를 조인하기 위해 별칭(alias)을 사용합니다.
+    place_a, place_b = aliased(Place), aliased(Place)
+
+    columns = [Course.id.label("id")]
+    if word:
+        # Course.name이 일치하는 경우를 우선 정렬합니다.
+        columns.append((1 - func.max(cast(Course.name.like(f"%{word}%"), Integer))).label("match_rank"))
+
+    stmt = (
+        select(*columns)
+        .join(CourseCourseInterval, CourseCourseInterval.course_id == Course.id)
+        .join(CourseInterval, CourseInterval.id == CourseCourseInterval.interval_id)
+        .join(place_a, CourseInterval.place_a_id == place_a.id)  # p1
+        .join(place_b, CourseInterval.place_b_id == place_b.id)  # p2
+    )
+
+    if word:
+        word_s = f"%{word}%"
+        stmt = stmt.where(
+            or_(
+                Course.name.like(word_s),
+                place_a.land_address.like(word_s),
+                place_b.land_address.like(word_s),
+                place_a.road_address.like(word_s),
+                place_b.road_address.like(word_s)
             )
         )
-        return stmt
+    if difficulties:
+        stmt = stmt.where(Course.course_difficulty_id.in_(difficulties))
+    if course_styles:
+        stmt = stmt.where(Course.course_style_id.in_(course_styles))
+
+    # Course.id로 그룹화합니다.
+    return stmt.group_by(Course.id)
+
+
+def course_search_sort_key_size(word: Optional[str], search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM) -> int:
+    """
+    검색 정렬 키 길이 (커서로 받은 정렬 키 검증용)
+    """
+    return len(_build_course_search_query(word, None, None, search_mode).selected_columns)
+
+
+def _build_course_search_page_query(
+        search: Select, limit: int, offset: int = 0, after: Optional[SearchSortKey] = None
+) -> Select:
+    """
+    검색 쿼리를 정렬 키 순서로 정렬해 한 페이지를 가져오는 쿼리
+
+    after를 주면 정렬 키가 after보다 큰 행부터 가져온다. (keyset pagination, OFFSET 없이 다음 페이지 조회)
+    """
+    subquery = search.subquery("search")
+    sort_keys = [*list(subquery.c)[1:], subquery.c.id]
+
+    stmt = select(subquery.c.id, *list(subquery.c)[1:]).order_by(*sort_keys)
+    if after is not None:
+        stmt = stmt.where(tuple_(*sort_keys) > tuple_(*[literal(value) for value in after]))
+    return stmt.limit(limit).offset(offset)
+
+
+def _to_search_results(rows: Sequence[Any]) -> List[Tuple[int, SearchSortKey]]:
+    return [(row[0], (*row[1:], row[0])) for row in rows]
+
+
+def _build_count_query(stmt: Select) -> Select:
+    return select(func.count()).select_from(stmt.subquery())
+
+
+def _build_course_information_query() -> Select:
+    """
+    코스 리스트와 상세 정보 조회에 사용되는 공통 쿼리를 생성하는 헬퍼 함수
+    """
+    place_a, place_b = aliased(Place), aliased(Place)
+
+    # corss join literal ... land_address
+    land_addr = values(
+        literal_column("land_addrs")
+    ).data(
+        [(place_a.land_address,), (place_b.land_address,)]
+    ).lateral("land_addr")
+
+    # cross join literal ... road_address
+    road_addr = values(
+        literal_column("road_addrs")
+    ).data(
+        [(place_a.road_address,), (place_b.road_address,)]
+    ).lateral("road_addr")
+
+    # Main Query
+    stmt = (
+        select(
+            Course.id.label("id"),
+            Course.name.label("name"),
+            CourseDifficulty.id.label("difficulty_id"),
+            CourseDifficulty.level.label("difficulty_level"),
+            CourseDifficulty.code.label("difficulty_code"),
+            CourseDifficulty.name.label("difficulty_name"),
+            CourseStyle.id.label("course_style_id"),
+            CourseStyle.code.label("course_style_label"),
+            CourseStyle.name.label("course_style_name"),
+            land_addr.c.land_addrs.label("land_addresses"),
+            road_addr.c.road_addrs.label("road_addresses"),
+        )
+        .join(CourseCourseInterval, Course.id == CourseCourseInterval.course_id)
+        .join(CourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
+        .join(CourseDifficulty, Course.course_difficulty_id == CourseDifficulty.id)
+        .join(CourseStyle, Course.course_style_id == CourseStyle.id)
+        .join(place_a, CourseInterval.place_a_id == place_a.id)
+        .join(place_b, CourseInterval.place_b_id == place_b.id)
+        .join(land_addr, literal(True))
+        .join(road_addr, literal(True))
+        .where(
+            Course.is_published.is_(True),
+            land_addr.c.land_addrs.is_not(None),
+            road_addr.c.road_addrs.is_not(None)
+        )
+    )
+    return stmt
+
+
+def _build_course_list_information_query(course_id_list: Sequence[int]) -> Select:
+    return _build_all_course_list_information_query().where(CourseSearchDocument.course_id.in_(course_id_list))
+
+
+def _build_all_course_list_information_query() -> Select:
+    """
+    코스 리스트 조회 쿼리 (코스 검색 문서에서 코스당 한 행, 주소는 중복 제외/정렬된 배열)
+    """
+    return (
+        select(
+            CourseSearchDocument.course_id.label("id"),
+            CourseSearchDocument.name.label("name"),
+            CourseDifficulty.id.label("difficulty_id"),
+            CourseDifficulty.level.label("difficulty_level"),
+            CourseDifficulty.code.label("difficulty_code"),
+            CourseDifficulty.name.label("difficulty_name"),
+            CourseStyle.id.label("course_style_id"),
+            CourseStyle.code.label("course_style_label"),
+            CourseStyle.name.label("course_style_name"),
+            CourseSearchDocument.land_addresses.label("land_addresses"),
+            CourseSearchDocument.road_addresses.label("road_addresses"),
+        )
+        .join(CourseDifficulty, CourseSearchDocument.course_difficulty_id == CourseDifficulty.id)
+        .join(CourseStyle, CourseSearchDocument.course_style_id == CourseStyle.id)
+    )
+
+
+def _build_course_images_query(course_id: int) -> Select:
+    return (
+        select(CourseImage)
+        .where(CourseImage.course_id == course_id)
+        .order_by(CourseImage.sort_order)
+    )
+
+
+def _build_length_and_duration_query(course_id: int) -> Select:
+    return (
+        select(
+            CourseInterval.length_m.label("length"),
+            CourseInterval.duration_ab_minutes.label("ab_duration"),
+            CourseInterval.duration_ba_minutes.label("ba_duration"),
+            CourseCourseInterval.is_reversed.label("is_reversed"),
+        )
+        .join(CourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
+        .where(CourseCourseInterval.course_id == course_id)
+    )
+
+
+def _sum_length_and_duration(rows: Sequence[RowMapping]) -> Tuple[int, int]:
+    total_length = 0
+    total_duration = 0
+
+    for row in rows:
+        total_length += row["length"]
+        total_duration += row["ab_duration"] if not row["is_reversed"] else row["ba_duration"]
+
+    return total_length, total_duration
+
+
+def _build_course_detail_query(course_id: int) -> Select:
+    base_stmt = _build_course_information_query().add_columns(
+        Course.description.label("description"),
+    )
+    return (
+        base_stmt
+        .where(Course.id == course_id)
+    )
+
+
+def _to_course_detail(rows: Sequence[RowMapping], images: Sequence[CourseImage]) -> SQLRow:
+    # Dict화
+    return {
+        "id": rows[0]["id"],
+        "name": rows[0]["name"],
+        "description": rows[0]["description"],
+        "land_addresses": list({row["land_addresses"] for row in rows}),
+        "road_addresses": list({row["road_addresses"] for row in rows}),
+        "difficulty": {
+            "id": rows[0]["difficulty_id"],
+            "code": rows[0]["difficulty_code"],
+            "level": rows[0]["difficulty_level"],
+            "name": rows[0]["difficulty_name"],
+        },
+        "course_style": {
+            "id": rows[0]["course_style_id"],
+            "code": rows[0]["course_style_label"],
+            "name": rows[0]["course_style_name"],
+        },
+        "images": [
+            {"title": img.title, "description": img.description, "url": img.url}
+            for img in images
+        ],
+    }
+
+
+def _oriented_points(geom):
+    """
+    구간 경로를 진행 방향으로 뒤집은 뒤 점으로 나누는 LATERAL ST_DumpPoints (컬럼: path, geom)
+    """
+    oriented_geom = case(
+        (CourseCourseInterval.is_reversed.is_(True), ST_Reverse(geom)),
+        else_=geom
+    )
+    return func.ST_DumpPoints(oriented_geom).table_valued("path", "geom").lateral("dp")
+
+
+def _build_interval_points_column(geom):
+    """
+    구간 경로의 좌표를 진행 방향 순서대로 [{"lat", "lon", "ele"}, ...] JSON 텍스트로 만드는 컬럼 (RAW Query)
+
+    (SELECT '[' || string_agg(format('{"lat":%s,"lon":%s,"ele":%s}', ST_Y(dp.geom), ST_X(dp.geom),
+                                     coalesce(ST_Z(dp.geom)::text, 'null')), ',' ORDER BY dp.path) || ']'
+     FROM LATERAL ST_DumpPoints(CASE WHEN cci.is_reversed THEN ST_Reverse(geom) ELSE geom END) AS dp)
+
+    :param geom: 좌표를 꺼낼 경로 (원본 ci.geom 또는 LOD 경로)
+    """
+    dumped = _oriented_points(geom)
+    point_json = func.format(
+        literal_column("""'{"lat":%s,"lon":%s,"ele":%s}'"""),
+        func.ST_Y(dumped.c.geom),
+        func.ST_X(dumped.c.geom),
+        func.coalesce(cast(func.ST_Z(dumped.c.geom), Text), literal_column("'null'")),
+    )
+
+    return (
+        select(
+            literal_column("'['")
+            .op("||")(func.string_agg(point_json, aggregate_order_by(literal_column("','"), dumped.c.path)))
+            .op("||")(literal_column("']'"))
+        )
+        .select_from(dumped)
+        .scalar_subquery()
+    )
+
+
+def _build_interval_coordinates_column(geom):
+    """
+    구간 경로의 좌표를 진행 방향 순서대로 [위도 배열, 경도 배열, 해발고도 배열] 2차원 배열로 만드는 컬럼 (RAW Query)
+
+    (SELECT ARRAY[coalesce(array_agg(ST_Y(dp.geom) ORDER BY dp.path), '{}'), ...경도, ...해발고도(없으면 0)]
+     FROM LATERAL ST_DumpPoints(CASE WHEN cci.is_reversed THEN ST_Reverse(geom) ELSE geom END) AS dp)
+
+    :param geom: 좌표를 꺼낼 경로 (원본 ci.geom 또는 LOD 경로)
+    """
+    dumped = _oriented_points(geom)
+    coordinates = [func.ST_Y(dumped.c.geom), func.ST_X(dumped.c.geom), func.coalesce(func.ST_Z(dumped.c.geom), 0)]
+
+    return (
+        select(
+            array([
+                func.coalesce(
+                    func.array_agg(aggregate_order_by(coordinate, dumped.c.path)),
+                    literal_column("'{}'::double precision[]"),
+                )
+                for coordinate in coordinates
+            ])
+        )
+        .select_from(dumped)
+        .scalar_subquery()
+    )
+
+
+def _build_intervals_query(course_id: int, lod_level: int = 0, track_format: TrackFormat = TrackFormat.POINTS) -> Select:
+    place_a, place_b = aliased(Place), aliased(Place)
+
+    # LOD가 아직 계산되지 않은 구간은 원본 경로로 대신한다
+    geom = func.coalesce(CourseIntervalLod.geom, CourseInterval.geom) if lod_level > 0 else CourseInterval.geom
+
+    stmt = (
+        select(
+            CourseInterval,
+            CourseCourseInterval.is_reversed.label("is_reversed"),
+            (
+                _build_interval_points_column(geom).label("points_json")
+                if track_format == TrackFormat.POINTS
+                else _build_interval_coordinates_column(geom).label("coordinates")
+            ),
+            *select_place_columns(place_a, "place_a__"),
+            *select_place_columns(place_b, "place_b__"),
+        )
+        .join(CourseCourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
+        .join(place_a, CourseInterval.place_a_id == place_a.id)
+        .join(place_b, CourseInterval.place_b_id == place_b.id)
+    )
+    if lod_level > 0:
+        stmt = stmt.outerjoin(
+            CourseIntervalLod,
+            (CourseIntervalLod.interval_id == CourseInterval.id) & (CourseIntervalLod.level == lod_level),
+        )
+
+    return (
+        stmt
+        .where(CourseCourseInterval.course_id == course_id)
+        # 좌표는 points_json / coordinates 컬럼으로 받으므로 원본 geometry(WKB)는 가져오지 않는다
+        .options(defer(CourseInterval.geom))
+        .options(selectinload(CourseInterval.images))
+        .options(selectinload(CourseInterval.difficulty))
+        .order_by(CourseCourseInterval.position)
+    )
+
+
+def _to_interval_rows(rows: Sequence[RowMapping]) -> SQLRowList:
+    results: SQLRowList = []
+    for row in rows:
+        place_a, place_b = extract_place(row, "place_a__"), extract_place(row, "place_b__")
+        is_reversed = row["is_reversed"]
+        # 좌표는 요청한 형식(track_format)에 맞는 컬럼 하나만 조회된다
+        points_json, coordinates = None, None
+        if "points_json" in row:
+            points_json = row["points_json"] or "[]"
+        else:
+            coordinates = _to_coordinates(row["coordinates"])
+
+        results.append({
+            "interval": row["CourseInterval"],
+            "is_reversed": is_reversed,
+            "points_json": points_json,
+            "coordinates": coordinates,
+            "start_place": place_a if not is_reversed else place_b,
+            "end_place": place_b if not is_reversed else place_a,
+        })
+    return results
+
+
+def _to_coordinates(value: Optional[List[List[float]]]) -> Tuple[List[float], List[float], List[float]]:
+    if not value:
+        return [], [], []
+    lat, lon, ele = value
+    return lat, lon, ele
+
+
+class CourseDifficultyRepository(ICourseDifficultyRepository):
+    def get_course_difficulty_all(self, session: Session) -> Sequence[CourseDifficulty]:
+        return session.execute(_build_course_difficulty_all_query()).scalars().all()
+
+
+class CourseStyleRepository(ICourseStyleRepository):
+    def get_course_style_all(self, session: Session) -> Sequence[CourseStyle]:
+        return session.execute(_build_course_style_all_query()).scalars().all()
+
+
+class CourseRepository(ICourseRepository):
+    def get_course_location(self, session: Session, course_id: int, location_type: CourseLocationType) -> Optional[Tuple[float, float]]:
+        geom = session.execute(_build_course_location_query(course_id, location_type)).scalar()
+        return _to_lat_lon(geom)
+
+    def get_course_ids_by_search(
+            self,
+            session: Session,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            limit: int,
+            offset: int = 0,
+            after: Optional[SearchSortKey] = None,
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> List[Tuple[int, SearchSortKey]]:
+        search = _build_course_search_query(word, difficulties, course_styles, search_mode)
+        rows = session.execute(_build_course_search_page_query(search, limit, offset, after)).all()
+        return _to_search_results(rows)
+
+    def count_courses_by_search(
+            self,
+            session: Session,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> int:
+        search = _build_course_search_query(word, difficulties, course_styles, search_mode)
+        return session.execute(_build_count_query(search)).scalar() or 0
 
     def get_course_list_information(self, session: Session, course_id_list: Sequence[int]) -> SQLRowList:
-        base_stmt = self._build_course_information_query()
-        stmt = base_stmt.where(Course.id.in_(course_id_list))
+        stmt = _build_course_list_information_query(course_id_list)
         results = [dict(row) for row in session.execute(stmt).mappings()]
         return results
 
+    def get_all_course_list_information(self, session: Session) -> SQLRowList:
+        stmt = _build_all_course_list_information_query()
+        return [dict(row) for row in session.execute(stmt).mappings()]
+
     def get_course_images(self, session: Session, course_id: int) -> Sequence[CourseImage]:
-        stmt = (
-            select(CourseImage)
-            .where(CourseImage.course_id == course_id)
-            .order_by(CourseImage.sort_order)
-        )
-        result = session.execute(stmt).scalars().all()
-        return result
+        return session.execute(_build_course_images_query(course_id)).scalars().all()
 
     def get_sum_of_length_and_duration(self, session: Session, course_id: int) -> Tuple[int, int]:
-        stmt = (
-            select(
-                CourseInterval.length_m.label("length"),
-                CourseInterval.duration_ab_minutes.label("ab_duration"),
-                CourseInterval.duration_ba_minutes.label("ba_duration"),
-                CourseCourseInterval.is_reversed.label("is_reversed"),
-            )
-            .join(CourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
-            .where(CourseCourseInterval.course_id == course_id)
-        )
+        rows = session.execute(_build_length_and_duration_query(course_id)).mappings().all()
+        return _sum_length_and_duration(rows)
 
-        rows = session.execute(stmt).mappings().all()
+    def get_course_detail(self, session: Session, course_id: int) -> Optional[SQLRow]:
+        rows = session.execute(_build_course_detail_query(course_id)).mappings().all()
+        if not rows:
+            return None
 
-        total_length = 0
-        total_duration = 0
+        return _to_course_detail(rows, self.get_course_images(session, course_id))
 
-        for row in rows:
-            total_length += row["length"]
-            total_duration += row["ab_duration"] if not row["is_reversed"] else row["ba_duration"]
+    def get_intervals(
+            self, session: Session, course_id: int, lod_level: int = 0, track_format: TrackFormat = TrackFormat.POINTS
+    ) -> SQLRowList:
+        rows = session.execute(_build_intervals_query(course_id, lod_level, track_format)).mappings().all()
+        return _to_interval_rows(rows)
 
-        return total_length, total_duration
 
-    def get_course_detail(self, session: Session, course_id: int) -> Optional[SQLRow]:
-        base_stmt = self._build_course_information_query().add_columns(
-            Course.description.label("description"),
-        )
-        stmt = (
-            base_stmt
-            .where(Course.id == course_id)
-        )
+class AsyncCourseDifficultyRepository(IAsyncCourseDifficultyRepository):
+    async def get_course_difficulty_all(self, session: AsyncSession) -> Sequence[CourseDifficulty]:
+        return (await session.execute(_build_course_difficulty_all_query())).scalars().all()
 
-        rows = session.execute(stmt).mappings().all()
-        if not rows:
-            return None
 
-        # Dict화
-        data: SQLRow = {
-            "id": rows[0]["id"],
-            "name": rows[0]["name"],
-            "description": rows[0]["description"],
-            "land_addresses": list({row["land_addresses"] for row in rows}),
-            "road_addresses": list({row["road_addresses"] for row in rows}),
-            "difficulty": {
-                "id": rows[0]["difficulty_id"],
-                "code": rows[0]["difficulty_code"],
-                "level": rows[0]["difficulty_level"],
-                "name": rows[0]["difficulty_name"],
-            },
-            "course_style": {
-                "id": rows[0]["course_style_id"],
-                "code": rows[0]["course_style_label"],
-                "name": rows[0]["course_style_name"],
-            },
-            "images": [
-                {"title": img.title, "description": img.description, "url": img.url}
-                for img in self.get_course_images(session, course_id)
-            ],
-        }
-
-        return data
-
-    def get_intervals(self, session: Session, course_id: int) -> Tuple[List[CourseInterval], List[bool]]:
-        stmt = (
-            select(CourseInterval, CourseCourseInterval.is_reversed.label("is_reversed"))
-            .join(CourseCourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
-            .where(CourseCourseInterval.course_id == course_id)
-            .options(selectinload(CourseInterval.images))
-            .options(selectinload(CourseInterval.difficulty))
-            .order_by(CourseCourseInterval.position)
-        )
+class AsyncCourseStyleRepository(IAsyncCourseStyleRepository):
+    async def get_course_style_all(self, session: AsyncSession) -> Sequence[CourseStyle]:
+        return (await session.execute(_build_course_style_all_query())).scalars().all()
 
-        intervals_and_is_reversed = session.execute(stmt).mappings().all()
 
-        intervals: List[CourseInterval] = []
-        is_reversed_list: List[bool] = []
+class AsyncCourseRepository(IAsyncCourseRepository):
+    async def get_course_location(
+            self, session: AsyncSession, course_id: int, location_type: CourseLocationType
+    ) -> Optional[Tuple[float, float]]:
+        geom = (await session.execute(_build_course_location_query(course_id, location_type))).scalar()
+        return _to_lat_lon(geom)
+
+    async def get_course_ids_by_search(
+            self,
+            session: AsyncSession,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            limit: int,
+            offset: int = 0,
+            after: Optional[SearchSortKey] = None,
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> List[Tuple[int, SearchSortKey]]:
+        search = _build_course_search_query(word, difficulties, course_styles, search_mode)
+        rows = (await session.execute(_build_course_search_page_query(search, limit, offset, after))).all()
+        return _to_search_results(rows)
+
+    async def count_courses_by_search(
+            self,
+            session: AsyncSession,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            search_mode: CourseSearchMode = CourseSearchMode.TRIGRAM,
+    ) -> int:
+        search = _build_course_search_query(word, difficulties, course_styles, search_mode)
+        return (await session.execute(_build_count_query(search))).scalar() or 0
+
+    async def get_course_list_information(self, session: AsyncSession, course_id_list: Sequence[int]) -> SQLRowList:
+        stmt = _build_course_list_information_query(course_id_list)
+        return [dict(row) for row in (await session.execute(stmt)).mappings()]
+
+    async def get_all_course_list_information(self, session: AsyncSession) -> SQLRowList:
+        stmt = _build_all_course_list_information_query()
+        return [dict(row) for row in (await session.execute(stmt)).mappings()]
+
+    async def get_course_images(self, session: AsyncSession, course_id: int) -> Sequence[CourseImage]:
+        return (await session.execute(_build_course_images_query(course_id))).scalars().all()
+
+    async def get_sum_of_length_and_duration(self, session: AsyncSession, course_id: int) -> Tuple[int, int]:
+        rows = (await session.execute(_build_length_and_duration_query(course_id))).mappings().all()
+        return _sum_length_and_duration(rows)
+
+    async def get_course_detail(self, session: AsyncSession, course_id: int) -> Optional[SQLRow]:
+        rows = (await session.execute(_build_course_detail_query(course_id))).mappings().all()
+        if not rows:
+            return None
 
-        for item in intervals_and_is_reversed:
-            intervals.append(item["CourseInterval"])
-            is_reversed_list.append(item["is_reversed"])
+        return _to_course_detail(rows, await self.get_course_images(session, course_id))
 
-        return intervals, is_reversed_list
+    async def get_intervals(
+            self, session: AsyncSession, course_id: int, lod_level: int = 0, track_format: TrackFormat = TrackFormat.POINTS
+    ) -> SQLRowList:
+        rows = (await session.execute(_build_intervals_query(course_id, lod_level, track_format))).mappings().all()
+        return _to_interval_rows(rows)
@@ -1,9 +1,14 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from sqlalchemy import select
+from geoalchemy2 import Geometry
+from geoalchemy2.functions import ST_X, ST_Y, ST_Z
+from sqlalchemy import Select, select, cast
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from trailine_api.common.types import SQLRow
 from trailine_model.models.place import Place
 
 
@@ -12,8 +17,86 @@ class IPlaceRepository(metaclass=ABCMeta):
     def get_place_by_instance(self, session: Session, place_id: int) -> Optional[Place]:
         pass
 
+    @abstractmethod
+    def get_places_by_ids(self, session: Session, place_ids: Iterable[int]) -> Dict[int, SQLRow]:
+        """
+        여러 장소를 한 번에 가져오는 함수
+
+        :param session: DB session
+        :param place_ids: 장소 아이디 목록
+        :return: {place_id: {"id", "name", "land_address", "road_address", "lat", "lon", "ele"}}, 없는 장소는 제외
+        """
+        pass
+
+
+class IAsyncPlaceRepository(metaclass=ABCMeta):
+    """IPlaceRepository의 비동기 버전"""
+
+    @abstractmethod
+    async def get_place_by_instance(self, session: AsyncSession, place_id: int) -> Optional[Place]:
+        pass
+
+    @abstractmethod
+    async def get_places_by_ids(self, session: AsyncSession, place_ids: Iterable[int]) -> Dict[int, SQLRow]:
+        pass
+
+
+def select_place_columns(place: Any, prefix: str = "") -> List[Any]:
+    """
+    장소 정보와 좌표(lat, lon, ele)를 SQL에서 바로 꺼내는 컬럼 목록 (다른 쿼리에 join해서 쓸 수 있도록 prefix를 붙인다)
+
+    :param place: Place 또는 aliased(Place)
+    :param prefix: 컬럼 label 접두사
+    """
+    point = cast(place.geom, Geometry(srid=4326))
+    return [
+        place.id.label(f"{prefix}id"),
+        place.name.label(f"{prefix}name"),
+        place.land_address.label(f"{prefix}land_address"),
+        place.road_address.label(f"{prefix}road_address"),
+        ST_Y(point).label(f"{prefix}lat"),
+        ST_X(point).label(f"{prefix}lon"),
+        ST_Z(point).label(f"{prefix}ele"),  # 해발고도가 없는 2차원 좌표면 NULL
+    ]
+
+
+def extract_place(row: RowMapping, prefix: str = "") -> SQLRow:
+    """select_place_columns로 조회한 행에서 장소 정보를 꺼낸다."""
+    return {
+        key: row[f"{prefix}{key}"]
+        for key in ("id", "name", "land_address", "road_address", "lat", "lon", "ele")
+    }
+
+
+def _build_place_query(place_id: int) -> Select:
+    return select(Place).filter(Place.id == place_id)
+
+
+def _build_places_query(place_ids: List[int]) -> Select:
+    return select(*select_place_columns(Place)).where(Place.id.in_(place_ids))
+
 
 class PlaceRepository(IPlaceRepository):
     def get_place_by_instance(self, session: Session, place_id: int) -> Optional[Place]:
-        stmt = select(Place).filter(Place.id == place_id)
-        return session.execute(stmt).scalar_one_or_none()
+        return session.execute(_build_place_query(place_id)).scalar_one_or_none()
+
+    def get_places_by_ids(self, session: Session, place_ids: Iterable[int]) -> Dict[int, SQLRow]:
+        place_ids = list(set(place_ids))
+        if not place_ids:
+            return {}
+
+        rows = session.execute(_build_places_query(place_ids)).mappings()
+        return {row["id"]: extract_place(row) for row in rows}
+
+
+class AsyncPlaceRepository(IAsyncPlaceRepository):
+    async def get_place_by_instance(self, session: AsyncSession, place_id: int) -> Optional[Place]:
+        return (await session.execute(_build_place_query(place_id))).scalar_one_or_none()
+
+    async def get_places_by_ids(self, session: AsyncSession, place_ids: Iterable[int]) -> Dict[int, SQLRow]:
+        place_ids = list(set(place_ids))
+        if not place_ids:
+            return {}
+
+        rows = (await session.execute(_build_places_query(place_ids))).mappings()
+        return {row["id"]: extract_place(row) for row in rows}
@@ -1,9 +1,12 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
-from sqlalchemy import select
+from geoalchemy2.functions import ST_X, ST_Y
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from trailine_api.common.types import SQLRow, SQLRowList
 from trailine_model.models.course import Course
 from trailine_model.models.forecast import KmaMidLandStatusArea, KmaMidLandTempArea
 
@@ -23,6 +26,99 @@ class IWeatherRepository(metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def get_course_weather_lookup(self, session: Session, course_id: int) -> Optional[SQLRow]:
+        """
+        특정 코스의 날씨 조회에 필요한 정보를 한번에 가져오는 함수
+
+        :param session: DB session
+        :param course_id: 코스 아이디
+        :return: {"status_code", "temp_code", "kma_grid_nx", "kma_grid_ny", "lat", "lon"}, 코스가 없으면 None
+                 (lat, lon은 미리 계산된 코스 중간 지점, 값이 없는 항목은 None)
+        """
+        pass
+
+    @abstractmethod
+    def get_published_course_forecast_targets(self, session: Session) -> SQLRowList:
+        """
+        공개된 모든 코스의 예보 조회 대상(중기예보 지역 코드, 기상청 격자, 코스 중간 지점 좌표)을 가져오는 함수
+
+        :param session: DB session
+        :return: [{"status_code", "temp_code", "kma_grid_nx", "kma_grid_ny", "lat", "lon"}, ...], 값이 없는 항목은 None
+        """
+        pass
+
+    @abstractmethod
+    def get_course_middle_points(self, session: Session, course_ids: Optional[Iterable[int]] = None) -> SQLRowList:
+        """
+        코스 중간 지점 좌표를 가져오는 함수 (중간 지점이 계산되지 않은 코스는 제외)
+
+        :param session: DB session
+        :param course_ids: 대상 코스 아이디 목록, None이면 전체 코스
+        :return: [{"id", "lat", "lon"}, ...]
+        """
+        pass
+
+    @abstractmethod
+    def update_course_kma_grids(self, session: Session, grids: Dict[int, Tuple[int, int]]) -> None:
+        """
+        코스별 기상청 격자를 저장하는 함수
+
+        :param session: DB session
+        :param grids: {course_id: (nx, ny)}
+        """
+        pass
+
+
+class IAsyncWeatherRepository(metaclass=ABCMeta):
+    """IWeatherRepository 중 API 조회 경로에서 사용하는 함수들의 비동기 버전 (각 메서드의 설명은 IWeatherRepository 참고)"""
+
+    @abstractmethod
+    async def get_course_weather_lookup(self, session: AsyncSession, course_id: int) -> Optional[SQLRow]:
+        pass
+
+    @abstractmethod
+    async def get_published_course_forecast_targets(self, session: AsyncSession) -> SQLRowList:
+        pass
+
+    @abstractmethod
+    async def update_course_kma_grids(self, session: AsyncSession, grids: Dict[int, Tuple[int, int]]) -> None:
+        pass
+
+
+# 아래 쿼리 빌더 함수는 동기(WeatherRepository)와 비동기(AsyncWeatherRepository) 구현이 함께 사용한다
+
+def _select_weather_lookup_columns() -> Select:
+    return (
+        select(
+            KmaMidLandStatusArea.code.label("status_code"),
+            KmaMidLandTempArea.code.label("temp_code"),
+            Course.kma_grid_nx.label("kma_grid_nx"),
+            Course.kma_grid_ny.label("kma_grid_ny"),
+            ST_Y(Course.middle_point).label("lat"),
+            ST_X(Course.middle_point).label("lon"),
+        )
+        .select_from(Course)
+        .outerjoin(KmaMidLandStatusArea, Course.kma_mid_land_status_area_id == KmaMidLandStatusArea.id)
+        .outerjoin(KmaMidLandTempArea, Course.kma_mid_land_temp_area_id == KmaMidLandTempArea.id)
+    )
+
+
+def _build_course_weather_lookup_query(course_id: int) -> Select:
+    return _select_weather_lookup_columns().where(Course.id == course_id)
+
+
+def _build_published_course_forecast_targets_query() -> Select:
+    return _select_weather_lookup_columns().where(Course.is_published.is_(True))
+
+
+def _build_course_kma_grid_params(grids: Dict[int, Tuple[int, int]]) -> SQLRowList:
+    # Primary Key 기준 ORM bulk update (executemany) 파라미터
+    return [
+        {"id": course_id, "kma_grid_nx": nx, "kma_grid_ny": ny}
+        for course_id, (nx, ny) in grids.items()
+    ]
+
 
 class WeatherRepository(IWeatherRepository):
     def get_mid_land_forecast_codes(
@@ -44,3 +140,51 @@ class WeatherRepository(IWeatherRepository):
             raise ValueError(f"Course not found: {course_id}")
 
         return row.status_code, row.temp_code
+
+    def get_course_weather_lookup(self, session: Session, course_id: int) -> Optional[SQLRow]:
+        row = session.execute(_build_course_weather_lookup_query(course_id)).mappings().one_or_none()
+        if row is None:
+            return None
+        return dict(row)
+
+    def get_published_course_forecast_targets(self, session: Session) -> SQLRowList:
+        stmt = _build_published_course_forecast_targets_query()
+        return [dict(row) for row in session.execute(stmt).mappings()]
+
+    def get_course_middle_points(self, session: Session, course_ids: Optional[Iterable[int]] = None) -> SQLRowList:
+        stmt = (
+            select(
+                Course.id.label("id"),
+                ST_Y(Course.middle_point).label("lat"),
+                ST_X(Course.middle_point).label("lon"),
+            )
+            .where(Course.middle_point.is_not(None))
+        )
+        if course_ids is not None:
+            stmt = stmt.where(Course.id.in_(list(course_ids)))
+
+        return [dict(row) for row in session.execute(stmt).mappings()]
+
+    def update_course_kma_grids(self, session: Session, grids: Dict[int, Tuple[int, int]]) -> None:
+        if not grids:
+            return
+
+        session.execute(update(Course), _build_course_kma_grid_params(grids))
+
+
+class AsyncWeatherRepository(IAsyncWeatherRepository):
+    async def get_course_weather_lookup(self, session: AsyncSession, course_id: int) -> Optional[SQLRow]:
+        row = (await session.execute(_build_course_weather_lookup_query(course_id))).mappings().one_or_none()
+        if row is None:
+            return None
+        return dict(row)
+
+    async def get_published_course_forecast_targets(self, session: AsyncSession) -> SQLRowList:
+        stmt = _build_published_course_forecast_targets_query()
+        return [dict(row) for row in (await session.execute(stmt)).mappings()]
+
+    async def update_course_kma_grids(self, session: AsyncSession, grids: Dict[int, Tuple[int, int]]) -> None:
+        if not grids:
+            return
+
+        await session.execute(update(Course), _build_course_kma_grid_params(grids))
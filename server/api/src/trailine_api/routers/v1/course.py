@@ -6,6 +6,9 @@ from fastapi import APIRouter, Query, Path
 from fastapi import status, HTTPException
 from fastapi.params import Depends
 
+from trailine_api.common.cursor import InvalidCursorError
+from trailine_api.common.responses import RawJSONResponse
+from trailine_api.common.types import TrackFormat
 from trailine_api.container import Container
 from trailine_api.schemas.course import (
     CourseSearchResponseSchema,
@@ -48,20 +51,44 @@ async def get_courses(
     ),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100, alias="pageSize"),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=512,
+        description=(
+            "이전 응답의 nextCursor (주면 page 대신 그 다음 코스부터 조회). "
+            "검색 조건이 다르거나 서버의 검색 방식이 바뀌어 쓸 수 없는 커서는 400으로 응답하며, 이때는 cursor 없이 다시 조회한다."
+        ),
+    ),
+    include_total: bool = Query(
+        True,
+        alias="includeTotal",
+        description="전체 검색 개수 포함 여부 (커서로 다음 페이지를 넘길 때는 false 권장)",
+    ),
 ):
-    total_count, courses = course_service.get_courses(
-        word,
-        difficulty,
-        course_style,
-        page,
-        page_size
-    )
+    try:
+        total_count, courses, next_cursor = await course_service.get_courses(
+            word,
+            difficulty,
+            course_style,
+            page,
+            page_size,
+            cursor,
+            include_total,
+        )
+    except InvalidCursorError:
+        # 커서는 만든 검색 조건/검색 방식에서만 쓸 수 있다 (검색 방식이 바뀐 경우 포함)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못되었거나 더 이상 쓸 수 없는 커서입니다. cursor 없이 첫 페이지부터 다시 조회해주세요.",
+        )
+
     return CourseSearchResponseSchema(
         page=page,
         pageSize=page_size,
         total=total_count,
-        totalPages=math.ceil(total_count / page_size),
+        totalPages=math.ceil(total_count / page_size) if total_count is not None else None,
         courses=courses,
+        nextCursor=next_cursor,
     )
 
 
@@ -75,7 +102,7 @@ async def get_courses(
 async def list_course_difficuity(
     course_service: Annotated[ICourseService, Depends(Provide[Container.course_service])],
 ):
-    return course_service.get_course_difficulty_list()
+    return RawJSONResponse(content=await course_service.get_course_difficulty_list_body())
 
 
 @router.get(
@@ -88,7 +115,7 @@ async def list_course_difficuity(
 async def list_course_style(
     course_service: Annotated[ICourseService, Depends(Provide[Container.course_service])],
 ):
-    return course_service.get_course_style_list()
+    return RawJSONResponse(content=await course_service.get_course_style_list_body())
 
 
 @router.get(
@@ -102,10 +129,10 @@ async def get_course_detail(
     course_service: Annotated[ICourseService, Depends(Provide[Container.course_service])],
     course_id: int = Path(..., description="코스 고유 아이디"),
 ):
-    course = course_service.get_course_detail(course_id)
-    if not course:
+    body = await course_service.get_course_detail_body(course_id)
+    if body is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="코스를 찾을 수 없습니다.")
-    return course
+    return RawJSONResponse(content=body)
 
 
 @router.get(
@@ -118,19 +145,30 @@ async def get_course_detail(
 async def get_course_intervals(
     course_service: Annotated[ICourseService, Depends(Provide[Container.course_service])],
     course_id: int = Path(..., description="코스 고유 아이디"),
+    track_format: TrackFormat = Query(
+        TrackFormat.POINTS,
+        alias="trackFormat",
+        description=(
+            "경로 좌표 형식. points: points 필드에 좌표 객체 리스트, "
+            "polyline/delta: track 필드에 압축된 경로 (디코딩 규약은 trailine_api.common.track 참고)"
+        ),
+    ),
+    zoom: Optional[int] = Query(
+        None,
+        ge=0,
+        le=22,
+        description="지도 줌 레벨. 지정하면 줌에 맞게 단순화된 경로를 돌려준다 (미지정 시 원본 경로)",
+    ),
 ):
-    intervals = course_service.get_course_intervals(course_id)
+    body = await course_service.get_course_intervals_body(course_id, track_format, zoom)
 
-    if not intervals:
+    if body is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 코스에 대한 구간을 찾을 수 없어요."
         )
 
-    return GettingCourseIntervalResponseSchema(
-        intervalCount=len(intervals),
-        intervals=intervals,
-    )
+    return RawJSONResponse(content=body)
 
 
 @router.get(
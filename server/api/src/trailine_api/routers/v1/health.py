@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Response
 from starlette import status
 
+from trailine_api.common.cache import cache
+
 
 router = APIRouter()
 
@@ -8,3 +10,11 @@ router = APIRouter()
 @router.get("")
 async def health_check():
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/cache")
+async def cache_stats():
+    """
+    워커 메모리(L1) 캐시 적중/미스/제거 횟수 (요청을 처리한 워커 기준, L1 미사용 시 local은 null)
+    """
+    return {"local": cache.local_cache_stats()}
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from trailine_api.common.types import TrackFormat
 from trailine_api.schemas.place import PlaceSchema
 from trailine_api.schemas.point import PointSchema
 
@@ -36,9 +37,10 @@ class CourseSearchSchema(BaseModel):
 class CourseSearchResponseSchema(BaseModel):
     page: int = Field(..., description="페이지 번호 (1번부터 시작)")
     page_size: int = Field(..., alias="pageSize", description="페이지 크기 (검색 개수)")
-    total: int = Field(..., description="전체 검색 개수")
-    total_pages: int = Field(..., alias="totalPages", description="전체 페이지 개수")
+    total: Optional[int] = Field(..., description="전체 검색 개수 (includeTotal=false면 null)")
+    total_pages: Optional[int] = Field(..., alias="totalPages", description="전체 페이지 개수 (includeTotal=false면 null)")
     courses: List[CourseSearchSchema] = Field(..., description="검색된 코스")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="다음 페이지 커서 (마지막 페이지면 null)")
 
 
 class CourseDetailSchema(BaseModel):
@@ -67,6 +69,17 @@ class CourseIntervalDifficultySchema(BaseModel):
     level: int = Field(..., description="난이도 수치")
 
 
+class EncodedTrackSchema(BaseModel):
+    format: TrackFormat = Field(..., description="인코딩 형식 (polyline, delta)")
+    precision: int = Field(..., description="위경도 소수점 자리수 (값 / 10^precision)")
+    ele_precision: int = Field(..., alias="elePrecision", description="해발고도 소수점 자리수 (값 / 10^elePrecision)")
+    count: int = Field(..., description="포인트 수")
+    polyline: Optional[str] = Field(None, description="해발고도를 포함한 Encoded Polyline (format=polyline)")
+    lat: Optional[List[int]] = Field(None, description="위도 delta 배열 (format=delta)")
+    lon: Optional[List[int]] = Field(None, description="경도 delta 배열 (format=delta)")
+    ele: Optional[List[int]] = Field(None, description="해발고도 delta 배열 (format=delta)")
+
+
 class CourseIntervalSchema(BaseModel):
     name: str = Field(..., description="구간명")
     description: Optional[str] = Field(..., description="설명")
@@ -74,7 +87,8 @@ class CourseIntervalSchema(BaseModel):
     difficulty: CourseIntervalDifficultySchema = Field(..., description="난이도 정보")
     start_place: PlaceSchema = Field(...,alias="startPlace", description="시작지점")
     end_place: PlaceSchema = Field(..., alias="endPlace", description="종료지점")
-    points: List[PointSchema] = Field(..., description="포인트(위경도) 경로")
+    points: Optional[List[PointSchema]] = Field(None, description="포인트(위경도) 경로 (trackFormat=points)")
+    track: Optional[EncodedTrackSchema] = Field(None, description="압축된 경로 (trackFormat=polyline, delta)")
     length: float = Field(..., description="길이 (km)")
     duration: int = Field(..., description="소요시간 (분)")
 
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -33,17 +34,53 @@ class WeatherForecastResponseSchema(BaseModel):
     forecasts: List[WeatherForecastItemSchema] = Field(..., description="일기예보 리스트")
 
 
-class ShortForecastItem(BaseModel):
-    forecast_date: datetime = Field(..., description="에보 시점")
-    rain_probability: int = Field(..., description="강수 확률 (%)")
-    rain_condition: DatagoShortForecastRainCondition = Field(..., description="강수 형태")
-    rain_amount: float = Field(..., description="시간당 강수량 (mm)")
-    humidity: int = Field(..., description="습도 (%)")
-    snow_amount: float = Field(..., description="적설량 (cm)")
-    sky_condition: DatagoShortForecastSkyCondition = Field(..., description="하늘 상태")
-    temperature: int = Field(..., description="기온 (°C)")
-    min_temperature: Optional[int] = Field(default=None, description="일 최저기온 (°C) (0600만 있음)")
-    max_temperature: Optional[int] = Field(default=None, description="일 최고기온 (°C) (0600만 있음)")
+@dataclass(slots=True)
+class ShortForecastItem:
+    """단기예보 시간별 레코드
+
+    응답 한 페이지에서 수백 개씩 만들어지므로, 검증 비용이 있는 pydantic 모델 대신 slots dataclass를 사용한다.
+    """
+    forecast_date: datetime  # 예보 시점
+    rain_probability: int  # 강수 확률 (%)
+    rain_condition: DatagoShortForecastRainCondition  # 강수 형태
+    rain_amount: float  # 시간당 강수량 (mm)
+    humidity: int  # 습도 (%)
+    snow_amount: float  # 적설량 (cm)
+    sky_condition: DatagoShortForecastSkyCondition  # 하늘 상태
+    temperature: int  # 기온 (°C)
+    min_temperature: Optional[int] = None  # 일 최저기온 (°C) (0600만 있음)
+    max_temperature: Optional[int] = None  # 일 최고기온 (°C) (1500만 있음)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """캐시 저장용 JSON 호환 dict로 변환한다."""
+        return {
+            "forecast_date": self.forecast_date.isoformat(),
+            "rain_probability": self.rain_probability,
+            "rain_condition": self.rain_condition.value,
+            "rain_amount": self.rain_amount,
+            "humidity": self.humidity,
+            "snow_amount": self.snow_amount,
+            "sky_condition": self.sky_condition.value,
+            "temperature": self.temperature,
+            "min_temperature": self.min_temperature,
+            "max_temperature": self.max_temperature,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ShortForecastItem":
+        """to_dict()로 저장한 dict에서 레코드를 복원한다."""
+        return cls(
+            forecast_date=datetime.fromisoformat(data["forecast_date"]),
+            rain_probability=data["rain_probability"],
+            rain_condition=DatagoShortForecastRainCondition(data["rain_condition"]),
+            rain_amount=data["rain_amount"],
+            humidity=data["humidity"],
+            snow_amount=data["snow_amount"],
+            sky_condition=DatagoShortForecastSkyCondition(data["sky_condition"]),
+            temperature=data["temperature"],
+            min_temperature=data.get("min_temperature"),
+            max_temperature=data.get("max_temperature"),
+        )
 
 
 class MidLandForecastItem(BaseModel):
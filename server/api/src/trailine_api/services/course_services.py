@@ -1,16 +1,25 @@
+import bisect
+import hashlib
+import json
+import logging
 import math
 from abc import ABCMeta, abstractmethod
-from typing import Optional, List, cast, Tuple, Dict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, List, TypeVar, cast, Tuple
+
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from geoalchemy2.shape import to_shape
-from sqlalchemy.orm import Session
 
 from trailine_api.repositories.course_repositories import (
-    ICourseRepository,
-    ICourseDifficultyRepository,
-    ICourseStyleRepository
+    IAsyncCourseRepository,
+    IAsyncCourseDifficultyRepository,
+    IAsyncCourseStyleRepository,
+    course_search_sort_key_size,
 )
-from trailine_api.repositories.place_repositories import IPlaceRepository
+from trailine_api.repositories.place_repositories import IAsyncPlaceRepository
 from trailine_api.schemas.course import (
     CourseSearchSchema,
     CourseDifficultySchema,
@@ -19,74 +28,190 @@ from trailine_api.schemas.course import (
     CourseImageSchema,
     CourseIntervalSchema,
     CourseIntervalImageSchema,
-    CourseIntervalDifficultySchema
+    CourseIntervalDifficultySchema,
+    EncodedTrackSchema,
 )
 from trailine_api.schemas.place import PlaceSchema
 from trailine_api.schemas.point import PointSchema
-from trailine_api.common.db import session_scope
-from trailine_model.models.place import Place
+from trailine_api.common.cache import RedisCache
+from trailine_api.common.catalog_index import CatalogDocument, CatalogIndex, CatalogIndexHolder
+from trailine_api.common.cursor import decode_cursor, encode_cursor
+from trailine_api.common.db import async_session_scope
+from trailine_api.common.track import (
+    COORDINATE_PRECISION,
+    ELEVATION_PRECISION,
+    delta_encode,
+    encode_polyline,
+    lod_level_for_zoom,
+)
+from trailine_api.common.types import CourseSearchMode, SQLRow, SearchSortKey, TrackFormat
+from trailine_api.config import Config
+from trailine_model.cache import COURSE_CATALOG_VERSION_KEY
 from trailine_model.models.course import CourseInterval
 
+_logger = logging.getLogger(__name__)
+
+# 응답 스키마나 저장 형식이 바뀌어 이전 배포의 캐시와 호환되지 않으면 올린다
+COURSE_CACHE_KEY_PREFIX = "course:response:3"
+
+_COURSE_DETAIL_ADAPTER = TypeAdapter(CourseDetailSchema)
+_COURSE_INTERVAL_ADAPTER = TypeAdapter(CourseIntervalSchema)
+_POINT_LIST_ADAPTER = TypeAdapter(List[PointSchema])
+_COURSE_DIFFICULTY_LIST_ADAPTER = TypeAdapter(List[CourseDifficultySchema])
+_COURSE_STYLE_LIST_ADAPTER = TypeAdapter(List[CourseStyleSchema])
+
+T = TypeVar("T")
+
 
 class ICourseService(metaclass=ABCMeta):
-    _course_repository: ICourseRepository
-    _course_difficulty_repository: ICourseDifficultyRepository
-    _course_style_repository: ICourseStyleRepository
-    _place_repository: IPlaceRepository
+    _cache: RedisCache
+    _course_repository: IAsyncCourseRepository
+    _course_difficulty_repository: IAsyncCourseDifficultyRepository
+    _course_style_repository: IAsyncCourseStyleRepository
+    _place_repository: IAsyncPlaceRepository
+    _course_catalog_index: CatalogIndexHolder[CourseSearchSchema]
 
     def __init__(
             self,
-            course_repository: ICourseRepository,
-            place_repository: IPlaceRepository,
-            course_difficulty_repository: ICourseDifficultyRepository,
-            course_style_repository: ICourseStyleRepository
+            cache: RedisCache,
+            course_repository: IAsyncCourseRepository,
+            place_repository: IAsyncPlaceRepository,
+            course_difficulty_repository: IAsyncCourseDifficultyRepository,
+            course_style_repository: IAsyncCourseStyleRepository,
+            course_catalog_index: CatalogIndexHolder[CourseSearchSchema],
     ):
+        self._cache = cache
         self._course_repository = course_repository
         self._place_repository = place_repository
         self._course_difficulty_repository = course_difficulty_repository
         self._course_style_repository = course_style_repository
+        self._course_catalog_index = course_catalog_index
 
     @abstractmethod
-    def get_courses(
+    async def get_courses(
             self,
             word: Optional[str],
             difficulties: Optional[List[int]],
             course_styles: Optional[List[int]],
             page: int,
-            page_size: int
-    ) -> Tuple[int, List[CourseSearchSchema]]:
+            page_size: int,
+            cursor: Optional[str] = None,
+            include_total: bool = True,
+    ) -> Tuple[Optional[int], List[CourseSearchSchema], Optional[str]]:
+        """
+        코스 검색
+
+        cursor(이전 응답의 nextCursor)를 주면 page 대신 그 다음 코스부터 가져온다. (keyset pagination)
+        include_total이 False면 전체 개수를 세지 않는다.
+
+        :return: (전체 검색 개수 또는 None, 검색된 코스, 다음 페이지 커서 (마지막 페이지면 None))
+        :raises InvalidCursorError: 잘못되었거나 다른 검색 조건에서 만든 커서
+        """
         pass
 
     @abstractmethod
-    def get_course_detail(self, course_id: int) -> Optional[CourseDetailSchema]:
+    async def load_course_catalog_index(self) -> None:
+        """
+        워커 메모리 코스 카탈로그 인덱스를 미리 만드는 함수 (COURSE_INDEX_ENABLED일 때 앱 시작 시 호출)
+        """
         pass
 
     @abstractmethod
-    def get_course_intervals(self, course_id: int) -> Optional[List[CourseIntervalSchema]]:
+    async def get_course_detail(self, course_id: int) -> Optional[CourseDetailSchema]:
         pass
 
     @abstractmethod
-    def get_course_difficulty_list(self) -> List[CourseDifficultySchema]:
+    async def get_course_intervals(
+            self, course_id: int, track_format: TrackFormat = TrackFormat.POINTS, zoom: Optional[int] = None
+    ) -> Optional[List[CourseIntervalSchema]]:
         pass
 
     @abstractmethod
-    def get_course_style_list(self) -> List[CourseStyleSchema]:
+    async def get_course_difficulty_list(self) -> List[CourseDifficultySchema]:
+        pass
+
+    @abstractmethod
+    async def get_course_style_list(self) -> List[CourseStyleSchema]:
+        pass
+
+    # 아래 *_body 함수는 위 조회 결과를 API 응답 JSON 본문(bytes)으로 돌려주며, 캐시를 거친다
+
+    @abstractmethod
+    async def get_course_detail_body(self, course_id: int) -> Optional[bytes]:
+        """
+        코스 상세 응답 본문 (CourseDetailSchema), 코스가 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def get_course_intervals_body(
+            self, course_id: int, track_format: TrackFormat = TrackFormat.POINTS, zoom: Optional[int] = None
+    ) -> Optional[bytes]:
+        """
+        코스 구간 응답 본문 (GettingCourseIntervalResponseSchema), 구간이 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def get_course_difficulty_list_body(self) -> bytes:
+        pass
+
+    @abstractmethod
+    async def get_course_style_list_body(self) -> bytes:
         pass
 
 
 class CourseService(ICourseService):
-    def get_courses(
+    async def get_courses(
             self,
             word: Optional[str],
             difficulties: Optional[List[int]],
             course_styles: Optional[List[int]],
             page: int,
-            page_size: int
-    ) -> Tuple[int, List[CourseSearchSchema]]:
-        with session_scope() as session:
-            total_count, course_id_list = self._course_repository.get_course_ids_by_search(
-                session, word, difficulties, course_styles, page, page_size
-            )
+            page_size: int,
+            cursor: Optional[str] = None,
+            include_total: bool = True,
+    ) -> Tuple[Optional[int], List[CourseSearchSchema], Optional[str]]:
+        difficulties, course_styles = _normalize_ids(difficulties), _normalize_ids(course_styles)
+        offset = (page - 1) * page_size
+
+        if Config.COURSE_INDEX_ENABLED:
+            index = await self._get_course_catalog_index()
+            if index is not None:
+                scope = _course_search_scope("index", word, difficulties, course_styles)
+                after = decode_cursor(cursor, scope, index.sort_key_size(word)) if cursor else None
+                total, matched = index.search(
+                    word, difficulties, course_styles, page_size + 1, 0 if after else offset, after
+                )
+                courses, next_cursor = _split_page(scope, matched, page_size)
+                return (total if include_total else None), courses, next_cursor
+
+        search_mode = Config.COURSE_SEARCH_MODE
+        scope = _course_search_scope(search_mode, word, difficulties, course_styles)
+        after = decode_cursor(cursor, scope, course_search_sort_key_size(word, search_mode)) if cursor else None
+
+        async with async_session_scope() as session:
+            cached = await self._get_cached_course_search(session, scope, word, difficulties, course_styles, search_mode)
+
+            # 다음 페이지가 있는지 알기 위해 한 건 더 가져온다
+            if cached is not None and cached.keys is not None:
+                start = bisect.bisect_right(cached.keys, list(after)) if after else offset
+                search_result = [(int(key[-1]), tuple(key)) for key in cached.keys[start:start + page_size + 1]]
+            else:
+                search_result = await self._course_repository.get_course_ids_by_search(
+                    session, word, difficulties, course_styles, page_size + 1, 0 if after else offset, after, search_mode
+                )
+
+            if not include_total:
+                total_count = None
+            elif cached is not None:
+                total_count = cached.total
+            else:
+                total_count = await self._course_repository.count_courses_by_search(
+                    session, word, difficulties, course_styles, search_mode
+                )
+
+            course_id_list, next_cursor = _split_page(scope, search_result, page_size)
             data_size = len(course_id_list)
             result_index_map = {
                 course_id: idx
@@ -94,57 +219,136 @@ class CourseService(ICourseService):
             }
 
             # 조회된 코스 고유 아이디에 대해 데이터 가져오기
-            raw_result = self._course_repository.get_course_list_information(session, course_id_list)
+            raw_result = await self._course_repository.get_course_list_information(session, course_id_list)
 
-        # CourseSearchSchema 리스트로 포매팅 및 정렬
-        # 1. 최종 결과를 담을 리스트를 course_id_list 크기만큼 None으로 초기화
+        # CourseSearchSchema 리스트로 포매팅 (코스당 한 행이며, 주소는 중복 제외/정렬되어 있다)
+        # 검색 순서(course_id_list)대로 담기 위해 인덱스 위치에 넣는다
         formatted_results: List[Optional[CourseSearchSchema]] = [None] * data_size
-
-        # 2. raw_result를 순회하며 데이터 가공
         for row in raw_result:
-            course_id = row["id"]
-            # 3. result_index_map을 사용해 현재 코스가 위치할 인덱스를 찾음
-            idx = result_index_map[course_id]
-            # 4. 해당 인덱스에 객체가 없으면 새로 생성
-            if formatted_results[idx] is None:
-                formatted_results[idx] = CourseSearchSchema(
+            formatted_results[result_index_map[row["id"]]] = _to_course_search_schema(row)
+
+        return total_count, [item for item in formatted_results if item is not None], next_cursor
+
+    async def _get_cached_course_search(
+            self,
+            session: AsyncSession,
+            scope: str,
+            word: Optional[str],
+            difficulties: Optional[List[int]],
+            course_styles: Optional[List[int]],
+            search_mode: CourseSearchMode,
+    ) -> Optional["_CourseSearchCache"]:
+        """
+        검색 조건별 정렬 키 목록과 전체 개수 read-through 캐시
+
+        키에 코스 카탈로그 버전을 넣어 코스 데이터가 바뀌면 이전 결과는 읽히지 않는다.
+        목록이 있으면 페이지는 목록을 잘라 만들고(DB 검색 없음), 너무 크면 전체 개수만 캐시한다.
+        캐시를 쓰지 않거나 Redis 오류면 None (DB에서 검색/개수 조회)
+        """
+        if not Config.COURSE_CACHE_ENABLED or Config.REDIS_URL is None:
+            return None
+
+        try:
+            version = await self._get_course_catalog_version()
+            key = f"{COURSE_CACHE_KEY_PREFIX}:{version}:search:{scope}"
+            value = await self._cache.get_json(key, local_ttl_seconds=Config.COURSE_SEARCH_CACHE_TTL_SECONDS)
+        except RedisError:
+            _logger.warning("Course search cache read failed, searching from DB", exc_info=True)
+            return None
+
+        if isinstance(value, dict):
+            return _CourseSearchCache(total=value["total"], keys=value["keys"])
+
+        max_ids = Config.COURSE_SEARCH_CACHE_MAX_IDS
+        search_result = await self._course_repository.get_course_ids_by_search(
+            session, word, difficulties, course_styles, max_ids + 1, 0, None, search_mode
+        )
+        if len(search_result) <= max_ids:
+            cached = _CourseSearchCache(total=len(search_result), keys=[list(key) for _, key in search_result])
+        else:
+            total = await self._course_repository.count_courses_by_search(
+                session, word, difficulties, course_styles, search_mode
+            )
+            cached = _CourseSearchCache(total=total, keys=None)
+
+        try:
+            await self._cache.set_json(
+                key, {"total": cached.total, "keys": cached.keys}, ttl_seconds=Config.COURSE_SEARCH_CACHE_TTL_SECONDS
+            )
+        except RedisError:
+            _logger.warning("Course search cache write failed: %s", key, exc_info=True)
+        return cached
+
+    async def load_course_catalog_index(self) -> None:
+        try:
+            await self._get_course_catalog_index()
+        except (RedisError, SQLAlchemyError):
+            # 인덱스가 없으면 DB로 검색하므로 시작은 막지 않는다 (다음 검색 요청에서 다시 만든다)
+            _logger.warning("Failed to load course catalog index", exc_info=True)
+
+    async def _get_course_catalog_index(self) -> Optional[CatalogIndex[CourseSearchSchema]]:
+        """
+        코스 카탈로그 버전(trailine_model.cache.COURSE_CATALOG_VERSION_KEY)이 바뀌었으면 인덱스를 다시 만들어 돌려주는 함수
+
+        버전은 COURSE_INDEX_VERSION_CHECK_SECONDS 마다 한 번만 확인하고,
+        다른 요청이 인덱스를 다시 만드는 중이면 기다리지 않고 이전 인덱스로 응답한다.
+        Redis 오류로 버전을 확인할 수 없으면 가지고 있는 인덱스를 계속 쓴다. (없으면 None -> DB 검색)
+        """
+        holder = self._course_catalog_index
+        if holder.index is not None and (not holder.is_version_check_due() or holder.lock.locked()):
+            return holder.index
+
+        async with holder.lock:
+            if holder.index is not None and not holder.is_version_check_due():
+                return holder.index
+
+            try:
+                version = await self._get_course_catalog_version()
+            except RedisError:
+                _logger.warning("Course catalog version check failed, keeping current index", exc_info=True)
+                holder.mark_version_checked()
+                return holder.index
+
+            if holder.index is not None and version == holder.version:
+                holder.mark_version_checked()
+                return holder.index
+
+            # 버전을 먼저 읽고 데이터를 읽어야, 그 사이 데이터가 바뀌어도 다음 확인에서 다시 만든다
+            try:
+                async with async_session_scope() as session:
+                    rows = await self._course_repository.get_all_course_list_information(session)
+            except SQLAlchemyError:
+                if holder.index is None:
+                    raise
+                _logger.warning("Course catalog index reload failed, keeping current index", exc_info=True)
+                holder.mark_version_checked()
+                return holder.index
+
+            index = CatalogIndex(
+                CatalogDocument(
                     id=row["id"],
                     name=row["name"],
-                    loadAddresses=[row["road_addresses"]],
-                    roadAddresses=[row["land_addresses"]],
-                    difficulty=CourseDifficultySchema(
-                        id=row["difficulty_id"],
-                        level=row["difficulty_level"],
-                        code=row["difficulty_code"],
-                        name=row["difficulty_name"],
-                    ),
-                    courseStyle=CourseStyleSchema(
-                        id=row["course_style_id"],
-                        code=row["course_style_label"],
-                        name=row["course_style_name"],
-                    )
+                    addresses=[*row["land_addresses"], *row["road_addresses"]],
+                    difficulty_id=row["difficulty_id"],
+                    style_id=row["course_style_id"],
+                    payload=_to_course_search_schema(row),
                 )
-            # 5. 이미 객체가 있으면 주소만 추가
-            else:
-                course = cast(CourseSearchSchema, formatted_results[idx])
-                if row["road_addresses"] not in course.load_addresses:
-                    course.load_addresses.append(row["road_addresses"])
-                if row["land_addresses"] not in course.road_addresses:
-                    course.road_addresses.append(row["land_addresses"])
-
-        # 6. 주소 리스트를 정렬하여 일관된 순서 보장
-        for item in formatted_results:
-            if item:
-                item.load_addresses.sort()
-                item.road_addresses.sort()
+                for row in rows
+            )
+            holder.replace(index, version)
+            _logger.info("Course catalog index loaded: version=%s, courses=%d", version, len(index))
+            return index
 
-        return total_count, [item for item in formatted_results if item is not None]
+    async def _get_course_catalog_version(self) -> str:
+        if Config.REDIS_URL is None:
+            return "0"
+        return await self._cache.get(COURSE_CATALOG_VERSION_KEY) or "0"
 
-    def get_course_detail(self, course_id: int) -> Optional[CourseDetailSchema]:
+    async def get_course_detail(self, course_id: int) -> Optional[CourseDetailSchema]:
         total_length, total_duration = 0, 0
-        with session_scope() as session:
-            raw_result = self._course_repository.get_course_detail(session, course_id)
-            total_length, total_duration = self._course_repository.get_sum_of_length_and_duration(session, course_id)
+        async with async_session_scope() as session:
+            raw_result = await self._course_repository.get_course_detail(session, course_id)
+            total_length, total_duration = await self._course_repository.get_sum_of_length_and_duration(session, course_id)
 
         if raw_result is None:
             return None
@@ -167,24 +371,45 @@ class CourseService(ICourseService):
 
         return course_detail
 
-    def get_course_intervals(self, course_id: int) -> Optional[List[CourseIntervalSchema]]:
-        interval_schemas: List[CourseIntervalSchema] = []
-        with session_scope() as session:
-            # 구간 데이터 및 역방향 여부 가져오기
-            intervals, is_reversed_list = self._course_repository.get_intervals(session, course_id)
-            if not intervals:
+    async def get_course_intervals(
+            self, course_id: int, track_format: TrackFormat = TrackFormat.POINTS, zoom: Optional[int] = None
+    ) -> Optional[List[CourseIntervalSchema]]:
+        intervals = await self._load_course_intervals(course_id, track_format, zoom)
+        if intervals is None:
+            return None
+
+        # 스키마로 돌려줄 때만 좌표를 PointSchema로 만든다 (응답 본문은 get_course_intervals_body에서 JSON 텍스트를 그대로 쓴다)
+        return [
+            interval.model_copy(update={"points": _POINT_LIST_ADAPTER.validate_json(points_json)})
+            if points_json is not None
+            else interval
+            for interval, points_json in intervals
+        ]
+
+    async def _load_course_intervals(
+            self, course_id: int, track_format: TrackFormat, zoom: Optional[int]
+    ) -> Optional[List[Tuple[CourseIntervalSchema, Optional[str]]]]:
+        """
+        구간 스키마(points 제외)와 구간별 좌표 JSON 텍스트(trackFormat=points일 때)를 가져오는 함수
+
+        좌표는 DB에서 만든 JSON 텍스트 또는 좌표 배열로 받아, 좌표마다 dict/PointSchema를 만들지 않는다.
+        """
+        intervals: List[Tuple[CourseIntervalSchema, Optional[str]]] = []
+        async with async_session_scope() as session:
+            # 구간 데이터, 역방향 여부, 시작/마감 지점을 한 번에 가져오기 (경로는 줌 레벨에 맞게 단순화된 것)
+            interval_rows = await self._course_repository.get_intervals(
+                session, course_id, lod_level_for_zoom(zoom), track_format
+            )
+            if not interval_rows:
                 return None
 
-            for i, interval in enumerate(intervals):
-                # 시작지점, 마감지점 가져오기
-                start_place, end_place = self._get_start_and_end_place(session, interval, is_reversed_list[i])
-                start_place_location = self._get_location_from_place(start_place)
-                end_place_location = self._get_location_from_place(end_place)
-                track_points = self._get_points(interval, is_reversed_list[i])
-                duration = interval.duration_ab_minutes if not is_reversed_list[i] else interval.duration_ba_minutes
-                description = interval.description_ab if not is_reversed_list[i] else interval.description_ba
+            for row in interval_rows:
+                interval: CourseInterval = row["interval"]
+                is_reversed: bool = row["is_reversed"]
+                duration = interval.duration_ab_minutes if not is_reversed else interval.duration_ba_minutes
+                description = interval.description_ab if not is_reversed else interval.description_ba
 
-                interval_schemas.append(CourseIntervalSchema(
+                interval_schema = CourseIntervalSchema(
                     name=interval.name,
                     description=description,
                     images=[
@@ -201,84 +426,51 @@ class CourseService(ICourseService):
                         name=interval.difficulty.name,
                         level=interval.difficulty.level,
                     ),
-                    startPlace=PlaceSchema(
-                        id=start_place.id,
-                        name=start_place.name,
-                        landAddress=start_place.land_address,
-                        roadAddress=start_place.road_address,
-                        lat=start_place_location["lat"],
-                        lon=start_place_location["lon"],
-                        ele=start_place_location["ele"],
-                    ),
-                    endPlace=PlaceSchema(
-                        id=end_place.id,
-                        name=end_place.name,
-                        landAddress=end_place.land_address,
-                        roadAddress=end_place.road_address,
-                        lat=end_place_location["lat"],
-                        lon=end_place_location["lon"],
-                        ele=end_place_location["ele"],
-                    ),
-                    points=[
-                        PointSchema(lat=p["lat"], lon=p["lon"], ele=p["ele"])
-                        for p in track_points
-                    ],
+                    startPlace=self._to_place_schema(row["start_place"]),
+                    endPlace=self._to_place_schema(row["end_place"]),
+                    points=None,
+                    track=self._encode_track(row["coordinates"], track_format),
                     length=math.floor((interval.length_m / 1000) * 10) / 10,
                     duration=duration
-                ))
+                )
+                intervals.append((interval_schema, row["points_json"]))
 
-        return interval_schemas
+        return intervals
 
-    def _get_start_and_end_place(
-            self,
-            session: Session,
-            interval: CourseInterval,
-            is_reversed: bool
-    ) -> Tuple[Place, Place]:
-        start_place_id = interval.place_a_id if not is_reversed else interval.place_b_id
-        end_place_id = interval.place_b_id if start_place_id == interval.place_a_id else interval.place_a_id
-
-        start_place = self._place_repository.get_place_by_instance(session, start_place_id)
-        if not start_place:
-            raise ValueError("Start Place Not Found")
-
-        end_place = self._place_repository.get_place_by_instance(session, end_place_id)
-        if not end_place:
-            raise ValueError("End Place Not Found")
-
-        return start_place, end_place
-
-    def _get_location_from_place(self, place: Place) -> Dict[str, Optional[float]]:
-        shape = to_shape(place.geom)
-
-        location = {
-            "lat": shape.y,
-            "lon": shape.x,
-            "ele": shape.z if shape.has_z else None
-        }
-
-        return location
-
-    def _get_points(self, interval: CourseInterval, is_reverse: bool) -> List[Dict[str, float]]:
-        shape = to_shape(interval.geom)
-
-        track_points: List[Dict[str, float]] = []
-        """ DB 상에서 해발고도(z)는 무조건 존재함을 보장하기 때문에 따로 분기처리할 필요가 없다.
-        if shape.has_z:
-            for lon, lat, ele in shape.coords:
-                track_points.append({"lat": lat, "lon": lon, "ele": ele})
-        """
-        for lon, lat, ele in shape.coords:
-            track_points.append({"lat": lat, "lon": lon, "ele": ele})
+    def _encode_track(
+            self, coordinates: Optional[Tuple[List[float], List[float], List[float]]], track_format: TrackFormat
+    ) -> Optional[EncodedTrackSchema]:
+        if track_format == TrackFormat.POINTS or coordinates is None:
+            return None
 
-        if is_reverse:
-            track_points.reverse()
+        lat, lon, ele = coordinates
+        encoded: Dict[str, Any] = (
+            {"polyline": encode_polyline(lat, lon, ele)}
+            if track_format == TrackFormat.POLYLINE
+            else delta_encode(lat, lon, ele)
+        )
+        return EncodedTrackSchema(
+            format=track_format,
+            precision=COORDINATE_PRECISION,
+            elePrecision=ELEVATION_PRECISION,
+            count=len(lat),
+            **encoded,
+        )
 
-        return track_points
+    def _to_place_schema(self, place: SQLRow) -> PlaceSchema:
+        return PlaceSchema(
+            id=place["id"],
+            name=place["name"],
+            landAddress=place["land_address"],
+            roadAddress=place["road_address"],
+            lat=place["lat"],
+            lon=place["lon"],
+            ele=place["ele"],
+        )
 
-    def get_course_difficulty_list(self) -> List[CourseDifficultySchema]:
-        with session_scope() as session:
-            instances = self._course_difficulty_repository.get_course_difficulty_all(session)
+    async def get_course_difficulty_list(self) -> List[CourseDifficultySchema]:
+        async with async_session_scope() as session:
+            instances = await self._course_difficulty_repository.get_course_difficulty_all(session)
             return [
                 CourseDifficultySchema(
                     id=instance.id,
@@ -289,9 +481,9 @@ class CourseService(ICourseService):
                 for instance in instances
             ]
 
-    def get_course_style_list(self) -> List[CourseStyleSchema]:
-        with session_scope() as session:
-            instances = self._course_style_repository.get_course_style_all(session)
+    async def get_course_style_list(self) -> List[CourseStyleSchema]:
+        async with async_session_scope() as session:
+            instances = await self._course_style_repository.get_course_style_all(session)
             return [
                 CourseStyleSchema(
                     id=instance.id,
@@ -300,3 +492,144 @@ class CourseService(ICourseService):
                 )
                 for instance in instances
             ]
+
+    async def get_course_detail_body(self, course_id: int) -> Optional[bytes]:
+        return await self._get_or_load_body(
+            f"detail:{course_id}",
+            _COURSE_DETAIL_ADAPTER,
+            lambda: self.get_course_detail(course_id),
+        )
+
+    async def get_course_intervals_body(
+            self, course_id: int, track_format: TrackFormat = TrackFormat.POINTS, zoom: Optional[int] = None
+    ) -> Optional[bytes]:
+        async def load_body() -> Optional[bytes]:
+            intervals = await self._load_course_intervals(course_id, track_format, zoom)
+            if not intervals:
+                return None
+            return _dump_course_intervals_body(intervals)
+
+        # 줌 레벨이 달라도 같은 LOD를 쓰면 응답이 같으므로 LOD 레벨로 키를 만든다
+        return await self._get_or_load_raw(
+            f"intervals:{course_id}:{track_format}:{lod_level_for_zoom(zoom)}", load_body
+        )
+
+    async def get_course_difficulty_list_body(self) -> bytes:
+        body = await self._get_or_load_body(
+            "difficulties", _COURSE_DIFFICULTY_LIST_ADAPTER, self.get_course_difficulty_list
+        )
+        return cast(bytes, body)
+
+    async def get_course_style_list_body(self) -> bytes:
+        body = await self._get_or_load_body("styles", _COURSE_STYLE_LIST_ADAPTER, self.get_course_style_list)
+        return cast(bytes, body)
+
+    async def _get_or_load_body(
+            self, name: str, adapter: TypeAdapter[T], loader: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[bytes]:
+        """
+        loader 결과를 adapter로 직렬화한 응답 본문을 캐시를 거쳐 가져오는 함수 (_get_or_load_raw 참고)
+        """
+        async def load_body() -> Optional[bytes]:
+            value = await loader()
+            return adapter.dump_json(value, by_alias=True) if value is not None else None
+
+        return await self._get_or_load_raw(name, load_body)
+
+    async def _get_or_load_raw(self, name: str, load_body: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        """
+        코스 응답 본문 read-through 캐시
+
+        키에 코스 카탈로그 버전(trailine_model.cache.COURSE_CATALOG_VERSION_KEY)을 넣어,
+        어드민/업로드 스크립트가 버전을 올리면 이전 캐시는 읽히지 않는다.
+        캐시에는 응답 JSON 본문을 그대로 저장하므로, 적중 시 파싱/검증 없이 bytes를 그대로 돌려준다.
+        load_body 결과가 None(코스 없음)이면 캐시하지 않으며, Redis 오류 시에는 DB에서 바로 조회한다.
+        """
+        if not Config.COURSE_CACHE_ENABLED or Config.REDIS_URL is None:
+            return await load_body()
+
+        try:
+            version = await self._cache.get(COURSE_CATALOG_VERSION_KEY) or "0"
+            key = f"{COURSE_CACHE_KEY_PREFIX}:{version}:{name}"
+            # 버전이 들어간 키의 값은 바뀌지 않으므로 워커 메모리(L1)에도 Redis와 같은 시간 동안 보관할 수 있다
+            cached = await self._cache.get_raw_json(key, local_ttl_seconds=Config.COURSE_CACHE_TTL_SECONDS)
+        except RedisError:
+            _logger.warning("Course cache read failed, loading from DB: %s", name, exc_info=True)
+            return await load_body()
+
+        if cached is not None:
+            return cached
+
+        body = await load_body()
+        if body is not None:
+            try:
+                await self._cache.set_raw_json(key, body, ttl_seconds=Config.COURSE_CACHE_TTL_SECONDS)
+            except RedisError:
+                _logger.warning("Course cache write failed: %s", key, exc_info=True)
+        return body
+
+
+@dataclass(slots=True)
+class _CourseSearchCache:
+    total: int
+    # 검색 순서대로 정렬 키 목록 (마지막 값이 코스 아이디), 결과가 COURSE_SEARCH_CACHE_MAX_IDS개를 넘으면 None
+    keys: Optional[List[List[float]]]
+
+
+def _dump_course_intervals_body(intervals: List[Tuple[CourseIntervalSchema, Optional[str]]]) -> bytes:
+    """
+    GettingCourseIntervalResponseSchema 응답 본문을 만드는 함수
+
+    구간 정보는 pydantic으로 직렬화하고, 좌표(points)는 DB가 만든 JSON 텍스트를 그대로 이어 붙인다.
+    """
+    bodies = []
+    for interval, points_json in intervals:
+        body = _COURSE_INTERVAL_ADAPTER.dump_json(interval, by_alias=True, exclude={"points"})
+        points = points_json.encode() if points_json is not None else b"null"
+        bodies.append(b'{"points":' + points + b"," + body[1:])
+    return b'{"intervalCount":%d,"intervals":[%s]}' % (len(intervals), b",".join(bodies))
+
+
+def _normalize_ids(ids: Optional[List[int]]) -> Optional[List[int]]:
+    """
+    필터 아이디 목록 정규화 (순서/중복이 달라도 같은 검색 조건이 되도록)
+    """
+    return sorted(set(ids)) if ids else None
+
+
+def _course_search_scope(mode: str, word: Optional[str], difficulties: Optional[List[int]], course_styles: Optional[List[int]]) -> str:
+    """
+    정규화된 검색 조건의 해시 (커서 검증과 검색 결과 캐시 키에 쓴다)
+    """
+    payload = json.dumps([mode, word or None, difficulties, course_styles], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _split_page(scope: str, search_result: List[Tuple[Any, SearchSortKey]], page_size: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    page_size + 1건 조회 결과를 (페이지 항목, 다음 페이지 커서)로 나누는 함수
+    """
+    page = search_result[:page_size]
+    if len(search_result) <= page_size or not page:
+        return [item for item, _ in page], None
+    return [item for item, _ in page], encode_cursor(scope, page[-1][1])
+
+
+def _to_course_search_schema(row: SQLRow) -> CourseSearchSchema:
+    return CourseSearchSchema(
+        id=row["id"],
+        name=row["name"],
+        loadAddresses=row["road_addresses"],
+        roadAddresses=row["land_addresses"],
+        difficulty=CourseDifficultySchema(
+            id=row["difficulty_id"],
+            level=row["difficulty_level"],
+            code=row["difficulty_code"],
+            name=row["difficulty_name"],
+        ),
+        courseStyle=CourseStyleSchema(
+            id=row["course_style_id"],
+            code=row["course_style_label"],
+            name=row["course_style_name"],
+        )
+    )
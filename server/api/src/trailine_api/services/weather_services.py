@@ -1,30 +1,51 @@
+import asyncio
+import logging
 from abc import ABCMeta, abstractmethod
-from typing import List, Tuple, Dict
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple, Dict, cast
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from fastapi import HTTPException
 from starlette import status
 
+from trailine_api.common.async_utils import SingleFlight
 from trailine_api.common.cache import RedisCache
-from trailine_api.common.db import session_scope
+from trailine_api.common.db import async_session_scope
+from trailine_api.common.local_cache import LocalTTLCache
+from trailine_api.config import Config
 from trailine_api.common.types import CourseLocationType, DatagoShortForecastRainCondition, SkyCondition
-from trailine_api.common.utils import latlon_to_grid
+from trailine_api.common.utils import latlon_to_grid, latlon_to_grid_batch
 from trailine_api.externals.datago import IKmaMidLandForecastAPI, IKmaMidLandTemperatureAPI, IKmaShortForecastAPI
-from trailine_api.repositories.course_repositories import ICourseRepository
-from trailine_api.repositories.weather_repositories import IWeatherRepository
-from trailine_api.schemas.weather import DAY_OF_WEEK_KO_LIST, DAY_OF_WEEK_LIST, ShortForecastItem, WeatherForecastItemSchema
+from trailine_api.repositories.course_repositories import IAsyncCourseRepository
+from trailine_api.repositories.weather_repositories import IAsyncWeatherRepository
+from trailine_api.schemas.weather import (
+    DAY_OF_WEEK_KO_LIST,
+    DAY_OF_WEEK_LIST,
+    MidLandForecastItem,
+    MidLandTemperatureItem,
+    ShortForecastItem,
+    WeatherForecastItemSchema,
+)
 
 
+_logger = logging.getLogger(__name__)
+
 MID_FORECAST_MIN_DAY = 5  # 기상청 중기예보 시작일 (5일 후부터)
-CACHE_TTL_SECONDS = 3600 * 3  # 1시간 + 3시간
+SHORT_FORECAST_MAX_DAY = MID_FORECAST_MIN_DAY - 1  # 단기예보 캐시는 항상 최대 일수로 채운다
+SHORT_CACHE_TTL_SECONDS = 3600 * 3  # 단기예보는 3시간마다 발표
+MID_CACHE_TTL_SECONDS = 3600 * 12  # 중기예보는 12시간마다 발표 (06시, 18시)
+CACHE_LOCK_TTL_SECONDS = 30  # 캐시를 채우는 워커가 쥐는 락의 최대 유지 시간
+CACHE_LOCK_WAIT_SECONDS = 10  # 다른 워커가 캐시를 채우기를 기다리는 최대 시간
+CACHE_KEY_TIME_FORMAT = "%Y%m%d%H%M"
 DATE_FORMAT = "%Y-%m-%d"
 
 
 class IWeatherService(metaclass=ABCMeta):
     _cache: RedisCache
-    _course_repository: ICourseRepository
-    _weather_repository: IWeatherRepository
+    _single_flight: SingleFlight
+    _course_weather_info_table: LocalTTLCache[int, Tuple[str, str, int, int]]
+    _course_repository: IAsyncCourseRepository
+    _weather_repository: IAsyncWeatherRepository
     _kma_mid_forecast_api: IKmaMidLandForecastAPI
     _kma_mid_temperature_api: IKmaMidLandTemperatureAPI
     _kma_short_forecast_api: IKmaShortForecastAPI
@@ -32,13 +53,17 @@ class IWeatherService(metaclass=ABCMeta):
     def __init__(
             self,
             cache: RedisCache,
-            course_repository: ICourseRepository,
-            weather_repository: IWeatherRepository,
+            single_flight: SingleFlight,
+            course_weather_info_table: LocalTTLCache[int, Tuple[str, str, int, int]],
+            course_repository: IAsyncCourseRepository,
+            weather_repository: IAsyncWeatherRepository,
             kma_mid_forecast_api: IKmaMidLandForecastAPI,
             kma_mid_temperature_api: IKmaMidLandTemperatureAPI,
             kma_short_forecast_api: IKmaShortForecastAPI
     ):
         self._cache = cache
+        self._single_flight = single_flight
+        self._course_weather_info_table = course_weather_info_table
         self._course_repository = course_repository
         self._weather_repository = weather_repository
         self._kma_mid_forecast_api = kma_mid_forecast_api
@@ -54,82 +79,273 @@ class IWeatherService(metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    async def get_forecast_targets(self) -> Tuple[Set[Tuple[int, int]], Set[str], Set[str]]:
+        """
+        공개된 코스들이 사용하는 예보 조회 대상을 중복 없이 가져오는 함수 (캐시 예열용)
+
+        :return: (grids, status_codes, temp_codes) -> (단기예보 격자 (nx, ny), 중기 육상예보 지역코드, 중기 기온 지역코드)
+        """
+        pass
+
+    @abstractmethod
+    async def warm_short_forecast(self, nx: int, ny: int) -> None:
+        """
+        해당 격자의 현재 발표분 단기예보를 캐시에 채우는 함수 (이미 있으면 아무것도 하지 않는다)
+        """
+        pass
+
+    @abstractmethod
+    async def warm_mid_land_forecast(self, status_code: str) -> None:
+        """
+        해당 지역의 현재 발표분 중기 육상예보를 캐시에 채우는 함수 (이미 있으면 아무것도 하지 않는다)
+        """
+        pass
+
+    @abstractmethod
+    async def warm_mid_land_temperature(self, temp_code: str) -> None:
+        """
+        해당 지역의 현재 발표분 중기 기온예보를 캐시에 채우는 함수 (이미 있으면 아무것도 하지 않는다)
+        """
+        pass
+
 
 class WeatherService(IWeatherService):
     async def get_forecasts(
         self, course_id: int, days: int
     ) -> Tuple[datetime, List[WeatherForecastItemSchema]]:
-        # 발표 시각 계산 (네트워크 호출 없이 시간 계산만 수행)
-        published_at = self._resolve_published_at(days)
+        status_code, temp_code, nx, ny = await self._get_course_weather_info(course_id)
 
-        # 캐싱된 데이터 가져오기 (발표 시각이 바뀌면 키도 자연스럽게 무효화)
-        cache_key = f"weather:course:{course_id}:{days}:{published_at.strftime('%Y%m%d%H%M')}"
-        cached = await self._cache.get_json(cache_key)
-        if isinstance(cached, list):
-            return published_at, [WeatherForecastItemSchema(**item) for item in cached]
+        results: List[WeatherForecastItemSchema] = []
 
-        # 캐싱된 데이터 없으면 직접 조회
-        status_code, temp_code, nx, ny = self._get_course_weather_info(course_id)
+        # 발표 시각은 실제로 응답에 사용된 데이터의 발표 시각 (stale 데이터를 응답하면 이전 발표 시각)
+        if days < MID_FORECAST_MIN_DAY:
+            # days <= 4: 기상청 단기예보만 활용
+            published_at, short_results = await self._build_short_forecasts(nx, ny, days)
+            results.extend(short_results)
+        else:
+            # days >= 5: 단기예보 + 중기예보를 동시에 요청 (동시 요청 수는 datago limiter로 제한)
+            (short_published_at, short_results), (mid_published_at, mid_results) = await asyncio.gather(
+                self._build_short_forecasts(nx, ny, days),
+                self._build_mid_forecasts(status_code, temp_code, days),
+            )
+            # 단기/중기 발표 시각 중 가장 최근 시각을 사용한다
+            published_at = max(short_published_at, mid_published_at)
+            results.extend(short_results)
+            results.extend(mid_results)
 
-        results: List[WeatherForecastItemSchema] = []
+        return published_at, results
+
+    async def get_forecast_targets(self) -> Tuple[Set[Tuple[int, int]], Set[str], Set[str]]:
+        grids: Set[Tuple[int, int]] = set()
+        status_codes: Set[str] = set()
+        temp_codes: Set[str] = set()
+
+        async with async_session_scope() as session:
+            rows = await self._weather_repository.get_published_course_forecast_targets(session)
+
+        # 격자가 아직 저장되지 않은 코스는 중간 지점으로 한번에 변환
+        pending = []
+        for row in rows:
+            if row["kma_grid_nx"] is not None and row["kma_grid_ny"] is not None:
+                grids.add((row["kma_grid_nx"], row["kma_grid_ny"]))
+            elif row["lat"] is not None and row["lon"] is not None:
+                pending.append(row)
+            if row["status_code"]:
+                status_codes.add(row["status_code"])
+            if row["temp_code"]:
+                temp_codes.add(row["temp_code"])
 
-        # days <= 4: 기상청 단기예 활용
-        results.extend(self._build_short_forecasts(nx, ny, days))
+        if pending:
+            nx, ny = latlon_to_grid_batch([row["lat"] for row in pending], [row["lon"] for row in pending])
+            grids.update(zip(nx.tolist(), ny.tolist()))
 
-        # days >= 5: 중기예보 활용
-        if days >= MID_FORECAST_MIN_DAY:
-            results.extend(self._build_mid_forecasts(status_code, temp_code, days))
+        return grids, status_codes, temp_codes
+
+    async def warm_short_forecast(self, nx: int, ny: int) -> None:
+        await self._get_short_forecast_items(nx, ny, allow_stale=False)
+
+    async def warm_mid_land_forecast(self, status_code: str) -> None:
+        await self._get_mid_forecast_items(status_code, allow_stale=False)
+
+    async def warm_mid_land_temperature(self, temp_code: str) -> None:
+        await self._get_mid_temperature_items(temp_code, allow_stale=False)
+
+    async def _get_or_load_cached_list(
+            self,
+            key_prefix: str,
+            published_at: datetime,
+            loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+            ttl_seconds: int,
+            allow_stale: bool = True,
+    ) -> Tuple[datetime, List[Dict[str, Any]]]:
+        """발표 시각 단위로 캐시된 리스트를 반환하고, 없으면 loader로 채운다.
+
+        - 캐시 키: {key_prefix}:{발표 시각}, 최근에 채워진 발표분은 {key_prefix}:latest 에도 함께 저장한다.
+        - 현재 발표분이 없고 latest가 허용 범위(WEATHER_STALE_MAX_SECONDS) 안이면 latest를 바로 반환하고,
+          현재 발표분은 백그라운드에서 채운다. (stale-while-revalidate)
+        - 같은 워커 내 동시 요청은 SingleFlight로, 워커 간 동시 요청은 Redis 락으로 하나의 조회로 합친다.
+
+        :return: (실제로 반환한 데이터의 발표 시각, 데이터)
+        """
+        cache_key = f"{key_prefix}:{published_at.strftime(CACHE_KEY_TIME_FORMAT)}"
+        latest_key = f"{key_prefix}:latest"
+
+        cached = await self._cache.get_json(cache_key)
+        if isinstance(cached, list):
+            return published_at, cached
+
+        async def load() -> List[Dict[str, Any]]:
+            items = await loader()
+            await self._set_latest_if_newer(latest_key, published_at, items, ttl_seconds + Config.WEATHER_STALE_MAX_SECONDS)
+            return items
+
+        def refresh() -> Awaitable[Dict[str, Any] | List[Any]]:
+            return self._cache.get_or_load_json(
+                cache_key,
+                load,
+                ttl_seconds=ttl_seconds,
+                lock_ttl_seconds=CACHE_LOCK_TTL_SECONDS,
+                wait_timeout_seconds=CACHE_LOCK_WAIT_SECONDS,
+            )
+
+        if allow_stale:
+            latest = await self._cache.get_json(latest_key)
+            if isinstance(latest, dict):
+                latest_published_at = datetime.strptime(latest["publishedAt"], CACHE_KEY_TIME_FORMAT)
+                if (published_at - latest_published_at).total_seconds() <= Config.WEATHER_STALE_MAX_SECONDS:
+                    task = self._single_flight.start(cache_key, refresh)
+                    task.add_done_callback(self._log_refresh_failure)
+                    return latest_published_at, latest["items"]
+
+        cached = await self._single_flight.do(cache_key, refresh)
+        return published_at, cast(List[Dict[str, Any]], cached)
+
+    async def _set_latest_if_newer(
+            self, latest_key: str, published_at: datetime, items: List[Dict[str, Any]], ttl_seconds: int
+    ) -> None:
+        """
+        {key_prefix}:latest 를 더 최근(또는 같은) 발표분일 때만 덮어쓴다.
+
+        늦게 끝난 백그라운드 갱신(stale-while-revalidate)이 이전 발표분으로 latest를 되돌리지 않게 한다.
+        """
+        latest = await self._cache.get_json(latest_key)
+        if isinstance(latest, dict):
+            latest_published_at = datetime.strptime(latest["publishedAt"], CACHE_KEY_TIME_FORMAT)
+            if published_at < latest_published_at:
+                return
 
-        # 캐시에 데이터 올리기
         await self._cache.set_json(
-            cache_key,
-            [item.model_dump(by_alias=True) for item in results],
-            ttl_seconds=CACHE_TTL_SECONDS,
+            latest_key,
+            {"publishedAt": published_at.strftime(CACHE_KEY_TIME_FORMAT), "items": items},
+            ttl_seconds=ttl_seconds,
         )
 
-        return published_at, results
+    @staticmethod
+    def _log_refresh_failure(task: "asyncio.Task[Any]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            _logger.warning("Background weather refresh failed", exc_info=task.exception())
 
-    def _resolve_published_at(self, days: int) -> datetime:
-        """요청 days에 따라 사용된 예보 API의 발표 시각을 결정한다.
+    async def _get_short_forecast_items(
+        self, nx: int, ny: int, allow_stale: bool = True
+    ) -> Tuple[datetime, List[ShortForecastItem]]:
+        """격자(nx, ny) 단위로 캐싱된 단기예보 시간별 데이터를 가져온다.
 
-        days < 5인 경우는 단기예보만 사용하므로 단기예보 발표 시각을 그대로 사용하고,
-        days >= 5인 경우 단기/중기 발표 시각 중 가장 최근 시각을 사용한다.
+        같은 격자를 공유하는 코스들과 days가 다른 요청이 하나의 캐시를 함께 사용하도록
+        항상 최대 일수(SHORT_FORECAST_MAX_DAY)로 조회해 저장하고, 필요한 일수는 조합 시 잘라낸다.
         """
-        short_published_at = self._kma_short_forecast_api.get_published_at()
-        if days < MID_FORECAST_MIN_DAY:
-            return short_published_at
+        async def load() -> List[Dict[str, Any]]:
+            items = await self._kma_short_forecast_api.call(nx, ny, SHORT_FORECAST_MAX_DAY)
+            return [item.to_dict() for item in items]
+
+        published_at, cached = await self._get_or_load_cached_list(
+            f"weather:short:{nx}:{ny}",
+            self._kma_short_forecast_api.get_published_at(),
+            load,
+            SHORT_CACHE_TTL_SECONDS,
+            allow_stale,
+        )
+        return published_at, [ShortForecastItem.from_dict(item) for item in cached]
+
+    async def _get_mid_forecast_items(
+        self, status_code: str, allow_stale: bool = True
+    ) -> Tuple[datetime, List[MidLandForecastItem]]:
+        """예보구역 코드 단위로 캐싱된 중기 육상예보를 가져온다."""
+        async def load() -> List[Dict[str, Any]]:
+            items = await self._kma_mid_forecast_api.call(status_code)
+            return [item.model_dump(mode="json") for item in items]
+
+        published_at, cached = await self._get_or_load_cached_list(
+            f"weather:mid-land:{status_code}",
+            self._kma_mid_forecast_api.get_published_at(),
+            load,
+            MID_CACHE_TTL_SECONDS,
+            allow_stale,
+        )
+        return published_at, [MidLandForecastItem(**item) for item in cached]
+
+    async def _get_mid_temperature_items(
+        self, temp_code: str, allow_stale: bool = True
+    ) -> Tuple[datetime, List[MidLandTemperatureItem]]:
+        """예보구역 코드 단위로 캐싱된 중기 기온예보를 가져온다."""
+        async def load() -> List[Dict[str, Any]]:
+            items = await self._kma_mid_temperature_api.call(temp_code)
+            return [item.model_dump(mode="json") for item in items]
+
+        published_at, cached = await self._get_or_load_cached_list(
+            f"weather:mid-temp:{temp_code}",
+            self._kma_mid_temperature_api.get_published_at(),
+            load,
+            MID_CACHE_TTL_SECONDS,
+            allow_stale,
+        )
+        return published_at, [MidLandTemperatureItem(**item) for item in cached]
 
-        mid_published_at = self._kma_mid_forecast_api.get_published_at()
-        return max(short_published_at, mid_published_at)
+    async def _get_course_weather_info(self, course_id: int) -> Tuple[str, str, int, int]:
+        """코스의 중기예보 지역 코드와 단기예보 격자를 가져온다.
 
-    def _get_course_weather_info(self, course_id: int) -> Tuple[str, str, int, int]:
-        """DB에서 기상청 코드와 좌표를 조회한다."""
-        with session_scope() as session:
-            try:
-                kma_mid_status_code, kma_mid_temp_code = (
-                    self._weather_repository.get_mid_land_forecast_codes(session, course_id)
-                )
-            except ValueError:
+        워커 메모리의 lookup table을 먼저 확인하고, 없으면 DB에 저장된 값을 사용한다.
+        격자가 아직 계산되지 않은 코스는 중간 지점으로 계산한 뒤 DB에 저장해 둔다.
+        """
+        cached = self._course_weather_info_table.get(course_id)
+        if cached is not None:
+            return cached
+
+        async with async_session_scope() as session:
+            row = await self._weather_repository.get_course_weather_lookup(session, course_id)
+            if row is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="코스를 찾을 수 없어요."
                 )
 
+            kma_mid_status_code, kma_mid_temp_code = row["status_code"], row["temp_code"]
             if not kma_mid_status_code or not kma_mid_temp_code:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="날씨 정보를 찾을 수 없어요."
                 )
 
-            location = self._course_repository.get_course_location(session, course_id, CourseLocationType.MIDDLE)
-            if location is None:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="코스 위치 정보를 찾을 수 없어요."
-                )
-            nx, ny = latlon_to_grid(*location)
-
-        return kma_mid_status_code, kma_mid_temp_code, nx, ny
+            nx, ny = row["kma_grid_nx"], row["kma_grid_ny"]
+            if nx is None or ny is None:
+                if row["lat"] is not None and row["lon"] is not None:
+                    location: Optional[Tuple[float, float]] = (row["lat"], row["lon"])
+                else:
+                    # 중간 지점이 아직 계산되지 않은 코스는 구간을 병합해 직접 구한다
+                    location = await self._course_repository.get_course_location(
+                        session, course_id, CourseLocationType.MIDDLE
+                    )
+                if location is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="코스 위치 정보를 찾을 수 없어요."
+                    )
+                nx, ny = latlon_to_grid(*location)
+                await self._weather_repository.update_course_kma_grids(session, {course_id: (nx, ny)})
+
+        info = (kma_mid_status_code, kma_mid_temp_code, nx, ny)
+        self._course_weather_info_table.set(course_id, info)
+        return info
 
     _SKY_CONDITION_PRIORITY = {
         SkyCondition.CLEAR: 0,
@@ -138,14 +354,24 @@ class WeatherService(IWeatherService):
         SkyCondition.SNOW: 3,
     }
 
-    def _build_short_forecasts(self, nx: int, ny: int, days: int) -> List[WeatherForecastItemSchema]:
-        """단기예보 API를 호출하고 응답을 조합한다"""
-        short_forecasts = self._kma_short_forecast_api.call(nx, ny, days)
+    async def _build_short_forecasts(
+        self, nx: int, ny: int, days: int
+    ) -> Tuple[datetime, List[WeatherForecastItemSchema]]:
+        """격자 단위 단기예보 캐시에서 요청 일수만큼 잘라 응답을 조합한다"""
+        published_at, short_forecasts = await self._get_short_forecast_items(nx, ny)
+        today = date.today()
+        end_date = today + timedelta(days=min(days, SHORT_FORECAST_MAX_DAY))
 
         daily: Dict[str, List[ShortForecastItem]] = defaultdict(list)
 
         # 예보 데이터를 날짜별로 그룹핑
         for item in short_forecasts:
+            forecast_date = item.forecast_date.date()
+            # 이전 발표분(stale)을 쓰는 동안에는 지난 날짜의 예보가 앞쪽에 남아 있다
+            if forecast_date < today:
+                continue
+            if forecast_date > end_date:
+                break
             date_key = item.forecast_date.strftime(DATE_FORMAT)
             daily[date_key].append(item)
 
@@ -166,7 +392,7 @@ class WeatherService(IWeatherService):
                 )
             )
 
-        return results
+        return published_at, results
 
     def _resolve_daily_sky_condition(self, items: List[ShortForecastItem]) -> SkyCondition:
         """시간별 예보에서 하루의 대표 하늘 상태를 결정한다."""
@@ -182,18 +408,32 @@ class WeatherService(IWeatherService):
 
         return worst
 
-    def _build_mid_forecasts(
+    async def _build_mid_forecasts(
         self, status_code: str, temp_code: str, days: int
-    ) -> List[WeatherForecastItemSchema]:
-        """중기예보 API를 호출하고 응답을 조합한다."""
-        mid_forecasts = self._kma_mid_forecast_api.call(status_code)
-        mid_temperatures = self._kma_mid_temperature_api.call(temp_code)
+    ) -> Tuple[datetime, List[WeatherForecastItemSchema]]:
+        """예보구역 단위 중기예보 캐시에서 응답을 조합한다."""
+        (forecast_published_at, mid_forecasts), (temperature_published_at, mid_temperatures) = await asyncio.gather(
+            self._get_mid_forecast_items(status_code),
+            self._get_mid_temperature_items(temp_code),
+        )
+        # 응답의 발표 시각은 육상/기온 중 더 오래된 발표분 기준
+        published_at = min(forecast_published_at, temperature_published_at)
+
+        # 이전 발표분(stale)을 응답하는 경우, 발표일이 다르면 그만큼 인덱스를 밀어 날짜를 맞춘다
+        # 육상/기온 캐시는 따로 갱신되어 발표일이 다를 수 있으므로 각각의 발표일로 계산한다
+        forecast_offset = (self._kma_mid_forecast_api.get_published_at().date() - forecast_published_at.date()).days
+        temperature_offset = (
+            self._kma_mid_temperature_api.get_published_at().date() - temperature_published_at.date()
+        ).days
 
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         results: List[WeatherForecastItemSchema] = []
 
         for i in range(MID_FORECAST_MIN_DAY, days + 1):
-            raw_i = i - MID_FORECAST_MIN_DAY
+            forecast_i = i - MID_FORECAST_MIN_DAY + forecast_offset
+            temperature_i = i - MID_FORECAST_MIN_DAY + temperature_offset
+            if forecast_i >= len(mid_forecasts) or temperature_i >= len(mid_temperatures):
+                break
             forecast_date = today + timedelta(days=i)
 
             weekday = forecast_date.weekday()
@@ -202,14 +442,14 @@ class WeatherService(IWeatherService):
                     date=forecast_date.strftime(DATE_FORMAT),
                     dayOfWeek=DAY_OF_WEEK_LIST[weekday],
                     dayOfWeekKo=DAY_OF_WEEK_KO_LIST[weekday],
-                    minTemperature=mid_temperatures[raw_i].min_temperature,
-                    maxTemperature=mid_temperatures[raw_i].max_temperature,
+                    minTemperature=mid_temperatures[temperature_i].min_temperature,
+                    maxTemperature=mid_temperatures[temperature_i].max_temperature,
                     precipitationProbability=max(
-                        mid_forecasts[raw_i].rain_probability_am,
-                        mid_forecasts[raw_i].rain_probability_pm
+                        mid_forecasts[forecast_i].rain_probability_am,
+                        mid_forecasts[forecast_i].rain_probability_pm
                     ),
-                    skyCondition=mid_forecasts[raw_i].sky_condition_am.to_sky_condition(),
+                    skyCondition=mid_forecasts[forecast_i].sky_condition_am.to_sky_condition(),
                 )
             )
 
-        return results
+        return published_at, results
@@ -0,0 +1,159 @@
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from functools import partial
+from typing import Awaitable, Callable, List, Optional
+
+from trailine_api.common.async_utils import RateLimiter
+from trailine_api.common.cache import RedisCache
+from trailine_api.externals.datago import IKmaMidLandForecastAPI, IKmaShortForecastAPI
+from trailine_api.services.weather_services import IWeatherService
+
+
+_logger = logging.getLogger(__name__)
+
+SHORT_SLOT_TTL_SECONDS = 3600 * 3  # 단기예보 발표 주기
+MID_SLOT_TTL_SECONDS = 3600 * 12  # 중기예보 발표 주기
+SLOT_CLAIM_TTL_SECONDS = 60 * 10  # 예열 중인 발표분의 선출 키 TTL (예열이 끝나면 발표 주기만큼 연장한다)
+
+class WeatherPrewarmScheduler:
+    """
+    기상청 발표 시각에 맞춰 공개된 코스들의 예보를 미리 캐시에 채워두는 백그라운드 작업.
+
+    - poll_interval_seconds 마다 단기/중기예보의 현재 발표 시각을 계산하고, 마지막으로 처리한 발표 시각과 다르면 예열한다.
+      (발표 시각은 API 제공 시각 기준으로 계산되므로 새 발표분이 나오자마자 예열이 시작된다)
+    - 워커가 여러 개여도 발표분마다 한 워커만 예열하도록 발표 시각 단위의 Redis 키로 선출한다.
+      선출 키는 짧은 TTL로 잡고 예열이 끝나면 발표 주기만큼 연장하며, 대상 조회가 실패하거나 모든 작업이 실패하면
+      키를 풀어 다음 폴링에서 (어느 워커든) 다시 예열한다. 워커가 예열 도중 죽으면 짧은 TTL이 지난 뒤 다시 선출된다.
+    - 예열 작업은 concurrency(동시 작업 수)와 rate_per_second(초당 작업 시작 수)로 제한해 공공데이터포털 트래픽 한도를 지킨다.
+    """
+
+    def __init__(
+            self,
+            weather_service: IWeatherService,
+            cache: RedisCache,
+            kma_short_forecast_api: IKmaShortForecastAPI,
+            kma_mid_forecast_api: IKmaMidLandForecastAPI,
+            concurrency: int,
+            rate_per_second: float,
+            poll_interval_seconds: float,
+    ):
+        self._weather_service = weather_service
+        self._cache = cache
+        self._kma_short_forecast_api = kma_short_forecast_api
+        self._kma_mid_forecast_api = kma_mid_forecast_api
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_limiter = RateLimiter(rate_per_second)
+        self._poll_interval_seconds = poll_interval_seconds
+
+        self._last_short_published_at: Optional[datetime] = None
+        self._last_mid_published_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="weather-prewarm")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                _logger.exception("Weather prewarm failed")
+            await asyncio.sleep(self._poll_interval_seconds)
+
+    async def run_once(self) -> None:
+        """새 발표분이 있으면 예열한다."""
+        short_published_at = self._kma_short_forecast_api.get_published_at()
+        mid_published_at = self._kma_mid_forecast_api.get_published_at()
+
+        # 예열을 마친 발표분만 기록하므로, 선출에 실패했거나 예열이 실패한 발표분은 다음 폴링에서 다시 선출을 시도한다
+        short_token: Optional[str] = None
+        if short_published_at != self._last_short_published_at:
+            short_token = await self._claim_slot("short", short_published_at)
+
+        mid_token: Optional[str] = None
+        if mid_published_at != self._last_mid_published_at:
+            mid_token = await self._claim_slot("mid", mid_published_at)
+
+        if short_token is None and mid_token is None:
+            return
+
+        try:
+            grids, status_codes, temp_codes = await self._weather_service.get_forecast_targets()
+        except Exception:
+            if short_token is not None:
+                await self._release_slot("short", short_published_at, short_token)
+            if mid_token is not None:
+                await self._release_slot("mid", mid_published_at, mid_token)
+            raise
+
+        short_jobs: List[Callable[[], Awaitable[None]]] = []
+        mid_jobs: List[Callable[[], Awaitable[None]]] = []
+        if short_token is not None:
+            short_jobs.extend(partial(self._weather_service.warm_short_forecast, nx, ny) for nx, ny in grids)
+        if mid_token is not None:
+            mid_jobs.extend(partial(self._weather_service.warm_mid_land_forecast, code) for code in status_codes)
+            mid_jobs.extend(partial(self._weather_service.warm_mid_land_temperature, code) for code in temp_codes)
+
+        results = await asyncio.gather(
+            *(self._run_job(job) for job in short_jobs + mid_jobs), return_exceptions=True
+        )
+        short_failed = sum(1 for result in results[:len(short_jobs)] if isinstance(result, Exception))
+        mid_failed = sum(1 for result in results[len(short_jobs):] if isinstance(result, Exception))
+
+        _logger.info(
+            "Weather prewarm finished: short=%s mid=%s jobs=%d failed=%d",
+            short_published_at if short_token is not None else None,
+            mid_published_at if mid_token is not None else None,
+            len(results),
+            short_failed + mid_failed,
+        )
+
+        if short_token is not None:
+            if await self._finish_slot("short", short_published_at, short_token, SHORT_SLOT_TTL_SECONDS,
+                                       len(short_jobs), short_failed):
+                self._last_short_published_at = short_published_at
+        if mid_token is not None:
+            if await self._finish_slot("mid", mid_published_at, mid_token, MID_SLOT_TTL_SECONDS,
+                                       len(mid_jobs), mid_failed):
+                self._last_mid_published_at = mid_published_at
+
+    def _slot_key(self, kind: str, published_at: datetime) -> str:
+        return self._cache.build_lock_key(f"weather:prewarm:{kind}:{published_at.strftime('%Y%m%d%H%M')}")
+
+    async def _claim_slot(self, kind: str, published_at: datetime) -> Optional[str]:
+        """발표분 단위로 예열 담당 워커를 선출한다. 선출되면 키의 토큰을 반환한다."""
+        return await self._cache.acquire_lock(self._slot_key(kind, published_at), ttl_seconds=SLOT_CLAIM_TTL_SECONDS)
+
+    async def _release_slot(self, kind: str, published_at: datetime, token: str) -> None:
+        await self._cache.release_lock(self._slot_key(kind, published_at), token)
+
+    async def _finish_slot(
+            self, kind: str, published_at: datetime, token: str, ttl_seconds: int, job_count: int, failed: int
+    ) -> bool:
+        """
+        예열 결과에 따라 선출 키를 발표 주기만큼 연장하거나(성공) 풀어서(모든 작업 실패) 다시 예열하게 한다.
+
+        :return: 발표분 예열을 마쳤는지 여부
+        """
+        if job_count > 0 and failed == job_count:
+            _logger.warning("Weather prewarm failed for every %s job, retrying: %s", kind, published_at)
+            await self._release_slot(kind, published_at, token)
+            return False
+        await self._cache.set(self._slot_key(kind, published_at), token, ttl_seconds=ttl_seconds)
+        return True
+
+    async def _run_job(self, job: Callable[[], Awaitable[None]]) -> None:
+        async with self._semaphore:
+            await self._rate_limiter.acquire()
+            await job()
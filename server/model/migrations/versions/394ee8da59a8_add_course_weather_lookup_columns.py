@@ -0,0 +1,50 @@
+"""add course weather lookup columns
+
+Revision ID: 394ee8da59a8
+Revises: f73deb7928d8
+Create Date: 2026-10-18 11:06:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = '394ee8da59a8'
+down_revision: Union[str, Sequence[str], None] = 'f73deb7928d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('course', sa.Column('middle_point', geoalchemy2.types.Geometry(geometry_type='POINT', srid=4326, dimension=2, from_text='ST_GeomFromEWKT', name='geometry', spatial_index=False), nullable=True, comment='코스 중간 지점 (구간 병합 라인의 50% 지점)'))
+    op.add_column('course', sa.Column('kma_grid_nx', sa.SmallInteger(), nullable=True, comment='기상청 단기예보 격자 X (middle_point 기준)'))
+    op.add_column('course', sa.Column('kma_grid_ny', sa.SmallInteger(), nullable=True, comment='기상청 단기예보 격자 Y (middle_point 기준)'))
+
+    # 기존 코스의 중간 지점 채우기 (격자는 API 또는 refresh-course-weather-info 명령이 계산)
+    op.execute("""
+        UPDATE course c
+        SET middle_point = (
+            SELECT ST_Force2D(ST_LineInterpolatePoint(
+                ST_MakeLine(
+                    CASE WHEN cci.is_reversed THEN ST_Reverse(ci.geom) ELSE ci.geom END
+                    ORDER BY cci.position
+                ),
+                0.5
+            ))
+            FROM course_interval ci
+            JOIN course_course_interval cci ON cci.interval_id = ci.id
+            WHERE cci.course_id = c.id
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('course', 'kma_grid_ny')
+    op.drop_column('course', 'kma_grid_nx')
+    op.drop_column('course', 'middle_point')
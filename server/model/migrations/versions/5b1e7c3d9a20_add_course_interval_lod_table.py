@@ -0,0 +1,44 @@
+"""add course interval lod table
+
+Revision ID: 5b1e7c3d9a20
+Revises: 394ee8da59a8
+Create Date: 2026-10-18 14:32:47.106215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c3d9a20'
+down_revision: Union[str, Sequence[str], None] = '394ee8da59a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('course_interval_lod',
+    sa.Column('interval_id', sa.Integer(), nullable=False),
+    sa.Column('level', sa.SmallInteger(), nullable=False, comment='LOD 레벨 (값이 클수록 단순함)'),
+    sa.Column('geom', geoalchemy2.types.Geometry(geometry_type='LINESTRINGZ', srid=4326, dimension=3, from_text='ST_GeomFromEWKT', name='geometry', nullable=False, spatial_index=False), nullable=False, comment='단순화된 간선 (위도, 경도, 고도)'),
+    sa.ForeignKeyConstraint(['interval_id'], ['course_interval.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('interval_id', 'level'),
+    comment='코스 구간 단순화 경로 (줌 레벨별 LOD, trailine_model.hooks.refresh_interval_lods로 갱신)'
+    )
+
+    # 기존 구간의 LOD 채우기 (허용 오차는 trailine_model.models.course.COURSE_INTERVAL_LOD_TOLERANCES 와 같다)
+    op.execute("""
+        INSERT INTO course_interval_lod (interval_id, level, geom)
+        SELECT ci.id, lod.level, ST_SimplifyPreserveTopology(ci.geom, lod.tolerance)
+        FROM course_interval ci
+        CROSS JOIN (VALUES (1, 0.00005), (2, 0.0002), (3, 0.0008)) AS lod(level, tolerance)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('course_interval_lod')
@@ -0,0 +1,35 @@
+"""add pg_trgm extension and course join indexes
+
+Revision ID: 8c2f4a6d1e37
+Revises: 5b1e7c3d9a20
+Create Date: 2026-10-18 20:41:09.532871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f4a6d1e37'
+down_revision: Union[str, Sequence[str], None] = '5b1e7c3d9a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 트라이그램 인덱스는 검색 문서 테이블(d41a7b9e2c58)에 만든다
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index('ix_course_interval_place_a_id', 'course_interval', ['place_a_id'], unique=False)
+    op.create_index('ix_course_interval_place_b_id', 'course_interval', ['place_b_id'], unique=False)
+    op.create_index('ix_course_course_interval_interval_id', 'course_course_interval', ['interval_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_course_course_interval_interval_id', table_name='course_course_interval')
+    op.drop_index('ix_course_interval_place_b_id', table_name='course_interval')
+    op.drop_index('ix_course_interval_place_a_id', table_name='course_interval')
+    # pg_trgm 확장은 다른 곳에서 쓰고 있을 수 있으므로 남겨둔다
@@ -0,0 +1,88 @@
+"""add course search document table
+
+Revision ID: d41a7b9e2c58
+Revises: 8c2f4a6d1e37
+Create Date: 2026-10-18 22:05:51.204936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7b9e2c58'
+down_revision: Union[str, Sequence[str], None] = '8c2f4a6d1e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('course_search_document',
+    sa.Column('course_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=32), nullable=False, comment='코스명'),
+    sa.Column('land_addresses', postgresql.ARRAY(sa.String(length=128)), nullable=False, comment='코스 장소들의 지번 주소 (중복 제외, 정렬)'),
+    sa.Column('road_addresses', postgresql.ARRAY(sa.String(length=128)), nullable=False, comment='코스 장소들의 도로명 주소 (중복 제외, 정렬)'),
+    sa.Column('address_text', sa.Text(), nullable=False, comment='주소 검색용 문자열 (모든 주소를 줄바꿈으로 연결)'),
+    sa.Column('course_difficulty_id', sa.Integer(), nullable=False, comment='코스 난이도'),
+    sa.Column('course_style_id', sa.Integer(), nullable=False, comment='코스 스타일'),
+    sa.Column('length_m', sa.Integer(), nullable=False, comment='전체 길이(m)'),
+    sa.Column('duration_minutes', sa.Integer(), nullable=False, comment='전체 소요시간(분, 구간 방향 반영)'),
+    sa.ForeignKeyConstraint(['course_id'], ['course.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('course_id'),
+    comment='코스 검색/리스트 조회용 비정규화 문서 (공개 코스만, trailine_model.hooks.refresh_course_search_documents로 갱신)'
+    )
+    op.create_index('ix_course_search_document_name_trgm', 'course_search_document', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_course_search_document_address_text_trgm', 'course_search_document', ['address_text'], unique=False, postgresql_using='gin', postgresql_ops={'address_text': 'gin_trgm_ops'})
+    op.create_index(op.f('ix_course_search_document_course_difficulty_id'), 'course_search_document', ['course_difficulty_id'], unique=False)
+    op.create_index(op.f('ix_course_search_document_course_style_id'), 'course_search_document', ['course_style_id'], unique=False)
+
+    # 기존 공개 코스의 검색 문서 채우기 (trailine_model.hooks.refresh_course_search_documents 와 같다)
+    op.execute("""
+        WITH course_interval AS (
+            SELECT cci.course_id, cci.is_reversed, ci.place_a_id, ci.place_b_id,
+                   ci.length_m, ci.duration_ab_minutes, ci.duration_ba_minutes
+            FROM course_course_interval cci
+            JOIN course_interval ci ON ci.id = cci.interval_id
+        ),
+        addresses AS (
+            SELECT ci.course_id,
+                   coalesce(array_agg(DISTINCT (p.land_address COLLATE "C") ORDER BY p.land_address COLLATE "C")
+                            FILTER (WHERE p.land_address IS NOT NULL), '{}'::varchar[]) AS land_addresses,
+                   coalesce(array_agg(DISTINCT (p.road_address COLLATE "C") ORDER BY p.road_address COLLATE "C")
+                            FILTER (WHERE p.road_address IS NOT NULL), '{}'::varchar[]) AS road_addresses
+            FROM course_interval ci
+            JOIN place p ON p.id = ci.place_a_id OR p.id = ci.place_b_id
+            GROUP BY ci.course_id
+        ),
+        totals AS (
+            SELECT ci.course_id,
+                   sum(ci.length_m) AS length_m,
+                   sum(CASE WHEN ci.is_reversed THEN ci.duration_ba_minutes ELSE ci.duration_ab_minutes END) AS duration_minutes
+            FROM course_interval ci
+            GROUP BY ci.course_id
+        )
+        INSERT INTO course_search_document (
+            course_id, name, land_addresses, road_addresses, address_text,
+            course_difficulty_id, course_style_id, length_m, duration_minutes
+        )
+        SELECT c.id, c.name, a.land_addresses, a.road_addresses,
+               array_to_string(array_cat(a.land_addresses, a.road_addresses), E'\\n'),
+               c.course_difficulty_id, c.course_style_id, t.length_m, t.duration_minutes
+        FROM course c
+        JOIN addresses a ON a.course_id = c.id
+        JOIN totals t ON t.course_id = c.id
+        WHERE c.is_published IS true
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_course_search_document_course_style_id'), table_name='course_search_document')
+    op.drop_index(op.f('ix_course_search_document_course_difficulty_id'), table_name='course_search_document')
+    op.drop_index('ix_course_search_document_address_text_trgm', table_name='course_search_document', postgresql_using='gin', postgresql_ops={'address_text': 'gin_trgm_ops'})
+    op.drop_index('ix_course_search_document_name_trgm', table_name='course_search_document', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.drop_table('course_search_document')
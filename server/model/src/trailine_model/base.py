@@ -3,6 +3,7 @@ import os
 
 from sqlalchemy.orm import declarative_base, sessionmaker, Mapped, mapped_column
 from sqlalchemy import create_engine, DateTime, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -25,6 +26,16 @@ engine = create_engine(
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# API 조회용 비동기 엔진 (psycopg3는 같은 URL로 async 드라이버를 사용한다)
+async_engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_overflow=int(os.getenv("DB_POOL_MAX_OVERFLOW", "20")),
+    pool_pre_ping=True,
+)
+# 세션을 닫은 뒤에도 조회한 객체의 속성을 사용할 수 있도록 commit 시 expire하지 않는다 (async는 lazy load 불가)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 TIME_ZONE_QUERY = "now() AT TIME ZONE 'Asia/Seoul'"
 
 
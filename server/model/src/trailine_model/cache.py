@@ -0,0 +1,54 @@
+"""
+API 서버의 코스 응답 캐시(코스 상세, 구간, 난이도/스타일 목록)를 무효화하는 함수 모음.
+
+API 서버는 코스 응답을 COURSE_CATALOG_VERSION_KEY 값(버전)이 들어간 키로 캐시한다.
+어드민, 업로드 스크립트 등 코스 데이터를 수정하는 쪽은 커밋이 끝난 뒤 bump_course_catalog_version()을 호출해
+버전을 올리고, 이전 버전 키의 캐시는 더 이상 읽히지 않다가 TTL이 지나면 사라진다.
+"""
+import logging
+import os
+
+import redis
+
+_logger = logging.getLogger(__name__)
+
+COURSE_CATALOG_VERSION_KEY = "course:catalog:version"
+# Redis에 닿지 않을 때 호출한 쪽(어드민 요청 등)이 오래 막히지 않도록 짧게 둔다
+REDIS_SOCKET_TIMEOUT_SECONDS = 1.0
+
+_client: redis.Redis | None = None
+
+
+def _get_client() -> redis.Redis | None:
+    global _client
+    if _client is None:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url is None:
+            return None
+        _client = redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+    return _client
+
+
+def bump_course_catalog_version() -> int | None:
+    """
+    코스 응답 캐시 버전을 올려 기존 캐시를 모두 무효화하는 함수
+
+    커밋 전에 호출하면 커밋 전 데이터가 새 버전으로 다시 캐시될 수 있으므로 반드시 커밋 후에 호출한다.
+    REDIS_URL이 없거나 Redis 오류가 나면 아무것도 하지 않는다. (데이터 수정 자체는 실패시키지 않는다)
+
+    :return: 올라간 버전, 무효화하지 못했으면 None
+    """
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        return int(client.incr(COURSE_CATALOG_VERSION_KEY))
+    except redis.RedisError:
+        _logger.exception("Failed to bump course catalog cache version")
+        return None
@@ -0,0 +1,275 @@
+"""
+코스 데이터가 바뀌었을 때 함께 갱신해야 하는 파생(비정규화) 데이터를 다루는 함수 모음.
+
+어드민, 업로드 스크립트 등 코스/구간을 수정하는 쪽에서 같은 세션(트랜잭션) 안에서 호출한다.
+"""
+from typing import Iterable, List, Optional
+
+from geoalchemy2.functions import (
+    ST_Force2D, ST_LineInterpolatePoint, ST_MakeLine, ST_Reverse, ST_SimplifyPreserveTopology
+)
+from sqlalchemy import SmallInteger, case, delete, func, insert, literal, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from trailine_model.models.course import (
+    COURSE_INTERVAL_LOD_TOLERANCES,
+    Course,
+    CourseCourseInterval,
+    CourseInterval,
+    CourseIntervalLod,
+    CourseSearchDocument,
+)
+from trailine_model.models.place import Place
+
+# CourseSearchDocument.address_text 에서 주소 사이 구분자 (검색어가 두 주소에 걸쳐 일치하지 않도록)
+ADDRESS_TEXT_SEPARATOR = "\n"
+
+
+def find_course_ids_by_interval_ids(session: Session, interval_ids: Iterable[int]) -> List[int]:
+    """
+    구간을 포함하고 있는 코스 아이디 목록을 가져오는 함수
+    """
+    interval_ids = list(interval_ids)
+    if not interval_ids:
+        return []
+
+    stmt = (
+        select(CourseCourseInterval.course_id)
+        .where(CourseCourseInterval.interval_id.in_(interval_ids))
+        .distinct()
+    )
+    return list(session.execute(stmt).scalars().all())
+
+
+def find_course_ids_by_place_ids(session: Session, place_ids: Iterable[int]) -> List[int]:
+    """
+    장소를 지나는 구간을 포함하고 있는 코스 아이디 목록을 가져오는 함수
+    """
+    place_ids = list(place_ids)
+    if not place_ids:
+        return []
+
+    stmt = (
+        select(CourseCourseInterval.course_id)
+        .join(CourseInterval, CourseInterval.id == CourseCourseInterval.interval_id)
+        .where(or_(CourseInterval.place_a_id.in_(place_ids), CourseInterval.place_b_id.in_(place_ids)))
+        .distinct()
+    )
+    return list(session.execute(stmt).scalars().all())
+
+
+def refresh_course_middle_points(session: Session, course_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    코스의 중간 지점(middle_point)을 다시 계산하는 함수
+
+    구간들을 position 순서대로 병합한 라인의 50% 지점을 저장하고,
+    이 지점에서 파생되는 기상청 격자(kma_grid_nx, kma_grid_ny)는 비워서 API가 다시 계산하도록 한다.
+
+    :param session: DB session
+    :param course_ids: 갱신할 코스 아이디 목록, None이면 전체 코스
+    :return: 갱신된 코스 수
+    """
+    oriented_geom = case(
+        (CourseCourseInterval.is_reversed.is_(True), ST_Reverse(CourseInterval.geom)),
+        else_=CourseInterval.geom
+    )
+
+    middle_point = (
+        select(
+            ST_Force2D(
+                ST_LineInterpolatePoint(
+                    ST_MakeLine(
+                        aggregate_order_by(oriented_geom, CourseCourseInterval.position.asc()),
+                        type_=CourseInterval.geom.type
+                    ),
+                    0.5,
+                )
+            )
+        )
+        .join(CourseCourseInterval, CourseCourseInterval.interval_id == CourseInterval.id)
+        .where(CourseCourseInterval.course_id == Course.id)
+        .scalar_subquery()
+    )
+
+    stmt = update(Course).values(middle_point=middle_point, kma_grid_nx=None, kma_grid_ny=None)
+    if course_ids is not None:
+        course_ids = list(course_ids)
+        if not course_ids:
+            return 0
+        stmt = stmt.where(Course.id.in_(course_ids))
+
+    result = session.execute(stmt.execution_options(synchronize_session=False))
+    return result.rowcount
+
+
+def refresh_interval_lods(session: Session, interval_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    구간의 LOD(단순화 경로)를 다시 계산하는 함수
+
+    COURSE_INTERVAL_LOD_TOLERANCES 의 레벨마다 Douglas-Peucker(ST_SimplifyPreserveTopology)로 단순화한 경로를 저장한다.
+
+    :param session: DB session
+    :param interval_ids: 갱신할 구간 아이디 목록, None이면 전체 구간
+    :return: 저장된 LOD 수
+    """
+    delete_stmt = delete(CourseIntervalLod)
+    if interval_ids is not None:
+        interval_ids = list(interval_ids)
+        if not interval_ids:
+            return 0
+        delete_stmt = delete_stmt.where(CourseIntervalLod.interval_id.in_(interval_ids))
+    session.execute(delete_stmt)
+
+    inserted = 0
+    for level, tolerance in COURSE_INTERVAL_LOD_TOLERANCES.items():
+        simplified = select(
+            CourseInterval.id,
+            literal(level, SmallInteger),
+            ST_SimplifyPreserveTopology(CourseInterval.geom, tolerance),
+        )
+        if interval_ids is not None:
+            simplified = simplified.where(CourseInterval.id.in_(interval_ids))
+
+        insert_stmt = insert(CourseIntervalLod).from_select(["interval_id", "level", "geom"], simplified)
+        inserted += session.execute(insert_stmt).rowcount
+    return inserted
+
+
+def _build_sorted_addresses(address_column):
+    """
+    코스 장소들의 주소를 중복 제외, 정렬(코드 포인트 순)한 배열로 모으는 집계식 (주소가 없으면 빈 배열)
+    """
+    address = address_column.collate("C")
+    return func.coalesce(
+        func.array_agg(aggregate_order_by(address.distinct(), address)).filter(address_column.is_not(None)),
+        literal_column("'{}'::varchar[]"),
+    )
+
+
+def refresh_course_search_documents(session: Session, course_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    코스 검색 문서(CourseSearchDocument)를 다시 만드는 함수
+
+    공개되어 있고 구간이 있는 코스만 문서를 만들며, 그 외 코스의 문서는 지운다.
+    주소는 코스 구간들의 양 끝 장소에서, 길이/소요시간은 구간 방향(is_reversed)을 반영해 합산한다.
+
+    :param session: DB session
+    :param course_ids: 갱신할 코스 아이디 목록, None이면 전체 코스
+    :return: 저장된 문서 수
+    """
+    delete_stmt = delete(CourseSearchDocument)
+    if course_ids is not None:
+        course_ids = list(course_ids)
+        if not course_ids:
+            return 0
+        delete_stmt = delete_stmt.where(CourseSearchDocument.course_id.in_(course_ids))
+    session.execute(delete_stmt)
+
+    # 코스 조건을 집계 서브쿼리 안에도 걸어야 갱신 대상 코스만 집계한다
+    course_intervals = (
+        select(
+            CourseCourseInterval.course_id,
+            CourseCourseInterval.is_reversed,
+            CourseInterval.place_a_id,
+            CourseInterval.place_b_id,
+            CourseInterval.length_m,
+            CourseInterval.duration_ab_minutes,
+            CourseInterval.duration_ba_minutes,
+        )
+        .join(CourseInterval, CourseInterval.id == CourseCourseInterval.interval_id)
+    )
+    if course_ids is not None:
+        course_intervals = course_intervals.where(CourseCourseInterval.course_id.in_(course_ids))
+    course_interval = course_intervals.subquery("course_interval")
+
+    addresses = (
+        select(
+            course_interval.c.course_id,
+            _build_sorted_addresses(Place.land_address).label("land_addresses"),
+            _build_sorted_addresses(Place.road_address).label("road_addresses"),
+        )
+        .join(Place, or_(Place.id == course_interval.c.place_a_id, Place.id == course_interval.c.place_b_id))
+        .group_by(course_interval.c.course_id)
+        .subquery("addresses")
+    )
+    totals = (
+        select(
+            course_interval.c.course_id,
+            func.sum(course_interval.c.length_m).label("length_m"),
+            func.sum(
+                case(
+                    (course_interval.c.is_reversed.is_(True), course_interval.c.duration_ba_minutes),
+                    else_=course_interval.c.duration_ab_minutes,
+                )
+            ).label("duration_minutes"),
+        )
+        .group_by(course_interval.c.course_id)
+        .subquery("totals")
+    )
+
+    documents = (
+        select(
+            Course.id,
+            Course.name,
+            addresses.c.land_addresses,
+            addresses.c.road_addresses,
+            func.array_to_string(
+                func.array_cat(addresses.c.land_addresses, addresses.c.road_addresses), ADDRESS_TEXT_SEPARATOR
+            ),
+            Course.course_difficulty_id,
+            Course.course_style_id,
+            totals.c.length_m,
+            totals.c.duration_minutes,
+        )
+        .join(addresses, addresses.c.course_id == Course.id)
+        .join(totals, totals.c.course_id == Course.id)
+        .where(Course.is_published.is_(True))
+    )
+    if course_ids is not None:
+        documents = documents.where(Course.id.in_(course_ids))
+
+    insert_stmt = insert(CourseSearchDocument).from_select(
+        [
+            "course_id",
+            "name",
+            "land_addresses",
+            "road_addresses",
+            "address_text",
+            "course_difficulty_id",
+            "course_style_id",
+            "length_m",
+            "duration_minutes",
+        ],
+        documents,
+    )
+    return session.execute(insert_stmt).rowcount
+
+
+def on_courses_changed(session: Session, course_ids: Iterable[int]) -> None:
+    """
+    코스 또는 코스 구성(구간 연결)이 바뀐 뒤 호출해 코스 파생 데이터를 갱신하는 함수
+    """
+    course_ids = list(course_ids)
+    if not course_ids:
+        return
+    refresh_course_middle_points(session, course_ids)
+    refresh_course_search_documents(session, course_ids)
+
+
+def on_intervals_changed(session: Session, interval_ids: Iterable[int]) -> None:
+    """
+    구간이 바뀐 뒤 호출해 구간 LOD와 해당 구간을 포함하는 코스들의 파생 데이터를 갱신하는 함수
+    """
+    interval_ids = list(interval_ids)
+    refresh_interval_lods(session, interval_ids)
+    on_courses_changed(session, find_course_ids_by_interval_ids(session, interval_ids))
+
+
+def on_places_changed(session: Session, place_ids: Iterable[int]) -> None:
+    """
+    장소(주소)가 바뀐 뒤 호출해 해당 장소를 지나는 코스들의 검색 문서를 갱신하는 함수
+    """
+    course_ids = find_course_ids_by_place_ids(session, place_ids)
+    if course_ids:
+        refresh_course_search_documents(session, course_ids)
@@ -1,8 +1,9 @@
 from typing import List
 
 from geoalchemy2 import Geometry, WKBElement
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.associationproxy import association_proxy
-from sqlalchemy import Integer, String, SmallInteger, Text, ForeignKey, CheckConstraint, Boolean, text, UniqueConstraint
+from sqlalchemy import Integer, String, SmallInteger, Text, ForeignKey, CheckConstraint, Boolean, text, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from trailine_model.base import Base, TimeStampModel
@@ -49,6 +50,9 @@ class CourseInterval(Base, TimeStampModel):
             "place_a_id < place_b_id",
             name="ck_course_interval_undirected_order",
         ),
+        # 주소로 코스를 검색할 때 장소 -> 구간 조회용
+        Index("ix_course_interval_place_a_id", "place_a_id"),
+        Index("ix_course_interval_place_b_id", "place_b_id"),
         {"comment": "코스 구간 (Place 사이를 잇는 간선)"},
     )
 
@@ -82,6 +86,27 @@ class CourseInterval(Base, TimeStampModel):
         return f"{self.name} ({round(self.length_m / 1000, 1)} km)"
 
 
+# 구간 LOD 레벨별 단순화 허용 오차 (도 단위, 위도 37도 기준 약 5m / 20m / 80m)
+# 0 레벨은 단순화하지 않은 원본(CourseInterval.geom)을 뜻하므로 저장하지 않는다
+COURSE_INTERVAL_LOD_TOLERANCES = {
+    1: 0.00005,
+    2: 0.0002,
+    3: 0.0008,
+}
+
+
+class CourseIntervalLod(Base):
+    __tablename__ = "course_interval_lod"
+    __table_args__ = {
+        "comment": "코스 구간 단순화 경로 (줌 레벨별 LOD, trailine_model.hooks.refresh_interval_lods로 갱신)",
+    }
+
+    interval_id: Mapped[int] = mapped_column(ForeignKey("course_interval.id", ondelete="CASCADE"), primary_key=True)
+    level: Mapped[int] = mapped_column(SmallInteger, primary_key=True, comment="LOD 레벨 (값이 클수록 단순함)")
+    geom: Mapped[WKBElement] = mapped_column(Geometry("LINESTRINGZ", srid=4326, spatial_index=False),
+                                             nullable=False, comment="단순화된 간선 (위도, 경도, 고도)")
+
+
 class CourseStyle(Base, TimeStampModel):
     __tablename__ = "course_style"
     __table_args__ = {
@@ -114,6 +139,12 @@ class Course(Base, TimeStampModel):
     kma_mid_land_status_area_id: Mapped[int] = mapped_column(ForeignKey("kma_mid_land_status_area.id", ondelete="SET NULL"), nullable=True)
     kma_mid_land_temp_area_id: Mapped[int] = mapped_column(ForeignKey("kma_mid_land_temp_area.id", ondelete="SET NULL"), nullable=True)
 
+    # 날씨 조회용 비정규화 컬럼 (구간이 바뀌면 trailine_model.hooks.refresh_course_middle_points로 갱신)
+    middle_point: Mapped[WKBElement] = mapped_column(Geometry("POINT", srid=4326, spatial_index=False), nullable=True,
+                                                     comment="코스 중간 지점 (구간 병합 라인의 50% 지점)")
+    kma_grid_nx: Mapped[int] = mapped_column(SmallInteger, nullable=True, comment="기상청 단기예보 격자 X (middle_point 기준)")
+    kma_grid_ny: Mapped[int] = mapped_column(SmallInteger, nullable=True, comment="기상청 단기예보 격자 Y (middle_point 기준)")
+
     course_difficulty: Mapped[CourseDifficulty] = relationship(foreign_keys=[course_difficulty_id])
     course_style: Mapped[CourseStyle] = relationship(foreign_keys=[course_style_id])
     _interval_associations: Mapped[List["CourseCourseInterval"]] = relationship(
@@ -137,6 +168,8 @@ class CourseCourseInterval(Base, TimeStampModel):
     __tablename__ = "course_course_interval"
     __table_args__ = (
         UniqueConstraint("course_id", "interval_id", "position", "is_reversed", name="course_course_interval_unique"),
+        # 구간 -> 코스 조회용 (유니크 제약 인덱스는 course_id가 앞에 있어 쓸 수 없다)
+        Index("ix_course_course_interval_interval_id", "interval_id"),
         {"comment": "코스 - 구간 사이의 중간 테이블"}
     )
 
@@ -190,3 +223,27 @@ class CourseIntervalImage(Base, TimeStampModel):
         ForeignKey("course_interval.id", onupdate="CASCADE", ondelete="SET NULL"), nullable=True)
 
     course_interval: Mapped[CourseInterval] = relationship("CourseInterval", back_populates="images")
+
+
+class CourseSearchDocument(Base):
+    __tablename__ = "course_search_document"
+    __table_args__ = (
+        # 코스명 / 주소 부분 일치(LIKE '%검색어%') 및 유사도 검색용 (pg_trgm)
+        Index("ix_course_search_document_name_trgm", "name", postgresql_using="gin",
+              postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_course_search_document_address_text_trgm", "address_text", postgresql_using="gin",
+              postgresql_ops={"address_text": "gin_trgm_ops"}),
+        {"comment": "코스 검색/리스트 조회용 비정규화 문서 (공개 코스만, trailine_model.hooks.refresh_course_search_documents로 갱신)"},
+    )
+
+    course_id: Mapped[int] = mapped_column(ForeignKey("course.id", ondelete="CASCADE"), primary_key=True)
+    name: Mapped[str] = mapped_column(String(32), nullable=False, comment="코스명")
+    land_addresses: Mapped[List[str]] = mapped_column(ARRAY(String(128)), nullable=False,
+                                                      comment="코스 장소들의 지번 주소 (중복 제외, 정렬)")
+    road_addresses: Mapped[List[str]] = mapped_column(ARRAY(String(128)), nullable=False,
+                                                      comment="코스 장소들의 도로명 주소 (중복 제외, 정렬)")
+    address_text: Mapped[str] = mapped_column(Text, nullable=False, comment="주소 검색용 문자열 (모든 주소를 줄바꿈으로 연결)")
+    course_difficulty_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True, comment="코스 난이도")
+    course_style_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True, comment="코스 스타일")
+    length_m: Mapped[int] = mapped_column(Integer, nullable=False, comment="전체 길이(m)")
+    duration_minutes: Mapped[int] = mapped_column(Integer, nullable=False, comment="전체 소요시간(분, 구간 방향 반영)")
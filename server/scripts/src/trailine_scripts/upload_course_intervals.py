@@ -8,6 +8,8 @@ from geoalchemy2 import WKTElement
 from geoalchemy2.functions import ST_DWithin, ST_Distance
 from sqlalchemy.orm import Session
 
+from trailine_model.cache import bump_course_catalog_version
+from trailine_model.hooks import on_intervals_changed
 from trailine_model.models.course import CourseInterval, CourseIntervalDifficulty
 from trailine_model.models.place import Place
 from trailine_scripts.common.database import get_db
@@ -533,6 +535,12 @@ def main():
         intervals = CourseIntervalUpserter(db).upsert(course, places)
         print(f"Upserted {len(intervals)} course interval(s).")
 
+        # 업로드한 구간을 이미 사용하는 코스가 있다면 파생 데이터(중간 지점 등)를 갱신
+        on_intervals_changed(db, [interval.id for interval in intervals])
+
+    # 커밋이 끝난 뒤 API 코스 응답 캐시 무효화
+    bump_course_catalog_version()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,53 @@
+import { describe, it, expect } from 'vitest';
+import { decodeTrack } from './track-decoder';
+
+
+describe('decodeTrack() - 압축된 구간 경로를 좌표 배열로 복원하는 함수', () => {
+    it('polyline 형식 (Google 예시 좌표 + 해발고도)', () => {
+        const points = decodeTrack({
+            format: 'polyline',
+            precision: 5,
+            elePrecision: 1,
+            count: 3,
+            polyline: '_p~iF~ps|U?_ulLnnqC?_mqNvxq`@?',
+        });
+
+        expect(points).toEqual([
+            { lat: 38.5, lon: -120.2, ele: 0 },
+            { lat: 40.7, lon: -120.95, ele: 0 },
+            { lat: 43.252, lon: -126.453, ele: 0 },
+        ]);
+    });
+
+    it('polyline 형식 (음수 해발고도 delta)', () => {
+        const points = decodeTrack({
+            format: 'polyline',
+            precision: 5,
+            elePrecision: 1,
+            count: 2,
+            polyline: '??gE??fE',
+        });
+
+        expect(points).toEqual([
+            { lat: 0, lon: 0, ele: 10 },
+            { lat: 0, lon: 0, ele: 0 },
+        ]);
+    });
+
+    it('delta 형식', () => {
+        const points = decodeTrack({
+            format: 'delta',
+            precision: 5,
+            elePrecision: 1,
+            count: 2,
+            lat: [3744714, -1],
+            lon: [12694968, -1],
+            ele: [2340, -5],
+        });
+
+        expect(points).toEqual([
+            { lat: 37.44714, lon: 126.94968, ele: 234 },
+            { lat: 37.44713, lon: 126.94967, ele: 233.5 },
+        ]);
+    });
+});
@@ -0,0 +1,63 @@
+import type { IntervalPoint } from "@/types/common/location";
+import type { EncodedTrack } from "@/types/responses/course-interval";
+
+/**
+ * 구간 경로 조회 API에서 trackFormat=polyline 또는 delta로 받은 압축 경로를 좌표 배열로 복원하는 함수 입니다.
+ *
+ * 디코딩 규약 (서버: trailine_api/common/track.py)
+ *  - 위경도는 10^precision, 해발고도는 10^elePrecision 배율의 정수로 양자화되어 있습니다.
+ *  - 첫 좌표는 0 기준, 이후 좌표는 바로 앞 좌표와의 차이(delta)입니다. 누적합 후 배율로 나누면 원래 값이 됩니다.
+ *  - polyline: 좌표마다 (위도, 경도, 해발고도) delta 순서로 Google Encoded Polyline 방식으로 인코딩된 문자열입니다.
+ *
+ * @param track 압축된 경로
+ * @returns 좌표 배열
+ */
+export function decodeTrack(track: EncodedTrack): IntervalPoint[] {
+    const deltas = track.format === "polyline"
+        ? splitPolyline(track.polyline ?? "", track.count)
+        : { lat: track.lat ?? [], lon: track.lon ?? [], ele: track.ele ?? [] };
+
+    const scale = 10 ** track.precision;
+    const eleScale = 10 ** track.elePrecision;
+    const points: IntervalPoint[] = [];
+
+    let lat = 0;
+    let lon = 0;
+    let ele = 0;
+    for (let i = 0; i < track.count; i++) {
+        lat += deltas.lat[i];
+        lon += deltas.lon[i];
+        ele += deltas.ele[i];
+        points.push({ lat: lat / scale, lon: lon / scale, ele: ele / eleScale });
+    }
+
+    return points;
+}
+
+/**
+ * Encoded Polyline 문자열을 위도/경도/해발고도 delta 배열로 나누는 함수 입니다.
+ */
+function splitPolyline(polyline: string, count: number): { lat: number[], lon: number[], ele: number[] } {
+    const lat: number[] = new Array(count);
+    const lon: number[] = new Array(count);
+    const ele: number[] = new Array(count);
+    const targets = [lat, lon, ele];
+
+    let index = 0;
+    for (let i = 0; i < count * 3; i++) {
+        let result = 0;
+        let shift = 0;
+        let byte: number;
+        do {
+            byte = polyline.charCodeAt(index++) - 63;
+            // 32비트 비트 연산은 큰 값에서 넘칠 수 있으므로 곱셈으로 누적합니다
+            result += (byte & 0x1f) * 2 ** shift;
+            shift += 5;
+        } while (byte >= 0x20);
+
+        // zigzag 복원: 최하위 비트가 1이면 음수
+        targets[i % 3][Math.floor(i / 3)] = result % 2 === 1 ? -(result + 1) / 2 : result / 2;
+    }
+
+    return { lat, lon, ele };
+}
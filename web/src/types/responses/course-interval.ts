@@ -23,6 +23,20 @@ interface Place {
     ele: number | null;
 };
 
+/**
+ * trackFormat=polyline 또는 delta로 요청했을 때의 압축된 경로 (복원: lib/track-decoder.ts의 decodeTrack)
+ */
+export interface EncodedTrack {
+    format: "polyline" | "delta";
+    precision: number;
+    elePrecision: number;
+    count: number;
+    polyline?: string | null;
+    lat?: number[] | null;
+    lon?: number[] | null;
+    ele?: number[] | null;
+};
+
 export interface Interval {
     name: string;
     description: string | null;
@@ -30,7 +44,8 @@ export interface Interval {
     difficulty: Difficulty;
     startPlace: Place;
     endPlace: Place;
-    points: IntervalPoint[];
+    points: IntervalPoint[];    // trackFormat=points(기본)일 때만 채워짐
+    track?: EncodedTrack | null;  // trackFormat=polyline, delta일 때만 채워짐
     length: number;
     duration: number;
 };